@@ -0,0 +1,801 @@
+#!/usr/bin/env python3
+"""
+Evidence Adapter SDK
+Shared streaming core for evidence contract adapters.
+
+A source adapter only declares how to read its lines:
+
+    class MyAdapter(LogAdapter):
+        source = 'mysource'
+        usage = 'my-adapter.py <log-file>'
+        EVENT_TYPE_PATTERNS = [(r'out of memory', 'resource_allocation_failure'), ...]
+        SEVERITY_MAP = {'INFO': 'INFO', 'WARN': 'WARN', 'ERROR': 'ERROR', 'DEBUG': None}
+
+        def tokenize(self, line):
+            # -> (timestamp_raw, severity_raw, component_raw, message) or None
+        def parse_timestamp(self, raw):
+            # -> "YYYY-MM-DDTHH:MM:SSZ" or None
+
+    if __name__ == '__main__':
+        run(MyAdapter())
+
+The core does the rest in one pass over the file, holding only per-signal
+state (never the full event list):
+  - Line streaming (the log is never read into memory whole)
+  - Severity normalization (None in SEVERITY_MAP = forbidden, skipped)
+  - Timestamp normalization (an unparseable timestamp fails the run)
+  - Classification against the precompiled table (first match wins)
+  - Multi-line folding (FOLD_CONTINUATIONS): lines that are not event
+    headers (stack traces, banners) belong to the preceding event; traces
+    are reduced to a fingerprint and aggregated with one exemplar each
+  - Aggregation by (event, severity, component) with count/first/last seen,
+    into interned SignalGroup records (no per-event dicts, keys or copies)
+  - Multi-resolution rollups (adapters/rollups.py)
+  - Heavy-hitter templates of unclassified messages (adapters/sketches.py)
+  - Quality scoring and contract output
+
+Incremental runs: IncrementalRun keeps one AdapterResult per log file and
+feeds it only the lines appended since the last update (sherlock
+investigate --watch), so a growing log is never re-parsed from the start.
+
+Sampled triage: SampledRun (adapter CLI --sample [RATE]) parses a
+stratified sample of byte ranges and reports estimated counts with 95%
+intervals, flagged in the contract quality block (quality.sampling).
+
+Benchmarks: bench-adapters.py runs every registered adapter over
+generated input (each adapter's sample_line()) and reports throughput.
+"""
+
+import copy
+import importlib.util
+import json
+import os
+import random
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+ADAPTERS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(ADAPTERS_DIR))
+from rollups import RollupAccumulator, signal_key  # noqa: E402
+from sketches import UnclassifiedSketch  # noqa: E402
+
+# Registered adapters (source type -> script), used by sherlock and bench-adapters.py
+ADAPTERS = {
+    'hadoop': 'adapters/hadoop-adapter.py',
+    'jsonl': 'adapters/jsonl-adapter.py',
+}
+
+CONTRACT_SEVERITIES = ('INFO', 'WARN', 'ERROR')
+
+# Folding bounds: lines kept per event, exemplar size, distinct fingerprints
+MAX_FOLDED_LINES = 200
+EXEMPLAR_LINES = 12
+MAX_TRACES = 1000
+
+# Sampled triage (SampledRun): default byte fraction, strata, chunks drawn per
+# stratum, smallest chunk, files read whole instead, confidence penalty
+SAMPLE_RATE = 0.02
+SAMPLE_STRATA = 64
+SAMPLE_CHUNKS = 4
+MIN_CHUNK_BYTES = 16 * 1024
+SAMPLE_EXACT_BELOW = 4 * 1024 * 1024
+SAMPLE_PENALTY = 10
+Z_95 = 1.96
+
+# Unclassified templates named in the quality notes (full list: quality.unclassified)
+NOTE_TEMPLATES = 3
+NOTE_TEMPLATE_CHARS = 60
+
+class ContractViolation(Exception):
+    """Raised when input cannot be normalized into the evidence contract."""
+
+# ============================================================================
+# ADAPTER DECLARATION
+# ============================================================================
+
+class LogAdapter:
+    """Base class: subclasses declare tables and a tokenizer."""
+
+    source = None
+    usage = 'adapter.py <log-file>'
+
+    # [(regex, generic_event_type)], matched case-insensitively, first match wins
+    EVENT_TYPE_PATTERNS = []
+
+    # Raw severity -> contract severity; None marks a forbidden level
+    SEVERITY_MAP = {}
+
+    # [(substring, component)], matched against the lowercased raw component
+    COMPONENT_RULES = []
+    DEFAULT_COMPONENT = 'unknown_service'
+
+    # Fold lines that tokenize() rejects into the preceding event
+    FOLD_CONTINUATIONS = False
+
+    def __init__(self):
+        self.patterns = [(re.compile(pattern, re.IGNORECASE), event_type)
+                         for pattern, event_type in self.EVENT_TYPE_PATTERNS]
+        self.components = {}
+
+    def tokenize(self, line):
+        """Split one stripped line -> (timestamp_raw, severity_raw, component_raw, message) or None."""
+        raise NotImplementedError
+
+    def parse_timestamp(self, raw):
+        """Raw timestamp -> ISO-8601 UTC ("YYYY-MM-DDTHH:MM:SSZ") or None."""
+        raise NotImplementedError
+
+    def normalize_severity(self, raw):
+        """Contract severity, None if forbidden; KeyError-free for unknown levels."""
+        return self.SEVERITY_MAP.get(raw)
+
+    def classify(self, message):
+        for pattern, event_type in self.patterns:
+            if pattern.search(message):
+                return event_type
+        return None
+
+    def extract_component(self, raw):
+        component = self.components.get(raw)
+        if component is None:
+            lowered = (raw or '').lower()
+            component = next((name for needle, name in self.COMPONENT_RULES if needle in lowered),
+                             self.DEFAULT_COMPONENT)
+            self.components[raw] = component
+        return component
+
+    def fingerprint_trace(self, message, folded):
+        """Folded lines of one event -> (fingerprint, summary) for a stack trace, or None."""
+        return None
+
+    def sample_line(self, index, rng):
+        """One synthetic input line for benchmarks."""
+        raise NotImplementedError
+
+# ============================================================================
+# STREAMING CORE
+# ============================================================================
+
+class TraceTable:
+    """Stack traces aggregated by fingerprint, first occurrence kept as exemplar."""
+
+    def __init__(self, limit=MAX_TRACES):
+        self.entries = {}
+        self.limit = limit
+        self.overflow = 0  # Occurrences of fingerprints beyond the limit
+
+    def add(self, fingerprint, summary, signal, timestamp, message, folded):
+        entry = self.entries.get(fingerprint)
+        if entry is None:
+            if len(self.entries) >= self.limit:
+                self.overflow += 1
+                return
+            event_type, severity, component = signal
+            self.entries[fingerprint] = {
+                'fingerprint': fingerprint,
+                'summary': summary,
+                'event': event_type,
+                'severity': severity,
+                'component': component,
+                'count': 1,
+                'first_seen': timestamp,
+                'last_seen': timestamp,
+                # Only the first occurrence of a fingerprint pays for the copy
+                'exemplar': [message] + folded[:EXEMPLAR_LINES - 1],
+            }
+            return
+        entry['count'] += 1
+        if timestamp < entry['first_seen']:
+            entry['first_seen'] = timestamp
+        if timestamp > entry['last_seen']:
+            entry['last_seen'] = timestamp
+
+    def result(self):
+        """Traces, most frequent first."""
+        return sorted(self.entries.values(), key=lambda t: (-t['count'], t['first_seen']))
+
+class SignalGroup:
+    """Running aggregate of one (event, severity, component) signal."""
+
+    __slots__ = ('key', 'count', 'first_seen', 'last_seen', 'seconds')
+
+    def __init__(self, key, seconds):
+        self.key = key
+        self.count = 0
+        self.first_seen = None
+        self.last_seen = None
+        self.seconds = seconds  # Rollup series (epoch second -> count), shared with result.rollups
+
+class PendingEvent:
+    """
+    The event a folding adapter is still collecting continuation lines for.
+
+    One instance per result is reused for every event; `folded` stays None
+    unless the event actually has continuation lines.
+    """
+
+    __slots__ = ('open', 'timestamp', 'severity', 'component_raw', 'message', 'folded')
+
+    def __init__(self):
+        self.open = False
+        self.folded = None
+
+    def start(self, timestamp, severity, component_raw, message):
+        self.open = True
+        self.timestamp = timestamp
+        self.severity = severity  # None: forbidden level, continuation lines are only swallowed
+        self.component_raw = component_raw
+        self.message = message
+        self.folded = None
+
+class AdapterResult:
+    """Aggregated state of one adapter pass."""
+
+    def __init__(self):
+        self.groups = {}  # (event, severity, component) -> SignalGroup
+        # (event, severity, raw component) -> SignalGroup: the hot path never
+        # re-normalizes a component or rebuilds a rollup key for a known signal
+        self.interned = {}
+        self.rollups = RollupAccumulator()
+        self.traces = TraceTable()
+        self.unclassified = UnclassifiedSketch()
+        self.events = 0
+        self.lines = 0
+        self.folded = 0
+        self.pending = PendingEvent()
+        self.skipped = {'unparsed': 0, 'forbidden_severity': {}, 'unclassified': 0}
+
+    def group(self, adapter, event_type, severity, component_raw):
+        """Interned SignalGroup for a classified event."""
+        raw_key = (event_type, severity, component_raw)
+        group = self.interned.get(raw_key)
+        if group is None:
+            key = (event_type, severity, adapter.extract_component(component_raw))
+            group = self.groups.get(key)
+            if group is None:
+                group = self.groups[key] = SignalGroup(key, self.rollups.series(signal_key(*key)))
+            self.interned[raw_key] = group
+        return group
+
+    def add(self, group, timestamp):
+        group.count += 1
+        if group.first_seen is None or timestamp < group.first_seen:
+            group.first_seen = timestamp
+        if group.last_seen is None or timestamp > group.last_seen:
+            group.last_seen = timestamp
+        group.seconds[self.rollups.epoch(timestamp)] += 1
+        self.events += 1
+
+    def snapshot(self, adapter):
+        """
+        The result as if the pending event were complete, for a watch-mode
+        bundle, while the event itself stays open here for continuation lines.
+
+        Only what emitting that one event can touch is copied: its signal's
+        group and rollup series, the trace entries, or the unclassified sketch.
+        """
+        pending = self.pending
+        if not pending.open or pending.severity is None:
+            return self
+
+        snap = copy.copy(self)
+        snap.pending = copy.copy(pending)
+        snap.interned = {}  # snap.group() resolves through the copied groups
+        snap.groups = dict(self.groups)
+        snap.skipped = dict(self.skipped)
+
+        event_type = adapter.classify(pending.message)
+        if not event_type and pending.folded:
+            event_type = adapter.classify('\n'.join(pending.folded))
+        if event_type:
+            key = (event_type, pending.severity, adapter.extract_component(pending.component_raw))
+            snap.rollups = copy.copy(self.rollups)
+            snap.rollups.per_signal = dict(self.rollups.per_signal)
+            group = self.groups.get(key)
+            if group is not None:
+                copied = snap.groups[key] = copy.copy(group)
+                copied.seconds = snap.rollups.per_signal[signal_key(*key)] = Counter(group.seconds)
+            snap.traces = copy.copy(self.traces)
+            snap.traces.entries = {fp: dict(entry) for fp, entry in self.traces.entries.items()}
+        else:
+            snap.unclassified = copy.deepcopy(self.unclassified)
+
+        _emit(adapter, snap, snap.pending)
+        return snap
+
+    def signals(self):
+        aggregated = []
+        for (event_type, severity, component), group in self.groups.items():
+            signal = {
+                'event': event_type,
+                'severity': severity,
+                'component': component,
+                'count': group.count,
+                'first_seen': group.first_seen,
+            }
+            if group.count > 1:
+                signal['last_seen'] = group.last_seen
+            aggregated.append(signal)
+        return aggregated
+
+def _emit(adapter, result, pending):
+    """Classify and aggregate the pending folded event (and close it)."""
+    pending.open = False
+    if pending.severity is None:  # Forbidden level: its continuation lines were only swallowed
+        return
+    message, folded = pending.message, pending.folded
+    event_type = adapter.classify(message)
+    if not event_type and folded:
+        event_type = adapter.classify('\n'.join(folded))
+    if not event_type:
+        result.skipped['unclassified'] += 1
+        result.unclassified.add(message)
+        return
+
+    group = result.group(adapter, event_type, pending.severity, pending.component_raw)
+    result.add(group, pending.timestamp)
+    if folded:
+        trace = adapter.fingerprint_trace(message, folded)
+        if trace:
+            fingerprint, summary = trace
+            result.traces.add(fingerprint, summary, group.key, pending.timestamp, message, folded)
+
+def process_lines(adapter, lines, result=None, final=True):
+    """
+    Run an adapter over an iterable of raw lines.
+
+    Lines are added to `result` when given (continuing an earlier pass).
+    With FOLD_CONTINUATIONS an event is only complete once the next header
+    (or the end of input) is seen; final=False keeps the last event open in
+    result.pending so the next call can still fold lines into it.
+
+    Per event, nothing is allocated beyond what the tokenizer returns: known
+    signals are looked up in result.interned, the pending event is one
+    reused PendingEvent, and trace exemplars are only copied for a new
+    fingerprint.
+
+    Returns: AdapterResult
+    Raises: ContractViolation on an unparseable timestamp
+    """
+    result = AdapterResult() if result is None else result
+    tokenize = adapter.tokenize
+    normalize_severity = adapter.normalize_severity
+    parse_timestamp = adapter.parse_timestamp
+    classify = adapter.classify
+    interned = result.interned
+    add = result.add
+    forbidden = result.skipped['forbidden_severity']
+    fold = adapter.FOLD_CONTINUATIONS
+    pending = result.pending
+    line_count = 0
+
+    for line in lines:
+        line_count += 1
+        line = line.strip()
+        if not line:
+            continue
+
+        tokens = tokenize(line)
+        if tokens is None:
+            if pending.open:
+                result.folded += 1
+                if pending.folded is None:
+                    pending.folded = [line]
+                elif len(pending.folded) < MAX_FOLDED_LINES:
+                    pending.folded.append(line)
+                continue
+            result.skipped['unparsed'] += 1
+            continue
+        timestamp_raw, severity_raw, component_raw, message = tokens
+
+        if pending.open:
+            _emit(adapter, result, pending)
+
+        severity = normalize_severity(severity_raw)
+        if severity is None:
+            forbidden[severity_raw] = forbidden.get(severity_raw, 0) + 1
+            if fold:
+                pending.start(None, None, None, None)
+            continue
+
+        timestamp = parse_timestamp(timestamp_raw)
+        if not timestamp:
+            result.lines += line_count
+            raise ContractViolation(f"Invalid timestamp {timestamp_raw}")
+
+        if fold:
+            pending.start(timestamp, severity, component_raw, message)
+            continue
+
+        event_type = classify(message)
+        if not event_type:
+            result.skipped['unclassified'] += 1
+            result.unclassified.add(message)
+            continue
+
+        group = interned.get((event_type, severity, component_raw))
+        if group is None:
+            group = result.group(adapter, event_type, severity, component_raw)
+        add(group, timestamp)
+
+    result.lines += line_count
+    if final and pending.open:
+        _emit(adapter, result, pending)
+    return result
+
+def generate_contract_output(source, aggregated_signals, rollups=None, traces=None, sampling=None,
+                             unclassified=None):
+    """
+    Generate final evidence contract output
+
+    unclassified (UnclassifiedSketch.result()) names the heaviest templates
+    among dropped messages in the notes and as quality.unclassified.
+
+    sampling (SampledRun) marks the counts as estimates: it is recorded as
+    quality.sampling and costs SAMPLE_PENALTY.
+    """
+    # Check for quality issues
+    has_errors = any(s['severity'] == 'ERROR' for s in aggregated_signals)
+    has_warnings = any(s['severity'] == 'WARN' for s in aggregated_signals)
+    has_startup = any(s['event'] == 'startup' for s in aggregated_signals)
+    has_shutdown = any(s['event'] == 'shutdown' for s in aggregated_signals)
+    has_crash = any(s['event'] == 'process_crash' for s in aggregated_signals)
+
+    # Determine completeness
+    completeness = 'COMPLETE'
+    notes = []
+    confidence_penalty = 0
+
+    if not (has_startup or has_shutdown):
+        completeness = 'PARTIAL'
+        notes.append('No lifecycle events detected')
+        confidence_penalty += 10
+
+    if has_crash and not has_shutdown:
+        notes.append('Crash detected without clean shutdown')
+        confidence_penalty += 5
+
+    if not (has_errors or has_warnings):
+        completeness = 'LOW_SIGNAL'
+        notes.append('No ERROR or WARN events detected')
+        confidence_penalty += 20
+
+    if unclassified and unclassified['events']:
+        top = ", ".join(f'"{t["template"][:NOTE_TEMPLATE_CHARS]}" ~{t["count"]}'
+                        for t in unclassified['top_templates'][:NOTE_TEMPLATES])
+        notes.append(f"{unclassified['events']} unclassified event(s)"
+                     f"{' in the sample' if sampling else ''}; top templates: {top}")
+
+    if sampling:
+        notes.append(f"Counts estimated from a {sampling['rate'] * 100:.1f}% byte sample "
+                     f"({sampling['chunks']} ranges); re-run without --sample for exact counts")
+        confidence_penalty += SAMPLE_PENALTY
+
+    # Build contract output
+    output = {
+        'source': source,
+        'quality': {
+            'completeness': completeness,
+            'confidence_penalty': confidence_penalty,
+            'notes': notes if notes else ['Evidence appears complete']
+        },
+        'signals': sorted(aggregated_signals, key=lambda s: s['first_seen'])
+    }
+
+    if unclassified and unclassified['events']:
+        output['quality']['unclassified'] = unclassified
+
+    if sampling:
+        output['quality']['sampling'] = sampling
+
+    if rollups is not None:
+        output['rollups'] = rollups
+
+    if traces:
+        output['traces'] = traces
+
+    return output
+
+def read_lines(log_file):
+    """Stream a log file line by line (undecodable bytes are replaced)."""
+    with open(log_file, 'r', errors='replace') as f:
+        yield from f
+
+def load_adapter(name):
+    """Instantiate the LogAdapter subclass defined by a registered adapter script."""
+    script = ADAPTERS_DIR / Path(ADAPTERS[name]).name
+    spec = importlib.util.spec_from_file_location(f"adapter_{name}", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    for value in vars(module).values():
+        if isinstance(value, type) and issubclass(value, LogAdapter) and value is not LogAdapter:
+            return value()
+    raise SystemExit(f"❌ {script} does not define a LogAdapter subclass")
+
+class IncrementalRun:
+    """
+    Adapter state over a log file that grows between updates.
+
+    update() processes only the bytes after the last consumed offset. An
+    unterminated last line is left for the next update unless flush=True
+    (a writer may be mid-line). The last event of a folding adapter also
+    stays open, since continuation lines may still follow, but
+    contract_output() includes it from a snapshot. A truncated, rotated or
+    replaced file is re-read from the start, as is any file after a failed
+    update.
+    """
+
+    def __init__(self, adapter, log_file):
+        self.adapter = adapter
+        self.log_file = log_file
+        self.result = None
+        self.offset = 0
+        self.inode = None
+
+    def _appended_lines(self, flush):
+        with open(self.log_file, 'rb') as f:
+            f.seek(self.offset)
+            for raw in f:
+                if not flush and not raw.endswith(b'\n'):
+                    break
+                self.offset += len(raw)
+                yield raw.decode('utf-8', errors='replace')
+
+    def update(self, flush=False):
+        """
+        Bring the result up to date with the file.
+
+        Returns: {"mode": "full" | "append", "lines": n}
+        Raises: FileNotFoundError, ContractViolation
+        """
+        stat = os.stat(self.log_file)
+        mode = 'append'
+        if self.result is None or stat.st_ino != self.inode or stat.st_size < self.offset:
+            mode = 'full'
+            self.result = AdapterResult()
+            self.offset = 0
+            self.inode = stat.st_ino
+
+        lines_before = self.result.lines
+        try:
+            process_lines(self.adapter, self._appended_lines(flush), self.result, final=flush)
+        except BaseException:
+            self.result = None
+            raise
+        return {'mode': mode, 'lines': self.result.lines - lines_before}
+
+    def contract_output(self):
+        """Evidence contract object for everything processed so far (the open event included)."""
+        result = self.result.snapshot(self.adapter)
+        return generate_contract_output(self.adapter.source, result.signals(),
+                                        result.rollups.result(), result.traces.result(),
+                                        unclassified=result.unclassified.result())
+
+# ============================================================================
+# SAMPLED TRIAGE
+# ============================================================================
+
+class SampledRun:
+    """
+    Estimated signal counts from a stratified sample of byte ranges.
+
+    The file is cut into equal strata; in each, a few fixed-size chunks are
+    drawn without replacement and parsed (a line belongs to the chunk its
+    first byte falls in). Per signal, the stratum total is estimated from
+    its chunk mean and the spread between chunks gives a 95% interval, so
+    the cost is about `rate` of a full pass. Files under SAMPLE_EXACT_BELOW
+    are read whole instead, with exact counts and no sampling block.
+
+    Timestamps, skipped-line stats and traces cover the sample only; signals
+    absent from the sample are not reported. Rollups are left out (they
+    would be sample counts).
+    """
+
+    def __init__(self, adapter, log_file, rate=SAMPLE_RATE, seed=0):
+        self.adapter = adapter
+        self.log_file = log_file
+        self.rate = rate
+        self.seed = seed
+        self.result = None
+        self.sampling = None  # Sampling metadata, None after an exact read
+        self.estimates = {}   # (event, severity, component) -> (estimate, low, high)
+
+    def update(self, flush=True):
+        """
+        Sample the file (same interface as IncrementalRun.update).
+
+        Returns: {"mode": "sample" | "full", "lines": n}
+        Raises: FileNotFoundError, ContractViolation
+        """
+        size = os.stat(self.log_file).st_size
+        self.result = AdapterResult()
+        self.sampling = None
+        self.estimates = {}
+        if size <= SAMPLE_EXACT_BELOW or self.rate >= 0.5:
+            process_lines(self.adapter, read_lines(self.log_file), self.result)
+            return {'mode': 'full', 'lines': self.result.lines}
+
+        strata = SAMPLE_STRATA
+        chunk = int(size * self.rate / (strata * SAMPLE_CHUNKS))
+        if chunk < MIN_CHUNK_BYTES:
+            chunk = MIN_CHUNK_BYTES
+            strata = max(1, int(size * self.rate / (chunk * SAMPLE_CHUNKS)))
+
+        rng = random.Random(self.seed)
+        counts = {}  # key -> per-chunk counts, chunk index = stratum * SAMPLE_CHUNKS + i
+        plan = []
+        bytes_read = 0
+        with open(self.log_file, 'rb') as f:
+            for h in range(strata):
+                start, end = size * h // strata, size * (h + 1) // strata
+                slots = (end - start) // chunk
+                plan.append((end - start, slots))
+                for i, slot in enumerate(sorted(rng.sample(range(slots), SAMPLE_CHUNKS))):
+                    offset = start + slot * chunk
+                    before = {key: group.count for key, group in self.result.groups.items()}
+                    process_lines(self.adapter, self._chunk_lines(f, offset, offset + chunk), self.result)
+                    bytes_read += f.tell() - max(offset - 1, 0)
+                    index = h * SAMPLE_CHUNKS + i
+                    for key, group in self.result.groups.items():
+                        seen = group.count - before.get(key, 0)
+                        if seen:
+                            counts.setdefault(key, [0] * (strata * SAMPLE_CHUNKS))[index] = seen
+
+        for key, per_chunk in counts.items():
+            estimate = variance = 0.0
+            for h, (stratum_bytes, slots) in enumerate(plan):
+                ys = per_chunk[h * SAMPLE_CHUNKS:(h + 1) * SAMPLE_CHUNKS]
+                mean = sum(ys) / SAMPLE_CHUNKS
+                spread = sum((y - mean) ** 2 for y in ys) / (SAMPLE_CHUNKS - 1)
+                weight = stratum_bytes / chunk
+                estimate += weight * mean
+                variance += weight ** 2 * (1 - SAMPLE_CHUNKS / slots) * spread / SAMPLE_CHUNKS
+            sampled = sum(per_chunk)
+            margin = Z_95 * variance ** 0.5
+            self.estimates[key] = (max(sampled, round(estimate)), max(sampled, int(estimate - margin)),
+                                   int(estimate + margin + 0.5))
+
+        self.sampling = {
+            'method': 'stratified_byte_ranges',
+            'rate': round(bytes_read / size, 4),
+            'strata': strata,
+            'chunks': strata * SAMPLE_CHUNKS,
+            'bytes_read': bytes_read,
+            'bytes_total': size,
+            'confidence': 0.95,
+            'seed': self.seed,
+        }
+        return {'mode': 'sample', 'lines': self.result.lines}
+
+    @staticmethod
+    def _chunk_lines(f, start, end):
+        # The line cut by `start` is finished by the chunk before it
+        f.seek(max(start - 1, 0))
+        if start > 0:
+            f.readline()
+        while f.tell() < end:
+            raw = f.readline()
+            if not raw:
+                break
+            yield raw.decode('utf-8', errors='replace')
+
+    def contract_output(self):
+        """Evidence contract object: estimated counts with intervals, flagged in quality."""
+        if self.sampling is None:
+            return generate_contract_output(self.adapter.source, self.result.signals(),
+                                            self.result.rollups.result(), self.result.traces.result(),
+                                            unclassified=self.result.unclassified.result())
+        signals = []
+        for signal in self.result.signals():
+            key = (signal['event'], signal['severity'], signal['component'])
+            estimate, low, high = self.estimates[key]
+            signal['estimate'] = {'sampled': signal['count'], 'ci95': [low, high]}
+            signal['count'] = estimate
+            signals.append(signal)
+        return generate_contract_output(self.adapter.source, signals, traces=self.result.traces.result(),
+                                        sampling=self.sampling, unclassified=self.result.unclassified.result())
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def run(adapter, argv=None):
+    """
+    Standard adapter CLI: contract JSON on stdout, stats on stderr.
+
+    --sample [RATE] reads about RATE of the file (default SAMPLE_RATE) and
+    reports estimated counts (SampledRun); --seed picks the sampled ranges.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    usage = f"Usage: {adapter.usage} [--sample [RATE]] [--seed N]"
+    if len(argv) < 1 or argv[0].startswith('--'):
+        print(usage, file=sys.stderr)
+        sys.exit(1)
+
+    log_file = argv[0]
+    rate = None
+    seed = 0
+    i = 1
+    try:
+        while i < len(argv):
+            if argv[i] == '--sample':
+                rate = SAMPLE_RATE
+                if i + 1 < len(argv) and not argv[i + 1].startswith('--'):
+                    rate = float(argv[i + 1])
+                    i += 1
+                if not 0 < rate <= 1:
+                    raise ValueError(rate)
+            elif argv[i] == '--seed' and i + 1 < len(argv):
+                seed = int(argv[i + 1])
+                i += 1
+            else:
+                raise ValueError(argv[i])
+            i += 1
+    except ValueError:
+        print(usage, file=sys.stderr)
+        sys.exit(1)
+
+    sampler = SampledRun(adapter, log_file, rate, seed) if rate else None
+    try:
+        if sampler:
+            sampler.update()
+            result = sampler.result
+        else:
+            result = process_lines(adapter, read_lines(log_file))
+    except FileNotFoundError:
+        print(f"❌ Adapter: Log file not found: {log_file}", file=sys.stderr)
+        sys.exit(1)
+    except ContractViolation as e:
+        print(f"❌ Adapter: {e}", file=sys.stderr)
+        print(f"❌ Adapter: Failed to parse {adapter.source} logs (contract violation)", file=sys.stderr)
+        sys.exit(1)
+
+    for level, count in result.skipped['forbidden_severity'].items():
+        print(f"⚠️  Adapter: Skipped {count} line(s) with forbidden severity {level}", file=sys.stderr)
+
+    if not result.events:
+        print("❌ Adapter: No classifiable events found in logs", file=sys.stderr)
+        for line in describe_unclassified(result.unclassified.result()):
+            print(line, file=sys.stderr)
+        sys.exit(1)
+
+    if sampler:
+        contract_output = sampler.contract_output()
+        aggregated = contract_output['signals']
+    else:
+        aggregated = result.signals()
+        contract_output = generate_contract_output(adapter.source, aggregated, result.rollups.result(),
+                                                   result.traces.result(), unclassified=result.unclassified.result())
+
+    print(json.dumps(contract_output, indent=2))
+
+    sampling = contract_output['quality'].get('sampling')
+    if sampling:
+        print(f"✓ Adapter: Sampled {sampling['bytes_read']:,} of {sampling['bytes_total']:,} bytes "
+              f"({sampling['chunks']} ranges, {result.events} events) → {len(aggregated)} estimated signals",
+              file=sys.stderr)
+    else:
+        if sampler:
+            print(f"ℹ️  Adapter: Log under {SAMPLE_EXACT_BELOW // (1024 * 1024)} MB or rate ≥ 0.5, "
+                  f"read whole (exact counts)", file=sys.stderr)
+        print(f"✓ Adapter: Processed {result.events} events → {len(aggregated)} aggregated signals", file=sys.stderr)
+    if result.folded:
+        print(f"  Folded {result.folded} continuation line(s) → {len(result.traces.entries)} distinct trace(s)",
+              file=sys.stderr)
+    if result.unclassified.events:
+        print(f"  Unclassified: {result.unclassified.events} event(s), heaviest templates:", file=sys.stderr)
+        for line in describe_unclassified(result.unclassified.result()):
+            print(line, file=sys.stderr)
+    print(f"  Quality: {contract_output['quality']['completeness']}", file=sys.stderr)
+    if contract_output['quality']['confidence_penalty'] > 0:
+        print(f"  Confidence penalty: {contract_output['quality']['confidence_penalty']}%", file=sys.stderr)
+
+def describe_unclassified(unclassified, limit=NOTE_TEMPLATES):
+    """Indented report lines for the heaviest unclassified templates."""
+    return [f"   ~{t['count']:,} × {t['template']}" for t in unclassified['top_templates'][:limit]]
+
+def sample_lines(adapter, count, seed=0):
+    rng = random.Random(seed)
+    return [adapter.sample_line(i, rng) for i in range(count)]
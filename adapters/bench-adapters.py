@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Evidence Adapter Throughput Benchmarks
+Runs every registered adapter (adapter_sdk.ADAPTERS) over generated input
+from its own sample_line() and reports parse throughput.
+
+Each adapter is timed through the same streaming core the CLI uses
+(adapter_sdk.process_lines), best of --repeat runs, input held in memory
+so disk speed does not skew the comparison.
+
+Usage:
+    bench-adapters.py [adapter ...] [--lines N] [--repeat R] [--json]
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+ADAPTERS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(ADAPTERS_DIR))
+from adapter_sdk import ADAPTERS, load_adapter, process_lines, sample_lines  # noqa: E402
+
+DEFAULT_LINES = 200_000
+DEFAULT_REPEAT = 3
+
+def bench(name, line_count, repeat):
+    adapter = load_adapter(name)
+    lines = sample_lines(adapter, line_count)
+    size_mb = sum(len(line) for line in lines) / (1024 * 1024)
+
+    best = None
+    for _ in range(repeat):
+        # Fresh adapter per run so per-instance caches start cold
+        adapter = load_adapter(name)
+        started = time.perf_counter()
+        result = process_lines(adapter, lines)
+        rollups = result.rollups.result()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        'adapter': name,
+        'lines': line_count,
+        'events': result.events,
+        'signals': len(result.groups),
+        'rollup_signals': len(rollups['signals']),
+        'seconds': round(best, 3),
+        'lines_per_second': round(line_count / best),
+        'mb_per_second': round(size_mb / best, 1),
+    }
+
+def main():
+    args = sys.argv[1:]
+    options = {'--lines': DEFAULT_LINES, '--repeat': DEFAULT_REPEAT}
+    names = []
+    as_json = False
+
+    i = 0
+    while i < len(args):
+        if args[i] in options and i + 1 < len(args):
+            options[args[i]] = int(args[i + 1])
+            i += 2
+        elif args[i] == '--json':
+            as_json = True
+            i += 1
+        elif args[i] in ADAPTERS:
+            names.append(args[i])
+            i += 1
+        else:
+            raise SystemExit(f"❌ Unknown adapter or option: {args[i]} (adapters: {', '.join(ADAPTERS)})")
+
+    results = [bench(name, options['--lines'], options['--repeat']) for name in names or ADAPTERS]
+
+    if as_json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(f"Adapter Throughput ({options['--lines']:,} lines, best of {options['--repeat']})")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(f"{'Adapter':<10} {'Lines/s':>12} {'MB/s':>8} {'Events':>10} {'Signals':>8} {'Time':>8}")
+    for r in results:
+        print(f"{r['adapter']:<10} {r['lines_per_second']:>12,} {r['mb_per_second']:>8} "
+              f"{r['events']:>10,} {r['signals']:>8} {r['seconds']:>7}s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Time-Indexed Deployment Store
+SQLite index over evidence/deployments.json for deployment anchoring.
+
+Index: evidence/.deployment-index.db (derived, safe to delete)
+  - One row per deployment record, keyed (service, epoch) by a B-tree,
+    so a window query is O(log n + k) instead of a scan that parses
+    every timestamp
+  - Records without a "service" are indexed under "" and match every
+    service (the single-service demo history has no service field)
+  - Records with a missing or unparseable "time" are counted, not indexed
+
+Incremental updates: the index remembers the source's size, mtime and a
+SHA-256 of the bytes it has already consumed. When the source has only
+grown (deploys appended), just the bytes after the consumed offset are
+parsed and inserted; any other change rebuilds the index. Both JSON
+arrays (resumed after the last record, before the closing "]") and JSON
+Lines (.jsonl) are supported. Confirming that the source only grew still
+hashes the consumed prefix once per changed-source sync: that is a
+sequential read of the file, while parsing and inserts scale with the
+appended records only.
+
+Concurrent syncs (every investigation shares the index) are safe: a sync
+commits only if the index is still the one it planned against, and one
+that lost the race re-plans and finds the update already applied.
+
+Commit windows: every deployment at time t owns the span
+[t - before, t + after]. Spans from one query share a width, so
+"which deployments cover time x" is the range query
+epoch in [x - after, x + before], and overlapping spans are merged so
+each stretch of history is searched once.
+
+Usage:
+    deployment_store.py sync [source]                 # Build / update the index
+    deployment_store.py window <service> <start> <end>
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime, timezone
+
+SOURCE_FILE = "evidence/deployments.json"
+INDEX_FILE = "evidence/.deployment-index.db"
+INDEX_VERSION = 1
+HASH_CHUNK = 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS deployments (
+    seq     INTEGER PRIMARY KEY,
+    service TEXT NOT NULL,
+    epoch   REAL NOT NULL,
+    record  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deployments_by_time ON deployments (service, epoch);
+CREATE TABLE IF NOT EXISTS source (
+    id            INTEGER PRIMARY KEY CHECK (id = 1),
+    version       INTEGER NOT NULL,
+    path          TEXT NOT NULL,
+    size          INTEGER NOT NULL,
+    mtime_ns      INTEGER NOT NULL,
+    consumed      INTEGER NOT NULL,
+    consumed_hash TEXT NOT NULL,
+    records       INTEGER NOT NULL,
+    skipped       INTEGER NOT NULL
+);
+"""
+
+class DeploymentSourceError(Exception):
+    """Raised when the deployment history cannot be read."""
+
+def to_epoch(ts):
+    """ISO-8601 timestamp (Z, offset, or naive = UTC) -> epoch seconds."""
+    dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+def _hash_range(sha256, path, start, end):
+    """Feed bytes [start, end) of a file into a running SHA-256."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining:
+            chunk = f.read(min(HASH_CHUNK, remaining))
+            if not chunk:
+                break
+            sha256.update(chunk)
+            remaining -= len(chunk)
+    return sha256
+
+def _read_source(path, start_offset):
+    """
+    Records after `start_offset` (0 = the whole source).
+
+    Returns: (records, consumed) where consumed is the byte offset that
+    later appends extend (end of the last record, or of the last full line)
+    Raises: DeploymentSourceError, also when the bytes after start_offset
+    do not continue the array (the caller then rebuilds)
+    """
+    is_jsonl = str(path).endswith(".jsonl")
+    resume = start_offset and not is_jsonl
+    opened = False
+    with open(path, "rb") as f:
+        if resume:
+            # An array resumes after its last record ("...}" + ",{...}") or right after "["
+            f.seek(start_offset - 1)
+            opened = f.read(1) == b"["
+        else:
+            f.seek(start_offset)
+        data = f.read()
+
+    try:
+        if is_jsonl:
+            end = data.rfind(b"\n") + 1
+            records = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+            return records, start_offset + end
+        # Appending rewrites the tail after the last record ("}\n]" -> "},\n{...}\n]"),
+        # so only bytes up to the end of the last record are stable
+        close = data.rfind(b"]")
+        stable = data[:close].rstrip() if close >= 0 else data
+        if not resume:
+            records = json.loads(data)
+        else:
+            tail = stable.lstrip()
+            if (tail and tail.startswith(b",") == opened) or close < 0 or data[close + 1:].strip():
+                raise DeploymentSourceError(f"{path} was not extended by appending records")
+            records = json.loads(b"[" + (tail if opened else tail[1:]) + b"]")
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise DeploymentSourceError(f"Invalid JSON in {path}: {e}")
+
+    if not isinstance(records, list) or close < 0:
+        raise DeploymentSourceError(f"{path} must contain a JSON array")
+    return records, start_offset + len(stable)
+
+class DeploymentStore:
+    """Window and coverage queries over an indexed deployment history."""
+
+    def __init__(self, source=SOURCE_FILE, index_file=INDEX_FILE):
+        self.source = source
+        self.index_file = index_file
+        self.conn = sqlite3.connect(index_file, isolation_level=None)
+        self.conn.executescript(SCHEMA)
+        self.last_sync = None
+
+    def close(self):
+        self.conn.close()
+
+    def sync(self):
+        """
+        Bring the index up to date with the source.
+
+        Returns: {"mode": "fresh" | "append" | "rebuild", "added": n, "skipped": n}
+        """
+        try:
+            stat = os.stat(self.source)
+        except FileNotFoundError:
+            raise DeploymentSourceError(f"Missing {self.source}")
+
+        # Parsing and hashing run outside the write lock; the commit only
+        # applies if no other process synced in between, otherwise the sync
+        # is re-planned against the index that process left behind
+        while True:
+            row = self._source_row()
+            plan = self._plan(row, stat)
+            if plan is None:
+                self.last_sync = {"mode": "fresh", "added": 0, "skipped": row[7]}
+                return self.last_sync
+            mode, first_seq, new_records, new_consumed, sha256, skipped = plan
+
+            rows = []
+            added = 0
+            for offset, record in enumerate(new_records):
+                try:
+                    epoch = to_epoch(record["time"])
+                except (KeyError, TypeError, ValueError, AttributeError):
+                    skipped += 1
+                    continue
+                rows.append((first_seq + offset, record.get("service") or "", epoch,
+                             json.dumps(record, separators=(",", ":"))))
+                added += 1
+
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                if self._source_row() != row:
+                    self.conn.execute("ROLLBACK")
+                    continue
+                if mode == "rebuild":
+                    self.conn.execute("DELETE FROM deployments")
+                self.conn.executemany(
+                    "INSERT INTO deployments (seq, service, epoch, record) VALUES (?, ?, ?, ?)", rows)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO source (id, version, path, size, mtime_ns, consumed,"
+                    " consumed_hash, records, skipped) VALUES (1, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (INDEX_VERSION, str(self.source), stat.st_size, stat.st_mtime_ns, new_consumed,
+                     sha256.hexdigest(), first_seq + len(new_records), skipped))
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+
+            self.last_sync = {"mode": mode, "added": added, "skipped": skipped}
+            return self.last_sync
+
+    def _source_row(self):
+        return self.conn.execute(
+            "SELECT version, path, size, mtime_ns, consumed, consumed_hash, records, skipped"
+            " FROM source WHERE id = 1").fetchone()
+
+    def _plan(self, row, stat):
+        """
+        What a sync against `row` has to apply.
+
+        Returns: None when the index is fresh, else (mode, first_seq,
+        new_records, new_consumed, sha256, skipped)
+        """
+        mode = "rebuild"
+        if row and row[0] == INDEX_VERSION and row[1] == str(self.source):
+            _, _, size, mtime_ns, consumed, consumed_hash, records, skipped = row
+            if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+                return None
+            if stat.st_size > consumed:
+                # The hash of the consumed prefix is extended, not recomputed, below
+                sha256 = _hash_range(hashlib.sha256(), self.source, 0, consumed)
+                if sha256.hexdigest() == consumed_hash:
+                    mode = "append"
+
+        if mode == "append":
+            try:
+                new_records, new_consumed = _read_source(self.source, consumed)
+                sha256 = _hash_range(sha256, self.source, consumed, new_consumed)
+                return mode, records, new_records, new_consumed, sha256, skipped
+            except DeploymentSourceError:
+                pass  # The prefix matched but the array was not simply extended
+        new_records, new_consumed = _read_source(self.source, 0)
+        sha256 = _hash_range(hashlib.sha256(), self.source, 0, new_consumed)
+        return "rebuild", 0, new_records, new_consumed, sha256, 0
+
+    def _query(self, service, start_epoch, end_epoch):
+        rows = self.conn.execute(
+            "SELECT record FROM deployments WHERE service IN (?, '') AND epoch BETWEEN ? AND ?"
+            " ORDER BY epoch, seq", (service, start_epoch, end_epoch))
+        return [json.loads(record) for (record,) in rows]
+
+    def window(self, service, start, end):
+        """Deployments of `service` with start <= time <= end (datetimes), in time order."""
+        return self._query(service, start.timestamp(), end.timestamp())
+
+    def covering(self, service, moment, before_minutes, after_minutes):
+        """Deployments whose commit window [t - before, t + after] contains `moment`."""
+        epoch = moment.timestamp()
+        return self._query(service, epoch - after_minutes * 60, epoch + before_minutes * 60)
+
+def commit_windows(deployments, before_minutes, after_minutes):
+    """
+    Merged commit-window spans for deployments.
+
+    Returns: sorted, non-overlapping [(start_epoch, end_epoch)]
+    """
+    spans = sorted((to_epoch(d["time"]) - before_minutes * 60, to_epoch(d["time"]) + after_minutes * 60)
+                   for d in deployments)
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def main():
+    args = sys.argv[1:]
+    if args[:1] == ["sync"] and len(args) <= 2:
+        store = DeploymentStore(args[1] if len(args) == 2 else SOURCE_FILE)
+        try:
+            result = store.sync()
+        except DeploymentSourceError as e:
+            raise SystemExit(f"❌ {e}")
+        total = store.conn.execute("SELECT COUNT(*) FROM deployments").fetchone()[0]
+        print(f"✓ Deployment index {result['mode']}: +{result['added']} ({total} indexed,"
+              f" {result['skipped']} skipped without a valid time)")
+        return
+
+    if args[:1] == ["window"] and len(args) == 4:
+        store = DeploymentStore()
+        store.sync()
+        start = datetime.fromtimestamp(to_epoch(args[2]), timezone.utc)
+        end = datetime.fromtimestamp(to_epoch(args[3]), timezone.utc)
+        print(json.dumps(store.window(args[1], start, end), indent=2))
+        return
+
+    print("Usage: deployment_store.py sync [source]")
+    print("       deployment_store.py window <service> <start> <end>")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+JSON Lines Log Adapter - Evidence Contract Enforcer
+
+Converts structured application logs (one JSON object per line) →
+Evidence Contract format.
+
+Field lookup (first present key wins):
+- Timestamp: timestamp, time, @timestamp, ts
+  (ISO-8601 with Z/offset, naive = UTC, or epoch seconds/milliseconds)
+- Severity:  level, severity, lvl, log.level (names or numeric 10-60)
+- Component: service, component, app, logger
+- Message:   message, msg, event, error
+
+Lines that are not JSON objects are skipped like unparseable text lines.
+
+Reading, aggregation and quality scoring come from adapters/adapter_sdk.py.
+"""
+
+import json
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from adapter_sdk import LogAdapter, run  # noqa: E402
+
+TIMESTAMP_FIELDS = ('timestamp', 'time', '@timestamp', 'ts')
+SEVERITY_FIELDS = ('level', 'severity', 'lvl', 'log.level')
+COMPONENT_FIELDS = ('service', 'component', 'app', 'logger')
+MESSAGE_FIELDS = ('message', 'msg', 'event', 'error')
+
+# Evidence contract event type mappings (generic application vocabulary)
+EVENT_TYPE_PATTERNS = [
+    # Lifecycle events
+    (r'server (started|starting)|listening on|application startup', 'startup'),
+    (r'shutting down|graceful shutdown|server stopped', 'shutdown'),
+    (r'service.*starting', 'service_start'),
+
+    # Resource allocation failures
+    (r'out of memory|cannot allocate|allocation failed|memory limit|pool exhausted', 'resource_allocation_failure'),
+    (r'i/o error|ioerror|connection (reset|refused)|broken pipe|no space left', 'io_error'),
+
+    # Performance degradation
+    (r'\bslow\b|took \d+ ?ms|timed out|timeout|deadline exceeded', 'performance_degradation'),
+
+    # Crashes and errors
+    (r'panic|segfault|fatal error|traceback|unhandled exception|crash', 'process_crash'),
+    (r'SIGTERM|SIGKILL|received signal', 'signal_received'),
+
+    # Operational events
+    (r'health ?check (ok|passed)|request completed', 'operational_success'),
+    (r'registered|registration', 'registration'),
+]
+
+# Severity mapping (names lowercased; numeric levels as used by structured loggers)
+SEVERITY_MAP = {
+    'trace': None, 'debug': None, '10': None, '20': None,
+    'info': 'INFO', 'notice': 'INFO', '30': 'INFO',
+    'warn': 'WARN', 'warning': 'WARN', 'caution': 'WARN', '40': 'WARN',
+    'error': 'ERROR', 'err': 'ERROR', 'critical': 'ERROR', 'fatal': 'ERROR',
+    '50': 'ERROR', '60': 'ERROR',
+}
+
+UTC_SECONDS = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z$')
+
+def _first(record, fields):
+    for field in fields:
+        value = record.get(field)
+        if value is not None:
+            return value
+    return None
+
+class JsonLinesAdapter(LogAdapter):
+    source = 'jsonl'
+    usage = 'jsonl-adapter.py <jsonl-log-file>'
+    EVENT_TYPE_PATTERNS = EVENT_TYPE_PATTERNS
+    SEVERITY_MAP = SEVERITY_MAP
+
+    def tokenize(self, line):
+        if not line.startswith('{'):
+            return None
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(record, dict):
+            return None
+        component = _first(record, COMPONENT_FIELDS)
+        if isinstance(component, (dict, list)):
+            component = str(component)  # Unhashable as a cache key; {"name": "api"} -> "name_api"
+        return (
+            _first(record, TIMESTAMP_FIELDS),
+            str(_first(record, SEVERITY_FIELDS) or 'info').lower(),
+            component,
+            str(_first(record, MESSAGE_FIELDS) or ''),
+        )
+
+    def parse_timestamp(self, raw):
+        if raw is None:
+            return None
+        if isinstance(raw, (int, float)) and not isinstance(raw, bool):
+            seconds = raw / 1000 if raw > 1e11 else raw  # Epoch milliseconds
+            try:
+                return datetime.fromtimestamp(int(seconds), timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            except (OverflowError, OSError, ValueError):
+                return None  # Out-of-range epoch (or NaN/Infinity)
+        raw = str(raw)
+        # Fast path: already UTC, only fractional seconds to drop
+        if UTC_SECONDS.match(raw):
+            return raw[:19] + 'Z'
+        try:
+            dt = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        except (OverflowError, ValueError):
+            return None  # Unparseable, or out of range once shifted to UTC
+
+    def extract_component(self, raw):
+        component = self.components.get(raw)
+        if component is None:
+            component = re.sub(r'[^a-z0-9_-]+', '_', str(raw).lower()).strip('_') if raw else ''
+            component = self.components[raw] = component or self.DEFAULT_COMPONENT
+        return component
+
+    def sample_line(self, index, rng):
+        second = 1426547000 + index // 50
+        level, message = rng.choice((
+            ('info', f'request completed path=/api/items/{index} status=200'),
+            ('warn', f'slow query took {index % 900} ms'),
+            ('error', f'connection reset by peer upstream=10.0.0.{index % 255}'),
+            ('error', 'out of memory: cannot allocate buffer'),
+            ('debug', f'cache lookup key={index}'),
+        ))
+        return json.dumps({
+            'timestamp': datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+                         + f".{index % 1000:03d}Z",
+            'level': level,
+            'service': 'api-gateway',
+            'message': message,
+        }) + '\n'
+
+if __name__ == '__main__':
+    run(JsonLinesAdapter())
@@ -0,0 +1,742 @@
+#!/usr/bin/env python3
+"""
+Phase 6: Dispatch Engine
+Sends finalized decisions to Jira, Slack, GitHub and email concurrently.
+
+Core Principle: Phase 6 reads only, emits side effects, never feeds back.
+
+The review record and IKR are parsed once. `rules.on_decision` in
+config/phase6.yaml picks the targets; every payload for every target is
+sent concurrently over pooled keep-alive HTTP connections, with per-target
+rate limits, timeouts and exponential backoff (see `engine:` and each
+`dispatch.<target>` section of the config).
+
+A target without a `url` is a dry run: payloads are prepared and printed
+but nothing is sent.
+
+Usage:
+    dispatch.py <incident_id> [--review-record P] [--ikr P] [--config P] [--stand-in]
+    dispatch.py serve [--port N] [--fail-first N] [--drop-first N]
+
+--stand-in starts a local HTTP stand-in server in-process and points every
+target at it. `serve` runs the same stand-in on its own, logging requests.
+"""
+
+import asyncio
+import json
+import os
+import random
+import ssl
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+CONFIG_FILE = Path("adapters/operational-integration/config/phase6.yaml")
+
+# Engine defaults (overridden by the `engine:` config section)
+ENGINE_DEFAULTS = {
+    'max_connections_per_host': 4,
+    'timeout_seconds': 10,
+    'max_retries': 3,
+    'backoff_base_seconds': 0.5,
+    'backoff_max_seconds': 30,
+}
+
+# Responses worth retrying; anything else non-2xx fails immediately
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+class DispatchError(Exception):
+    """Raised for malformed HTTP exchanges."""
+
+class OutcomeUnknown(DispatchError):
+    """The request was sent but no complete response came back (it may have been applied)."""
+
+# ============================================================================
+# ARTIFACTS
+# ============================================================================
+
+def load_yaml(path):
+    with open(path, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+def approval_status(review_record):
+    status = (review_record.get('approval') or {}).get('status', 'UNKNOWN')
+    return str(status).split('#')[0].strip()
+
+def load_context(incident_id, review_record_path, ikr_path):
+    """Parse the review record and IKR once into the fields dispatch uses."""
+    review_record = load_yaml(review_record_path)
+    ikr = load_yaml(ikr_path)
+
+    root_cause = ikr.get('final_root_cause') or {}
+    decision = ikr.get('decision') or {}
+    hypotheses = ikr.get('hypotheses') or {}
+
+    return {
+        'incident_id': ikr.get('incident_id', incident_id),
+        'service': ikr.get('service', 'unknown'),
+        'approval_status': approval_status(review_record),
+        'root_cause': root_cause.get('summary', 'unknown'),
+        'category': root_cause.get('category', 'unknown'),
+        'decision': str(decision.get('type', 'UNKNOWN')).split('#')[0].strip(),
+        'confidence': decision.get('final_confidence', 0),
+        'delta': (ikr.get('ai_vs_human') or {}).get('delta', 0),
+        'hypotheses_total': hypotheses.get('total', 0),
+        'hypotheses_ruled_out': hypotheses.get('ruled_out', 0),
+        'remediations': (ikr.get('remediation') or {}).get('promised') or ikr.get('remediation_promises') or [],
+    }
+
+# ============================================================================
+# PAYLOADS (one job per HTTP request)
+# ============================================================================
+
+def artifact_links(incident_id):
+    return (
+        f"- Postmortem: reports/post-mortem-{incident_id}.md\n"
+        f"- Review Record: reports/review-record-{incident_id}.yaml\n"
+        f"- Institutional Memory: incidents/{incident_id}.yaml\n"
+    )
+
+def remediation_body(ctx, action):
+    return (
+        f"Remediation action from incident {ctx['incident_id']}\n\n"
+        f"Root Cause: {ctx['root_cause']}\n"
+        f"Service: {ctx['service']}\n\n"
+        f"Action:\n{action}\n\n"
+        f"Artifacts:\n{artifact_links(ctx['incident_id'])}\n"
+        "This ticket was automatically created by Sherlock Phase 6.\n"
+    )
+
+def jira_jobs(ctx, settings):
+    jobs = []
+    for action in ctx['remediations']:
+        jobs.append({
+            'path': '/rest/api/2/issue',
+            'summary': action,
+            'body': {
+                'fields': {
+                    'project': {'key': settings.get('project', 'SRE')},
+                    'summary': f"[{ctx['incident_id']}] {action[:80]}",
+                    'description': remediation_body(ctx, action),
+                    'issuetype': {'name': settings.get('issue_type', 'Task')},
+                    'priority': {'name': settings.get('priority', 'Medium')},
+                    'labels': list(settings.get('labels', [])) + [ctx['incident_id'], ctx['service']],
+                }
+            },
+        })
+    return jobs
+
+def github_jobs(ctx, settings):
+    jobs = []
+    for action in ctx['remediations']:
+        jobs.append({
+            'path': f"/repos/{settings.get('repo', '')}/issues",
+            'summary': action,
+            'body': {
+                'title': f"[{ctx['incident_id']}] {action[:80]}",
+                'body': remediation_body(ctx, action),
+                'labels': list(settings.get('labels', [])) + [ctx['incident_id']],
+            },
+        })
+    return jobs
+
+def slack_text(ctx):
+    decision = ctx['decision']
+    emoji = "✅" if decision == "ACCEPTED" else "📝" if decision == "MODIFIED" else "⚠️"
+    lines = [
+        f"{emoji} *Incident {ctx['incident_id']} Finalized*",
+        "",
+        f"*Service:* {ctx['service']}",
+        f"*Category:* {ctx['category']}",
+        f"*Decision:* {decision} (human-reviewed)",
+        f"*Final Confidence:* {ctx['confidence']}% (AI vs Human: {int(ctx['delta']):+d}%)",
+        "",
+        "*Root Cause:*",
+        ctx['root_cause'],
+        "",
+        "*Analysis:*",
+        f"• Hypotheses evaluated: {ctx['hypotheses_total']}",
+        f"• Hypotheses ruled out: {ctx['hypotheses_ruled_out']}",
+        "",
+        "*Artifacts:*",
+        f"• <file://reports/post-mortem-{ctx['incident_id']}.md|Postmortem>",
+        f"• <file://reports/review-record-{ctx['incident_id']}.yaml|Review Record>",
+        f"• <file://incidents/{ctx['incident_id']}.yaml|Institutional Memory>",
+        "",
+        "*Next Steps:*",
+    ]
+
+    remediations = ctx['remediations']
+    if remediations:
+        lines += [f"{i}. {action}" for i, action in enumerate(remediations[:3], 1)]
+        if len(remediations) > 3:
+            lines.append(f"   ... and {len(remediations) - 3} more")
+    else:
+        lines.append("No remediation actions specified")
+
+    if decision == "MODIFIED":
+        lines += ["", "_⚙️ Remediation tickets will be created in JIRA_"]
+    elif decision == "REJECTED":
+        lines += ["", "_⚠️ Analysis rejected - requires further investigation_"]
+
+    return "\n".join(lines)
+
+def slack_jobs(ctx, settings):
+    return [{
+        'path': '',
+        'summary': f"Notification to {settings.get('channel', '')}",
+        'body': {'channel': settings.get('channel', ''), 'text': slack_text(ctx)},
+    }]
+
+def email_jobs(ctx, settings):
+    return [{
+        'path': '',
+        'summary': f"Notification to {', '.join(settings.get('to', []))}",
+        'body': {
+            'to': settings.get('to', []),
+            'cc': settings.get('cc', []),
+            'subject': f"[Sherlock] Incident {ctx['incident_id']} finalized ({ctx['decision']})",
+            'text': slack_text(ctx),
+        },
+    }]
+
+PAYLOAD_BUILDERS = {
+    'jira': jira_jobs,
+    'slack': slack_jobs,
+    'github': github_jobs,
+    'email': email_jobs,
+}
+
+def job_headers(settings):
+    """Request headers for a target (bearer token read from `token_env`)."""
+    headers = {'Content-Type': 'application/json'}
+    token_env = settings.get('token_env')
+    if token_env and os.environ.get(token_env):
+        headers['Authorization'] = f"Bearer {os.environ[token_env]}"
+    return headers
+
+def build_jobs(target, ctx, settings):
+    """Expand one target into its HTTP jobs (url=None means dry run)."""
+    base_url = settings.get('url')
+    headers = job_headers(settings)
+
+    jobs = []
+    for job in PAYLOAD_BUILDERS[target](ctx, settings):
+        job['target'] = target
+        job['url'] = f"{base_url.rstrip('/')}{job['path']}" if base_url and job['path'] else base_url
+        job['headers'] = headers
+        jobs.append(job)
+    return jobs
+
+# ============================================================================
+# HTTP (pooled keep-alive connections)
+# ============================================================================
+
+async def read_head(reader):
+    """Read a status line and headers. Returns (version, status, headers)."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed before response")
+    parts = status_line.decode('latin-1').split(' ', 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise DispatchError(f"malformed status line: {status_line!r}")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        key, _, value = line.decode('latin-1').partition(':')
+        headers[key.strip().lower()] = value.strip()
+    return parts[0], int(parts[1]), headers
+
+async def read_response(reader, method='POST'):
+    """Read one HTTP/1.1 response. Returns (status, headers, body, keep_alive)."""
+    version, status, headers = await read_head(reader)
+    while 100 <= status < 200 and status != 101:
+        # Interim response (100 Continue, 103 Early Hints): no body, final one follows
+        version, status, headers = await read_head(reader)
+
+    connection = headers.get('connection', '').lower()
+    keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+
+    if method == 'HEAD' or status in (101, 204, 304):
+        body = b''  # Never has a body, whatever the headers say
+    elif headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0].strip() or b'0', 16)
+            if size == 0:
+                await reader.readline()
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b''.join(chunks)
+    elif 'content-length' in headers:
+        body = await reader.readexactly(int(headers['content-length']))
+    elif not keep_alive:
+        body = await reader.read()  # Delimited by the server closing the connection
+    else:
+        # No framing on a persistent connection: take no body, and do not
+        # reuse the connection since its position in the stream is unknown
+        body = b''
+        keep_alive = False
+
+    return status, headers, body, keep_alive
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections, bounded per host."""
+
+    def __init__(self, max_per_host=ENGINE_DEFAULTS['max_connections_per_host']):
+        self.max_per_host = max_per_host
+        self.idle = {}
+        self.limits = {}
+        self.opened = 0
+
+    async def _connect(self, key):
+        scheme, host, port = key
+        ssl_context = ssl.create_default_context() if scheme == 'https' else None
+        self.opened += 1
+        return await asyncio.open_connection(host, port, ssl=ssl_context)
+
+    async def request(self, method, url, headers, body, timeout):
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'http'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname, port)
+        target = (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+        head = [f"{method} {target} HTTP/1.1", f"Host: {parts.netloc}",
+                f"Content-Length: {len(body)}", "Connection: keep-alive"]
+        head += [f"{k}: {v}" for k, v in headers.items()]
+        request = ("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + body
+
+        limit = self.limits.setdefault(key, asyncio.Semaphore(self.max_per_host))
+        async with limit:
+            idle = self.idle.setdefault(key, [])
+            # A pooled connection the server closed while idle is dropped
+            # before anything is written to it; once the request bytes are
+            # written it is never re-sent, since the server may have acted on it.
+            while True:
+                reader, writer = idle.pop() if idle else await asyncio.wait_for(self._connect(key), timeout)
+                if not (reader.at_eof() or writer.is_closing()):
+                    break
+                writer.close()
+
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, resp_headers, resp_body, keep_alive = await asyncio.wait_for(
+                    read_response(reader, method), timeout)
+            except asyncio.TimeoutError:
+                writer.close()
+                raise OutcomeUnknown(f"no response within {timeout}s (request was sent)") from None
+            except (OSError, DispatchError, ValueError, asyncio.IncompleteReadError) as e:
+                writer.close()
+                raise OutcomeUnknown(f"{str(e) or type(e).__name__} (request was sent)") from e
+            except BaseException:
+                writer.close()
+                raise
+
+            if keep_alive:
+                idle.append((reader, writer))
+            else:
+                writer.close()
+
+        return status, resp_headers, resp_body
+
+    async def close(self):
+        writers = [writer for connections in self.idle.values() for _, writer in connections]
+        self.idle.clear()
+        for writer in writers:
+            writer.close()
+        await asyncio.gather(*(w.wait_closed() for w in writers), return_exceptions=True)
+
+# ============================================================================
+# RATE LIMITING & RETRIES
+# ============================================================================
+
+class RateLimiter:
+    """Token bucket: `rate` requests per second with bursts up to `burst`."""
+
+    def __init__(self, rate=None, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.rate:
+            return
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def backoff_delay(attempt, base, maximum, retry_after=None):
+    """Exponential backoff with jitter; Retry-After (seconds) wins if given."""
+    if retry_after is not None:
+        try:
+            return min(maximum, float(retry_after))
+        except ValueError:
+            pass
+    return min(maximum, base * (2 ** attempt)) * random.uniform(0.5, 1.0)
+
+async def deliver(pool, limiter, job, policy):
+    """
+    Send one job with retries.
+
+    A POST is not idempotent: once its bytes were written without a complete
+    answer (timeout, reset, truncated or malformed response), the target may
+    already have applied it, so it is not retried (retryable: False). Only
+    connect failures and retryable statuses are retried.
+
+    Returns: {"target", "summary", "ok", "status", "attempts", "error", "retryable"}
+    """
+    result = {'target': job['target'], 'summary': job['summary'], 'ok': False,
+              'status': None, 'attempts': 0, 'error': None, 'retryable': True}
+    body = json.dumps(job['body']).encode()
+
+    for attempt in range(policy['max_retries'] + 1):
+        await limiter.acquire()
+        result['attempts'] = attempt + 1
+        retry_after = None
+        try:
+            status, headers, _ = await pool.request(
+                'POST', job['url'], job['headers'], body, policy['timeout_seconds'])
+            result['status'] = status
+            if 200 <= status < 300:
+                result['ok'] = True
+                result['error'] = None
+                return result
+            result['error'] = f"HTTP {status}"
+            if status not in RETRYABLE_STATUS:
+                return result
+            retry_after = headers.get('retry-after')
+        except OutcomeUnknown as e:
+            result['error'] = str(e)
+            result['retryable'] = False
+            return result
+        except asyncio.TimeoutError:
+            result['error'] = f"timeout after {policy['timeout_seconds']}s"
+        except OSError as e:
+            result['error'] = str(e) or type(e).__name__
+
+        if attempt < policy['max_retries']:
+            await asyncio.sleep(backoff_delay(
+                attempt, policy['backoff_base_seconds'], policy['backoff_max_seconds'], retry_after))
+
+    return result
+
+def target_policy(engine, settings):
+    """Per-target settings override engine defaults."""
+    policy = dict(ENGINE_DEFAULTS)
+    policy.update({k: v for k, v in engine.items() if k in ENGINE_DEFAULTS})
+    policy.update({k: v for k, v in settings.items() if k in ENGINE_DEFAULTS})
+    return policy
+
+async def dispatch_jobs(jobs, config):
+    """Send all jobs concurrently. Dry-run jobs (no url) succeed immediately."""
+    engine = config.get('engine') or {}
+    dispatch_cfg = config.get('dispatch') or {}
+    pool = ConnectionPool(engine.get('max_connections_per_host', ENGINE_DEFAULTS['max_connections_per_host']))
+
+    limiters = {}
+    for target in {job['target'] for job in jobs}:
+        settings = dispatch_cfg.get(target) or {}
+        limiters[target] = RateLimiter(settings.get('rate_limit_per_second'), settings.get('burst', 1))
+
+    async def run(job):
+        if not job['url']:
+            return {'target': job['target'], 'summary': job['summary'], 'ok': True,
+                    'status': None, 'attempts': 0, 'error': None, 'dry_run': True,
+                    'preview': job['body'].get('text')}
+        policy = target_policy(engine, dispatch_cfg.get(job['target']) or {})
+        return await deliver(pool, limiters[job['target']], job, policy)
+
+    try:
+        return await asyncio.gather(*(run(job) for job in jobs))
+    finally:
+        await pool.close()
+
+# ============================================================================
+# LOCAL STAND-IN SERVER
+# ============================================================================
+
+class StandInServer:
+    """
+    Minimal keep-alive HTTP server that accepts any POST and records it.
+
+    fail_first=N answers the first N requests with 503 to exercise retries;
+    drop_first=N reads the first N requests and closes the connection
+    without answering (outcome unknown to the client: must not be re-sent).
+    """
+
+    def __init__(self, fail_first=0, drop_first=0, verbose=False):
+        self.fail_first = fail_first
+        self.drop_first = drop_first
+        self.verbose = verbose
+        self.requests = []
+        self.connections = 0
+        self.server = None
+        self.handlers = set()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        self.handlers.add(asyncio.current_task())
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path = request_line.decode('latin-1').split(' ')[:2]
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                self.requests.append({'method': method, 'path': path, 'body': body.decode()})
+                if len(self.requests) <= self.drop_first:
+                    if self.verbose:
+                        print(f"  --- {method} {path} ({len(body)} bytes, closed without response)")
+                    break
+                status = 503 if len(self.requests) <= self.fail_first else 200
+                if self.verbose:
+                    print(f"  {status} {method} {path} ({len(body)} bytes)")
+
+                payload = json.dumps({'ok': status == 200}).encode()
+                reason = 'OK' if status == 200 else 'Service Unavailable'
+                writer.write(
+                    f"HTTP/1.1 {status} {reason}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\nRetry-After: 0\r\n\r\n".encode() + payload)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+            self.handlers.discard(asyncio.current_task())
+
+    async def start(self, host='127.0.0.1', port=0):
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return f"http://{host}:{self.server.sockets[0].getsockname()[1]}"
+
+    async def stop(self):
+        self.server.close()
+        # Clients have closed their pooled connections; let handlers see EOF
+        await asyncio.wait_for(
+            asyncio.gather(*self.handlers, return_exceptions=True), timeout=5)
+        await self.server.wait_closed()
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def print_results(results):
+    by_target = {}
+    for result in results:
+        by_target.setdefault(result['target'], []).append(result)
+
+    for target, target_results in by_target.items():
+        print(f"Dispatcher: {target}")
+        print("─────────────────────────────────────────────────────────────")
+        for i, result in enumerate(target_results, 1):
+            summary = result['summary']
+            summary = summary[:70] + ('...' if len(summary) > 70 else '')
+            if result.get('dry_run'):
+                print(f"  {i}. {summary} (prepared, no url configured)")
+                if result.get('preview'):
+                    print()
+                    print("\n".join(f"     {line}" for line in result['preview'].splitlines()))
+                    print()
+            elif result.get('queued'):
+                print(f"  {i}. {summary} (queued in outbox)")
+            elif result.get('duplicate'):
+                print(f"  {i}. {summary} (already in outbox, not re-sent)")
+            elif result['ok']:
+                print(f"  {i}. {summary} (HTTP {result['status']}, attempts: {result['attempts']})")
+            else:
+                print(f"  {i}. {summary} (FAILED: {result['error']}, attempts: {result['attempts']})")
+
+        failed = sum(1 for r in target_results if not r['ok'])
+        if failed:
+            print(f"⚠️  {target} dispatcher: {failed}/{len(target_results)} failed (non-fatal)")
+        else:
+            print(f"✓ {target} dispatcher completed")
+        print()
+
+def enqueue_jobs(ctx, jobs, config):
+    """Enqueue live jobs into the durable outbox; returns per-job results."""
+    if not jobs:
+        return []
+    import outbox
+
+    conn = outbox.connect(outbox.outbox_settings(config)['path'])
+    try:
+        keys = outbox.enqueue(conn, ctx['incident_id'], ctx['decision'], jobs)
+    finally:
+        conn.close()
+
+    return [{'target': job['target'], 'summary': job['summary'], 'ok': True,
+             'status': None, 'attempts': 0, 'error': None,
+             'queued': inserted, 'duplicate': not inserted}
+            for job, (_, inserted) in zip(jobs, keys)]
+
+async def run_dispatch(incident_id, review_record, ikr, config_file, stand_in=False):
+    config = load_yaml(config_file)
+
+    if config.get('enabled') is not True:
+        print("ℹ️  Phase 6 disabled in config")
+        return 0
+
+    ctx = load_context(incident_id, review_record, ikr)
+
+    if ctx['approval_status'] != 'FINALIZED':
+        print(f"⚠️  Incident {incident_id} not finalized (status: {ctx['approval_status']})")
+        print("   Phase 6 only processes FINALIZED incidents")
+        return 0
+
+    print(f"✓ Incident {incident_id} is finalized")
+    print()
+    print(f"Decision type: {ctx['decision']}")
+    print()
+
+    rules = (config.get('rules') or {}).get('on_decision') or {}
+    if ctx['decision'] not in rules:
+        print(f"⚠️  Unknown decision type: {ctx['decision']}")
+        return 1
+
+    dispatch_cfg = config.get('dispatch') or {}
+    targets = []
+    for target in rules[ctx['decision']]:
+        settings = dispatch_cfg.get(target) or {}
+        if target not in PAYLOAD_BUILDERS:
+            print(f"⚠️  Dispatcher not found: {target}")
+        elif settings.get('enabled') is not True:
+            print(f"ℹ️  {target} dispatcher disabled in config")
+        else:
+            targets.append(target)
+
+    server = None
+    if stand_in:
+        server = StandInServer()
+        url = await server.start()
+        for target in targets:
+            dispatch_cfg[target]['url'] = url
+        print(f"Stand-in server: {url}")
+
+    jobs = [job for target in targets for job in build_jobs(target, ctx, dispatch_cfg[target])]
+    print(f"Dispatchers to run: {' '.join(targets)} ({len(jobs)} request(s))")
+    print()
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print()
+
+    started = time.monotonic()
+    outbox_cfg = config.get('outbox') or {}
+    if outbox_cfg.get('enabled') and not stand_in:
+        # Durable mode: the pipeline only pays for the enqueue
+        live = [job for job in jobs if job['url']]
+        results = await dispatch_jobs([job for job in jobs if not job['url']], config)
+        results += enqueue_jobs(ctx, live, config)
+        if any(r.get('queued') for r in results):
+            import outbox
+            outbox.start_drain_worker(config_file)
+    else:
+        try:
+            results = await dispatch_jobs(jobs, config)
+        finally:
+            if server:
+                await server.stop()
+    elapsed = time.monotonic() - started
+
+    print_results(results)
+
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print("✅ Phase 6 Complete")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print()
+    print("Summary:")
+    print(f"  • Incident: {incident_id}")
+    print(f"  • Decision: {ctx['decision']}")
+    print(f"  • Dispatchers executed: {len(targets)}")
+    queued = sum(1 for r in results if r.get('queued'))
+    if queued:
+        print(f"  • Requests: {queued} queued in outbox in {elapsed:.2f}s (drain worker delivers)")
+        print("    Check progress: python3 adapters/operational-integration/outbox.py status")
+    else:
+        print(f"  • Requests: {sum(1 for r in results if r['ok'])}/{len(results)} delivered in {elapsed:.2f}s")
+    if server:
+        print(f"  • Stand-in received: {len(server.requests)} request(s) over {server.connections} connection(s)")
+    print()
+    print("Note: Phase 6 is read-only and does not influence reasoning")
+    print("      Removing Phase 6 changes nothing upstream")
+    return 0
+
+async def serve(port, fail_first, drop_first):
+    server = StandInServer(fail_first=fail_first, drop_first=drop_first, verbose=True)
+    url = await server.start(port=port)
+    print(f"Stand-in dispatch server listening on {url} (Ctrl-C to stop)")
+    await server.server.serve_forever()
+
+def parse_options(args, names):
+    options = {}
+    positional = []
+    i = 0
+    while i < len(args):
+        if args[i] in names and i + 1 < len(args):
+            options[args[i]] = args[i + 1]
+            i += 2
+        else:
+            positional.append(args[i])
+            i += 1
+    return positional, options
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: dispatch.py <incident_id> [--review-record P] [--ikr P] [--config P] [--stand-in]")
+        print("       dispatch.py serve [--port N] [--fail-first N] [--drop-first N]")
+        sys.exit(1)
+
+    if not YAML_AVAILABLE:
+        print("⚠️  PyYAML not installed - Phase 6 dispatch skipped (non-fatal)")
+        print("   Install with: pip install pyyaml")
+        sys.exit(0)
+
+    if sys.argv[1] == 'serve':
+        _, options = parse_options(sys.argv[2:], ('--port', '--fail-first', '--drop-first'))
+        try:
+            asyncio.run(serve(int(options.get('--port', 8765)), int(options.get('--fail-first', 0)),
+                              int(options.get('--drop-first', 0))))
+        except KeyboardInterrupt:
+            pass
+        return
+
+    args = [a for a in sys.argv[1:] if a != '--stand-in']
+    positional, options = parse_options(args, ('--review-record', '--ikr', '--config'))
+    incident_id = positional[0]
+
+    review_record = options.get('--review-record', f"reports/review-record-{incident_id}.yaml")
+    ikr = options.get('--ikr', f"incidents/{incident_id}.yaml")
+    config_file = options.get('--config', str(CONFIG_FILE))
+
+    sys.exit(asyncio.run(run_dispatch(
+        incident_id, review_record, ikr, config_file, stand_in='--stand-in' in sys.argv)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+Phase 6: Durable Dispatch Outbox
+SQLite-backed queue between the pipeline and external systems.
+
+The pipeline only enqueues (one transaction). A background drain worker
+delivers with at-least-once retries, so a slow or down Jira never blocks
+an investigation, and re-running Phase 6 never double-posts.
+
+Idempotency: every message has a key derived from
+(incident, decision, target, payload hash). The hash covers the job's
+summary and body, not its position, so adding, removing or reordering
+remediation items neither re-sends nor drops the others. Enqueueing an
+existing key is a no-op, whatever state the earlier message is in.
+
+Coalescing: notification targets listed in `outbox.digest_targets` are
+held for `coalesce_window_seconds`; if several are pending for the same
+endpoint they are delivered as one digest message.
+
+Database: adapters/operational-integration/outbox.db (`outbox.path`)
+
+Usage:
+    outbox.py drain [--once]             # Deliver pending messages (one worker at a time)
+    outbox.py status                     # Queue counts and failed messages
+    outbox.py retry <key|--all-failed>   # Requeue failed messages
+
+All commands accept --config <phase6.yaml>.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from dispatch import (  # noqa: E402
+    CONFIG_FILE, ConnectionPool, RateLimiter, backoff_delay, deliver, job_headers,
+    load_yaml, target_policy,
+)
+
+OUTBOX_DEFAULTS = {
+    'enabled': False,
+    'path': 'adapters/operational-integration/outbox.db',
+    'max_attempts': 8,
+    'coalesce_window_seconds': 5,
+    'digest_targets': ['slack', 'email'],
+    'poll_interval_seconds': 1,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    key             TEXT NOT NULL UNIQUE,
+    incident_id     TEXT NOT NULL,
+    decision        TEXT NOT NULL,
+    target          TEXT NOT NULL,
+    job             TEXT NOT NULL,
+    status          TEXT NOT NULL DEFAULT 'pending',
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error      TEXT,
+    created_at      REAL NOT NULL,
+    delivered_at    REAL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+"""
+
+def outbox_settings(config):
+    settings = dict(OUTBOX_DEFAULTS)
+    settings.update(config.get('outbox') or {})
+    return settings
+
+def connect(path):
+    """Open the outbox database (WAL so enqueue never waits on a drain)."""
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def message_key(incident_id, decision, target, job):
+    payload = json.dumps([job['summary'], job['body']], sort_keys=True)
+    digest = hashlib.sha256(payload.encode()).hexdigest()[:16]
+    return f"{incident_id}/{decision}/{target}#{digest}"
+
+# ============================================================================
+# ENQUEUE (pipeline side)
+# ============================================================================
+
+def enqueue(conn, incident_id, decision, jobs):
+    """
+    Enqueue jobs in a single transaction.
+
+    Returns: list of (key, inserted) per job; inserted is False when the
+    key was already in the outbox (duplicate, not re-sent)
+    """
+    now = time.time()
+    keys = []
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for job in jobs:
+            target = job['target']
+            key = message_key(incident_id, decision, target, job)
+
+            # Credentials are resolved at delivery time, never stored
+            stored = {k: v for k, v in job.items() if k != 'headers'}
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO outbox (key, incident_id, decision, target, job, next_attempt_at, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, incident_id, decision, target, json.dumps(stored), now, now))
+            keys.append((key, cursor.rowcount == 1))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+    return keys
+
+def start_drain_worker(config_file=CONFIG_FILE, log_file=None):
+    """Spawn a detached drain worker (it waits for any running worker first)."""
+    log_file = log_file or Path(__file__).resolve().parent / "outbox.log"
+    with open(log_file, 'a') as log:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), 'drain', '--config', str(config_file)],
+            stdin=subprocess.DEVNULL, stdout=log, stderr=log, start_new_session=True)
+
+# ============================================================================
+# DRAIN (worker side)
+# ============================================================================
+
+def due_messages(conn, settings, now):
+    """Pending messages whose retry time has come, honoring the digest window."""
+    rows = conn.execute(
+        "SELECT id, key, target, job, attempts, created_at FROM outbox"
+        " WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY id",
+        (now,)).fetchall()
+
+    window = settings['coalesce_window_seconds']
+    digest_targets = set(settings['digest_targets'])
+    messages = []
+    for row_id, key, target, job, attempts, created_at in rows:
+        # Hold fresh notifications briefly so a burst becomes one digest
+        if target in digest_targets and attempts == 0 and now - created_at < window:
+            continue
+        messages.append({'id': row_id, 'key': key, 'target': target,
+                         'job': json.loads(job), 'attempts': attempts})
+    return messages
+
+def digest_job(target, jobs):
+    """Merge several notification payloads for one endpoint into one."""
+    first = jobs[0]
+    texts = [job['body'].get('text', '') for job in jobs]
+    separator = "\n\n────────────────────\n\n"
+    header = f"*{len(jobs)} incident decisions finalized*"
+    body = dict(first['body'])
+    body['text'] = header + separator + separator.join(texts)
+    if 'subject' in body:
+        body['subject'] = f"[Sherlock] {len(jobs)} incident decisions finalized"
+    return {
+        'target': target,
+        'url': first['url'],
+        'path': first.get('path', ''),
+        'summary': f"Digest of {len(jobs)} notifications",
+        'body': body,
+    }
+
+def group_messages(messages, settings):
+    """Batches to deliver: digest targets grouped by endpoint, others alone."""
+    digest_targets = set(settings['digest_targets'])
+    batches = []
+    groups = {}
+    for message in messages:
+        if message['target'] in digest_targets:
+            groups.setdefault((message['target'], message['job']['url']), []).append(message)
+        else:
+            batches.append([message])
+    batches.extend(groups.values())
+    return batches
+
+def record_result(conn, batch, result, settings, engine, now):
+    ids = [m['id'] for m in batch]
+    marks = ",".join("?" * len(ids))
+    if result['ok']:
+        conn.execute(
+            f"UPDATE outbox SET status = 'delivered', delivered_at = ?, attempts = attempts + 1,"
+            f" last_error = NULL WHERE id IN ({marks})", [now] + ids)
+        return
+
+    attempts = max(m['attempts'] for m in batch) + 1
+    # Sent but unanswered: it may have been applied, so only an explicit retry re-sends it
+    if attempts >= settings['max_attempts'] or not result.get('retryable', True):
+        conn.execute(
+            f"UPDATE outbox SET status = 'failed', attempts = attempts + 1, last_error = ?"
+            f" WHERE id IN ({marks})", [result['error']] + ids)
+    else:
+        delay = backoff_delay(attempts - 1, engine['backoff_base_seconds'], engine['backoff_max_seconds'])
+        conn.execute(
+            f"UPDATE outbox SET attempts = attempts + 1, last_error = ?, next_attempt_at = ?"
+            f" WHERE id IN ({marks})", [result['error'], now + delay] + ids)
+
+async def drain_once(conn, config, settings, pool, limiters):
+    """Deliver everything currently due. Returns number of messages attempted."""
+    now = time.time()
+    messages = due_messages(conn, settings, now)
+    if not messages:
+        return 0
+
+    dispatch_cfg = config.get('dispatch') or {}
+    engine = target_policy(config.get('engine') or {}, {})
+
+    async def send(batch):
+        target = batch[0]['target']
+        settings_for_target = dispatch_cfg.get(target) or {}
+        job = digest_job(target, [m['job'] for m in batch]) if len(batch) > 1 else dict(batch[0]['job'])
+        job['headers'] = job_headers(settings_for_target)
+
+        # The outbox owns retries (persisted across restarts); one try per cycle
+        policy = target_policy(config.get('engine') or {}, settings_for_target)
+        policy['max_retries'] = 0
+        if target not in limiters:
+            limiters[target] = RateLimiter(settings_for_target.get('rate_limit_per_second'),
+                                           settings_for_target.get('burst', 1))
+        result = await deliver(pool, limiters[target], job, policy)
+        label = job['summary'][:60]
+        if result['ok']:
+            print(f"  ✓ {target}: {label} ({len(batch)} message(s))")
+        else:
+            print(f"  ⚠️  {target}: {label} - {result['error']}")
+        return batch, result
+
+    results = await asyncio.gather(*(send(batch) for batch in group_messages(messages, settings)))
+
+    done = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    for batch, result in results:
+        record_result(conn, batch, result, settings, engine, done)
+    conn.execute("COMMIT")
+    return len(messages)
+
+def pending_count(conn):
+    return conn.execute("SELECT COUNT(*) FROM outbox WHERE status = 'pending'").fetchone()[0]
+
+async def drain(config, once=False):
+    """Drain until the outbox has no pending messages (or one pass if once)."""
+    settings = outbox_settings(config)
+    conn = connect(settings['path'])
+    pool = ConnectionPool((config.get('engine') or {}).get('max_connections_per_host', 4))
+    limiters = {}
+    try:
+        while True:
+            await drain_once(conn, config, settings, pool, limiters)
+            if once or pending_count(conn) == 0:
+                break
+            await asyncio.sleep(settings['poll_interval_seconds'])
+    finally:
+        await pool.close()
+        conn.close()
+
+def acquire_worker_lock(db_path):
+    """
+    Exclusive lock so only one drain worker delivers at a time.
+
+    Blocking on purpose: a worker spawned while another is finishing waits
+    and then drains anything enqueued after the other's last check.
+    """
+    lock = open(f"{db_path}.lock", 'w')
+    fcntl.flock(lock, fcntl.LOCK_EX)
+    return lock
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def show_status(config):
+    settings = outbox_settings(config)
+    if not os.path.exists(settings['path']):
+        print(f"Outbox empty (no database at {settings['path']})")
+        return
+    conn = connect(settings['path'])
+    print(f"Outbox: {settings['path']}")
+    for status, count in conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status ORDER BY status"):
+        print(f"  {status}: {count}")
+    failed = conn.execute(
+        "SELECT key, attempts, last_error FROM outbox WHERE status = 'failed' ORDER BY id").fetchall()
+    if failed:
+        print()
+        print("Failed (retry with: outbox.py retry <key>):")
+        for key, attempts, error in failed:
+            print(f"  ❌ {key} (attempts: {attempts}) - {error}")
+    conn.close()
+
+def retry_failed(config, key):
+    settings = outbox_settings(config)
+    conn = connect(settings['path'])
+    if key == '--all-failed':
+        cursor = conn.execute(
+            "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = ? WHERE status = 'failed'",
+            (time.time(),))
+    else:
+        cursor = conn.execute(
+            "UPDATE outbox SET status = 'pending', attempts = 0, next_attempt_at = ? WHERE key = ? AND status = 'failed'",
+            (time.time(), key))
+    print(f"✓ Requeued {cursor.rowcount} message(s)")
+    conn.close()
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in ('drain', 'status', 'retry'):
+        print("Usage: outbox.py drain [--once]")
+        print("       outbox.py status")
+        print("       outbox.py retry <key|--all-failed>")
+        sys.exit(1)
+
+    args = sys.argv[1:]
+    config_file = CONFIG_FILE
+    if '--config' in args:
+        i = args.index('--config')
+        config_file = args[i + 1]
+        del args[i:i + 2]
+
+    config = load_yaml(config_file)
+    action = args[0]
+
+    if action == 'status':
+        show_status(config)
+    elif action == 'retry':
+        if len(args) < 2:
+            print("Usage: outbox.py retry <key|--all-failed>")
+            sys.exit(1)
+        retry_failed(config, args[1])
+    else:
+        settings = outbox_settings(config)
+        lock = acquire_worker_lock(settings['path'])
+        print(f"[{time.strftime('%Y-%m-%dT%H:%M:%S')}] Draining outbox {settings['path']}")
+        asyncio.run(drain(config, once='--once' in args))
+        lock.close()
+
+if __name__ == '__main__':
+    main()
@@ -41,87 +41,7 @@ if [ ! -f "$CONFIG" ]; then
     exit 1
 fi
 
-# Check if Phase 6 is enabled
-PHASE6_ENABLED=$(grep "^enabled:" "$CONFIG" | awk '{print $2}')
-if [ "$PHASE6_ENABLED" != "true" ]; then
-    echo "ℹ️  Phase 6 disabled in config"
-    exit 0
-fi
-
-# Verify finalization status
-APPROVAL_STATUS=$(grep -A 2 "^approval:" "$REVIEW_RECORD" | grep "status:" | awk '{print $2}' | tr -d '#' | head -1)
-
-if [ "$APPROVAL_STATUS" != "FINALIZED" ]; then
-    echo "⚠️  Incident $INCIDENT_ID not finalized (status: $APPROVAL_STATUS)"
-    echo "   Phase 6 only processes FINALIZED incidents"
-    exit 0
-fi
-
-echo "✓ Incident $INCIDENT_ID is finalized"
-echo
-
-# Extract decision type to determine dispatch rules
-DECISION_TYPE=$(grep -A 1 "^decision:" "$IKR" | grep "type:" | awk '{print $2}' | tr -d '#' | head -1)
-echo "Decision type: $DECISION_TYPE"
-echo
-
-# Determine which dispatchers to run based on decision type
-DISPATCHERS=()
-
-case "$DECISION_TYPE" in
-    ACCEPTED)
-        DISPATCHERS=(slack)
-        ;;
-    MODIFIED)
-        DISPATCHERS=(jira slack)
-        ;;
-    REJECTED)
-        DISPATCHERS=(slack)
-        ;;
-    *)
-        echo "⚠️  Unknown decision type: $DECISION_TYPE"
-        exit 1
-        ;;
-esac
-
-echo "Dispatchers to run: ${DISPATCHERS[@]}"
-echo
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-echo
-
-# Execute dispatchers
-DISPATCHER_DIR="adapters/operational-integration/dispatchers"
-
-for dispatcher in "${DISPATCHERS[@]}"; do
-    DISPATCHER_SCRIPT="$DISPATCHER_DIR/${dispatcher}.sh"
-    
-    if [ ! -f "$DISPATCHER_SCRIPT" ]; then
-        echo "⚠️  Dispatcher not found: $DISPATCHER_SCRIPT"
-        continue
-    fi
-    
-    echo "Running dispatcher: $dispatcher"
-    echo "─────────────────────────────────────────────────────────────"
-    
-    chmod +x "$DISPATCHER_SCRIPT"
-    
-    if bash "$DISPATCHER_SCRIPT" "$INCIDENT_ID" "$REVIEW_RECORD" "$IKR" "$CONFIG"; then
-        echo "✓ $dispatcher dispatcher completed"
-    else
-        echo "⚠️  $dispatcher dispatcher failed (non-fatal)"
-    fi
-    
-    echo
-done
-
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-echo "✅ Phase 6 Complete"
-echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-echo
-echo "Summary:"
-echo "  • Incident: $INCIDENT_ID"
-echo "  • Decision: $DECISION_TYPE"
-echo "  • Dispatchers executed: ${#DISPATCHERS[@]}"
-echo
-echo "Note: Phase 6 is read-only and does not influence reasoning"
-echo "      Removing Phase 6 changes nothing upstream"
+# Enabled check, finalization, rules.on_decision and all dispatch targets
+# are handled by the engine (review record and IKR are parsed once)
+python3 adapters/operational-integration/dispatch.py "$INCIDENT_ID" \
+    --review-record "$REVIEW_RECORD" --ikr "$IKR" --config "$CONFIG"
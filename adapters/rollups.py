@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Multi-Resolution Signal Rollups
+Per-signal time-bucket histograms emitted by evidence adapters next to the
+aggregated signals, so timeline and burst questions never re-read raw logs.
+
+Contract (adapter output key "rollups"):
+    {
+      "resolutions": {"1s": 1, "1m": 60, "1h": 3600},
+      "signals": {
+        "<event>/<severity>/<component>": {
+          "1m": {"start": "2015-03-16T23:17:00Z", "counts": [3, 0, 12]},
+          "1s": {"start": "...", "offsets": [0, 9041], "counts": [1, 4]},
+          ...
+        }
+      }
+    }
+
+A rollup is dense ("counts" only, one slot per bucket from "start") unless
+that would exceed MAX_DENSE_BUCKETS, in which case it is sparse: "offsets"
+are bucket indexes from "start" and "counts" holds the matching non-zero
+counts. Buckets are aligned to the epoch, so 1m buckets start on the minute.
+
+Usage:
+    rollups.py bursts <adapter_output.json> [--resolution 1m] [--factor 3]
+"""
+
+import calendar
+import json
+import sys
+import time
+from array import array
+from collections import Counter
+
+RESOLUTIONS = {"1s": 1, "1m": 60, "1h": 3600}
+MAX_DENSE_BUCKETS = 4096
+BURST_FACTOR = 3.0
+
+def signal_key(event, severity, component):
+    return f"{event}/{severity}/{component}"
+
+def to_epoch(timestamp):
+    """ISO-8601 UTC ("2015-03-16T23:17:42Z") -> epoch seconds."""
+    return calendar.timegm(time.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ"))
+
+def to_iso(epoch):
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+# ============================================================================
+# BUILDING
+# ============================================================================
+
+def _rollup(seconds, bucket_seconds):
+    """One resolution from a Counter of epoch second -> count."""
+    buckets = Counter()
+    for second, count in seconds.items():
+        buckets[second // bucket_seconds] += count
+
+    first = min(buckets)
+    span = max(buckets) - first + 1
+    rollup = {"start": to_iso(first * bucket_seconds)}
+
+    if span <= MAX_DENSE_BUCKETS:
+        counts = array("L", [0]) * span
+        for bucket, count in buckets.items():
+            counts[bucket - first] = count
+        rollup["counts"] = counts.tolist()
+    else:
+        ordered = sorted(buckets)
+        rollup["offsets"] = array("L", (b - first for b in ordered)).tolist()
+        rollup["counts"] = array("L", (buckets[b] for b in ordered)).tolist()
+    return rollup
+
+class RollupAccumulator:
+    """Streaming per-signal second counts; result() renders every resolution."""
+
+    def __init__(self, resolutions=RESOLUTIONS):
+        self.resolutions = dict(resolutions)
+        self.epochs = {}  # Timestamps repeat heavily; parse each distinct one once
+        self.per_signal = {}
+
+    def epoch(self, timestamp):
+        epoch = self.epochs.get(timestamp)
+        if epoch is None:
+            epoch = self.epochs[timestamp] = to_epoch(timestamp)
+        return epoch
+
+    def series(self, key):
+        """Epoch second -> count Counter of one signal (callers may hold on to it)."""
+        seconds = self.per_signal.get(key)
+        if seconds is None:
+            seconds = self.per_signal[key] = Counter()
+        return seconds
+
+    def add(self, key, timestamp):
+        self.series(key)[self.epoch(timestamp)] += 1
+
+    def result(self):
+        """{"resolutions": {...}, "signals": {key: {resolution: rollup}}}"""
+        return {
+            "resolutions": dict(self.resolutions),
+            "signals": {
+                key: {name: _rollup(seconds, size) for name, size in self.resolutions.items()}
+                for key, seconds in sorted(self.per_signal.items())
+            },
+        }
+
+def build_rollups(events, resolutions=RESOLUTIONS):
+    """Rollups for contract events (dicts with timestamp/event_type/severity/component)."""
+    accumulator = RollupAccumulator(resolutions)
+    for event in events:
+        accumulator.add(signal_key(event["event_type"], event["severity"], event["component"]),
+                        event["timestamp"])
+    return accumulator.result()
+
+# ============================================================================
+# QUERYING
+# ============================================================================
+
+def buckets(rollup, bucket_seconds):
+    """Non-zero buckets as [(bucket_start_epoch, count)], in time order."""
+    start = to_epoch(rollup["start"])
+    offsets = rollup.get("offsets") or range(len(rollup["counts"]))
+    return [(start + offset * bucket_seconds, count)
+            for offset, count in zip(offsets, rollup["counts"]) if count]
+
+def bursts(rollup, bucket_seconds, factor=BURST_FACTOR):
+    """
+    Buckets whose count exceeds `factor` x the mean over the rollup's span
+    (and at least 2 events).
+
+    Returns: [(bucket_start_iso, count)]
+    """
+    counts = rollup["counts"]
+    span = rollup["offsets"][-1] + 1 if rollup.get("offsets") else len(counts)
+    mean = sum(counts) / span if span else 0
+    threshold = max(2, factor * mean)
+    return [(to_iso(epoch), count) for epoch, count in buckets(rollup, bucket_seconds)
+            if count >= threshold]
+
+def counts_at(rollup, bucket_seconds, epochs):
+    """Event count in the bucket containing each epoch (0 outside the rollup)."""
+    start = to_epoch(rollup["start"])
+    if rollup.get("offsets"):
+        lookup = dict(zip(rollup["offsets"], rollup["counts"]))
+    else:
+        lookup = dict(enumerate(rollup["counts"]))
+    return [lookup.get((epoch - start) // bucket_seconds, 0) if epoch >= start else 0
+            for epoch in epochs]
+
+def align_to_metrics(rollup, bucket_seconds, metric_timestamps):
+    """
+    Counts aligned to a metrics.json "timestamp" series ("HH:MM" or
+    "HH:MM:SS"), with clock times resolved on the rollup's start date.
+    """
+    day = to_epoch(rollup["start"]) // 86400 * 86400
+    epochs = []
+    for clock in metric_timestamps:
+        parts = [int(p) for p in clock.split(":")] + [0]
+        epochs.append(day + parts[0] * 3600 + parts[1] * 60 + parts[2])
+    return counts_at(rollup, bucket_seconds, epochs)
+
+def main():
+    args = sys.argv[1:]
+    if len(args) < 2 or args[0] != "bursts":
+        print("Usage: rollups.py bursts <adapter_output.json> [--resolution 1m] [--factor 3]")
+        sys.exit(1)
+
+    resolution = args[args.index("--resolution") + 1] if "--resolution" in args else "1m"
+    factor = float(args[args.index("--factor") + 1]) if "--factor" in args else BURST_FACTOR
+
+    with open(args[1], "r") as f:
+        rollups = json.load(f).get("rollups")
+    if not rollups:
+        print(f"❌ No rollups in {args[1]} (adapter output predates rollups)")
+        sys.exit(1)
+    if resolution not in rollups["resolutions"]:
+        print(f"❌ Unknown resolution: {resolution} (available: {', '.join(rollups['resolutions'])})")
+        sys.exit(1)
+
+    bucket_seconds = rollups["resolutions"][resolution]
+    for key, per_resolution in rollups["signals"].items():
+        found = bursts(per_resolution[resolution], bucket_seconds, factor)
+        if found:
+            print(f"{key}:")
+            for start, count in found:
+                print(f"  {start}  {count}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unclassified Message Sketches
+Bounded-memory view of the lines an adapter could not classify, so a new
+message shape flooding the logs shows up in the same pass that drops it.
+
+Each unclassified message is reduced to a cheap template (every token that
+starts with a digit - counts, ids, addresses, hex - becomes "<*>") and
+counted twice:
+  - Space-Saving top-k (TOP_K entries): which templates are heavy hitters,
+    with a guaranteed lower bound (count - error)
+  - Count-Min sketch (CM_DEPTH x CM_WIDTH counters): an independent upper
+    bound, used to tighten the Space-Saving estimate
+
+Memory is fixed (about 32 KB of counters plus TOP_K templates) whatever
+the log size. Hashing is crc32/adler32, so results are reproducible.
+
+Contract (adapter output key quality.unclassified):
+    {
+      "events": 1834,
+      "top_templates": [
+        {"template": "PacketResponder <*> for block blk_<*> terminating",
+         "count": 311, "min_count": 298},
+        ...
+      ]
+    }
+"""
+
+import re
+import zlib
+from array import array
+
+TOP_K = 32
+REPORTED_TEMPLATES = 10
+CM_WIDTH = 1024
+CM_DEPTH = 4
+MAX_TEMPLATE_CHARS = 160
+SLOT_CACHE = 256
+
+# "blk_1073741829" -> "blk_<*>", "10.0.0.5:50010" -> "<*>", "0x1f" -> "<*>"
+TEMPLATE_VARIABLE = re.compile(r'\d[\w.:/-]*')
+
+def template(message):
+    """Message -> template with variable parts masked ("took 42 ms" -> "took <*> ms")."""
+    return TEMPLATE_VARIABLE.sub('<*>', message[:MAX_TEMPLATE_CHARS])
+
+class CountMinSketch:
+    """Approximate counts that never undercount (error ~ total / width per row)."""
+
+    def __init__(self, width=CM_WIDTH, depth=CM_DEPTH):
+        self.width = width
+        self.rows = [array('Q', [0]) * width for _ in range(depth)]
+        self.slot_cache = {}  # Heavy templates repeat: hash each one once
+
+    def _slots(self, key):
+        slots = self.slot_cache.get(key)
+        if slots is None:
+            data = key.encode('utf-8', errors='replace')
+            h1 = zlib.crc32(data)
+            h2 = zlib.adler32(data) | 1
+            slots = [(h1 + i * h2) % self.width for i in range(len(self.rows))]
+            if len(self.slot_cache) >= SLOT_CACHE:
+                self.slot_cache.clear()
+            self.slot_cache[key] = slots
+        return slots
+
+    def add(self, key, count=1):
+        for row, slot in zip(self.rows, self._slots(key)):
+            row[slot] += count
+
+    def estimate(self, key):
+        return min(row[slot] for row, slot in zip(self.rows, self._slots(key)))
+
+class SpaceSaving:
+    """Top-k heavy hitters: {key: [count, error]}, the minimum is evicted when full."""
+
+    def __init__(self, k=TOP_K):
+        self.k = k
+        self.entries = {}
+
+    def add(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry[0] += 1
+            return
+        if len(self.entries) < self.k:
+            self.entries[key] = [1, 0]
+            return
+        # Replace the smallest entry; its count becomes the newcomer's error
+        victim = min(self.entries, key=lambda k: self.entries[k][0])
+        floor = self.entries.pop(victim)[0]
+        self.entries[key] = [floor + 1, floor]
+
+class UnclassifiedSketch:
+    """Templates of unclassified messages: Space-Saving top-k checked against Count-Min."""
+
+    def __init__(self):
+        self.events = 0
+        self.top = SpaceSaving()
+        self.counts = CountMinSketch()
+
+    def add(self, message):
+        key = template(message)
+        self.events += 1
+        self.top.add(key)
+        self.counts.add(key)
+
+    def result(self, limit=REPORTED_TEMPLATES):
+        """Heaviest templates first, with approximate and guaranteed counts."""
+        templates = []
+        for key, (count, error) in self.top.entries.items():
+            templates.append({
+                'template': key,
+                'count': min(count, self.counts.estimate(key)),
+                'min_count': count - error,
+            })
+        templates.sort(key=lambda t: (-t['count'], t['template']))
+        return {'events': self.events, 'top_templates': templates[:limit]}
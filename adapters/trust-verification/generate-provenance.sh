@@ -14,8 +14,11 @@ fi
 
 # Locate artifacts
 INCIDENT_BUNDLE="reports/incident-bundle-${INCIDENT_ID}.json"
+if [ ! -f "$INCIDENT_BUNDLE" ] && [ -f "reports/incident-bundle-${INCIDENT_ID}.jsonl.gz" ]; then
+    INCIDENT_BUNDLE="reports/incident-bundle-${INCIDENT_ID}.jsonl.gz"
+fi
 SCOPE_AUDIT="reports/scope-audit-${INCIDENT_ID}.json"
-POSTMORTEM="reports/post-mortem-${INCIDENT_ID}.md"
+POSTMORTEM="reports/postmortem-${INCIDENT_ID}.md"
 REVIEW_RECORD="reports/review-record-${INCIDENT_ID}.yaml"
 IKR="incidents/${INCIDENT_ID}.yaml"
 REASONING_MANIFEST="phase7/trust/reasoning-manifest.json"
@@ -30,7 +33,7 @@ MISSING=()
 [ ! -f "$SCOPE_AUDIT" ] && MISSING+=("scope_audit")
 [ ! -f "$POSTMORTEM" ] && MISSING+=("postmortem")
 [ ! -f "$REVIEW_RECORD" ] && MISSING+=("review_record")
-[ ! -f "$IKR" ] && MISSING+=("ikr")
+[ ! -f "$IKR" ] && MISSING+=("incident_knowledge_record")
 [ ! -f "$REASONING_MANIFEST" ] && MISSING+=("reasoning_manifest")
 
 if [ ${#MISSING[@]} -gt 0 ]; then
@@ -39,26 +42,26 @@ if [ ${#MISSING[@]} -gt 0 ]; then
 fi
 
 # Compute hashes
-python3 - "$OUTPUT_FILE" "$INCIDENT_ID" <<'GENERATE_PROVENANCE'
+python3 - "$OUTPUT_FILE" "$INCIDENT_ID" "$INCIDENT_BUNDLE" <<'GENERATE_PROVENANCE'
 import sys
 import json
-import hashlib
 from datetime import datetime
 import os
 
+sys.path.insert(0, "adapters/trust-verification")
+sys.path.insert(0, "incidents")
+from atomic import atomic_open
+from merkle import HashCache, build_tree, incident_artifacts
+
+hash_cache = HashCache()
+
 def compute_hash(file_path):
-    """Compute SHA-256 hash of file"""
-    if not os.path.exists(file_path):
-        return None
-    
-    sha256 = hashlib.sha256()
-    with open(file_path, 'rb') as f:
-        for chunk in iter(lambda: f.read(4096), b''):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    """SHA-256 of file via the hash cache (None if missing)"""
+    return hash_cache.digest(file_path)
 
 output_file = sys.argv[1]
 incident_id = sys.argv[2]
+incident_bundle = sys.argv[3]
 
 # Load reasoning manifest
 manifest_path = "phase7/trust/reasoning-manifest.json"
@@ -69,26 +72,18 @@ if os.path.exists(manifest_path):
 else:
     sherlock_version = '1.0.0'
 
-# Compute artifact hashes
-artifacts = {
-    "incident_bundle": f"reports/incident-bundle-{incident_id}.json",
-    "scope_audit": f"reports/scope-audit-{incident_id}.json",
-    "postmortem": f"reports/post-mortem-{incident_id}.md",
-    "review_record": f"reports/review-record-{incident_id}.yaml",
-    "ikr": f"incidents/{incident_id}.yaml"
-}
+# Compute artifact hashes (same leaf names as merkle.py and phase7.sh,
+# so both tools derive the same root for the same artifacts)
+artifacts = incident_artifacts(incident_id)
+artifacts["incident_bundle"] = incident_bundle
 
-hashes = {}
-for name, path in artifacts.items():
-    hash_val = compute_hash(path)
-    if hash_val:
-        hashes[name] = f"sha256:{hash_val}"
-    else:
-        hashes[name] = None
+# Merkle tree over all artifacts (only changed files are rehashed)
+tree = build_tree(artifacts, hash_cache)
+hashes = tree["artifacts"]
 
 # Determine executed phases
 executed_phases = [1, 2, 3, 4, 5]
-if hashes["ikr"]:
+if hashes["incident_knowledge_record"]:
     executed_phases.append(5)  # Phase 5 completed
 if os.path.exists("phase6/phase6.sh"):
     executed_phases.append(6)  # Phase 6 available
@@ -101,6 +96,12 @@ provenance = {
     
     "artifacts": hashes,
     
+    "merkle_root": tree["root"],
+    "merkle_tree": {
+        "algorithm": tree["algorithm"],
+        "leaves": tree["leaves"]
+    },
+    
     "executed_phases": executed_phases,
     
     "reasoning_manifest_hash": f"sha256:{compute_hash(manifest_path)}" if os.path.exists(manifest_path) else None,
@@ -113,13 +114,16 @@ provenance = {
 }
 
 # Write provenance
-with open(output_file, 'w') as f:
+with atomic_open(output_file) as f:
     json.dump(provenance, f, indent=2)
 
+hash_cache.save()
+
 print(f"✓ Provenance record generated: {output_file}")
 print(f"  • Incident: {incident_id}")
 print(f"  • Sherlock version: {sherlock_version}")
-print(f"  • Artifacts hashed: {sum(1 for h in hashes.values() if h)}/{len(hashes)}")
+print(f"  • Artifacts hashed: {sum(1 for h in hashes.values() if h)}/{len(hashes)} ({hash_cache.rehashed} rehashed)")
+print(f"  • Merkle root: {tree['root']}")
 print(f"  • Phases executed: {executed_phases}")
 print()
 print("This provenance record proves:")
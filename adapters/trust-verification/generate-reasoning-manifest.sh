@@ -39,6 +39,9 @@ import sys
 import json
 from datetime import datetime
 
+sys.path.insert(0, "incidents")
+from atomic import atomic_open
+
 output_file = sys.argv[1]
 sherlock_version = sys.argv[2]
 prompt_hash = sys.argv[3]
@@ -96,7 +99,7 @@ manifest = {
 }
 
 # Write manifest
-with open(output_file, 'w') as f:
+with atomic_open(output_file) as f:
     json.dump(manifest, f, indent=2)
 
 print(f"✓ Reasoning manifest generated: {output_file}")
@@ -34,6 +34,9 @@ import sys
 import json
 from datetime import datetime
 
+sys.path.insert(0, "incidents")
+from atomic import atomic_open
+
 output_file = sys.argv[1]
 incident_id = sys.argv[2]
 provenance_file = sys.argv[3]
@@ -240,7 +243,7 @@ Very few incident analysis systems provide this level of assurance.
 """
 
 # Write report
-with open(output_file, 'w') as f:
+with atomic_open(output_file) as f:
     f.write(report)
 
 print(f"✓ Trust report generated: {output_file}")
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Phase 7: Incremental Merkle Provenance
+Builds a Merkle tree over an incident's artifacts so the whole incident
+is bound by a single root hash.
+
+Hash cache: adapters/trust-verification/.hash-cache.json
+  - Keyed by artifact path, entry stores (inode, size, mtime_ns, sha256)
+  - A file is only re-read when any of those stat fields change
+  - Large files are hashed via mmap, small files with one large read
+
+Tree layout (domain-separated, so a leaf can never be mistaken for a node):
+  leaf = sha256(0x00 || name || 0x00 || file_sha256 | "missing")
+  node = sha256(0x01 || left || right)   (odd node is promoted unchanged)
+Leaves are ordered by artifact name.
+
+Usage:
+    merkle.py build <incident_id>        # JSON: root, per-artifact hashes
+    merkle.py verify <provenance_file>   # Recompute (no cache) and compare root
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "incidents"))
+from batch import read_cache, write_cache  # noqa: E402
+
+CACHE_FILE = Path("adapters/trust-verification/.hash-cache.json")
+CACHE_VERSION = 1
+
+# Files at or above this size are hashed through mmap
+MMAP_THRESHOLD = 1024 * 1024
+READ_BUFFER = 1024 * 1024
+
+def incident_artifacts(incident_id):
+    """Artifacts bound into an incident's provenance (name -> path)."""
+    bundle = f"reports/incident-bundle-{incident_id}.json"
+    if not os.path.exists(bundle) and os.path.exists(f"reports/incident-bundle-{incident_id}.jsonl.gz"):
+        bundle = f"reports/incident-bundle-{incident_id}.jsonl.gz"
+    return {
+        "incident_bundle": bundle,
+        "scope_audit": f"reports/scope-audit-{incident_id}.json",
+        "postmortem": f"reports/postmortem-{incident_id}.md",
+        "review_record": f"reports/review-record-{incident_id}.yaml",
+        "incident_knowledge_record": f"incidents/{incident_id}.yaml",
+    }
+
+# ============================================================================
+# FILE HASHING
+# ============================================================================
+
+def hash_file(file_path, size=None):
+    """SHA-256 hex digest of a file (mmap for large files)."""
+    sha256 = hashlib.sha256()
+    if size is None:
+        size = os.path.getsize(file_path)
+
+    with open(file_path, 'rb') as f:
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                sha256.update(mapped)
+        else:
+            for chunk in iter(lambda: f.read(READ_BUFFER), b''):
+                sha256.update(chunk)
+
+    return sha256.hexdigest()
+
+class HashCache:
+    """(path, inode, size, mtime) -> sha256 cache backed by a JSON file."""
+
+    def __init__(self, cache_file=CACHE_FILE):
+        self.cache_file = Path(cache_file)
+        self.entries = read_cache(self.cache_file, CACHE_VERSION, 'files')
+        self.dirty = False
+        self.rehashed = 0
+
+    def digest(self, file_path):
+        """Hex digest for file_path, or None if it does not exist."""
+        key = str(file_path)
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            if self.entries.pop(key, None) is not None:
+                self.dirty = True
+            return None
+
+        entry = self.entries.get(key)
+        if (entry and entry['inode'] == stat.st_ino and entry['size'] == stat.st_size
+                and entry['mtime_ns'] == stat.st_mtime_ns):
+            return entry['sha256']
+
+        digest = hash_file(file_path, stat.st_size)
+        self.entries[key] = {
+            'inode': stat.st_ino,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': digest,
+        }
+        self.dirty = True
+        self.rehashed += 1
+        return digest
+
+    def save(self):
+        if self.dirty:
+            write_cache(self.cache_file, CACHE_VERSION, 'files', self.entries, indent=2, sort_keys=True)
+            self.dirty = False
+
+# ============================================================================
+# MERKLE TREE
+# ============================================================================
+
+def leaf_hash(name, file_digest):
+    sha256 = hashlib.sha256(b'\x00')
+    sha256.update(name.encode())
+    sha256.update(b'\x00')
+    sha256.update((file_digest or 'missing').encode())
+    return sha256.digest()
+
+def node_hash(left, right):
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+def merkle_root(leaves):
+    """Root over a list of leaf digests (bytes)."""
+    if not leaves:
+        return hashlib.sha256(b'').digest()
+    level = list(leaves)
+    while len(level) > 1:
+        paired = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+def build_tree(artifacts, cache=None):
+    """
+    Build the provenance Merkle tree for {name: path} artifacts.
+
+    Pass cache=None to hash every file from disk (used by verification).
+
+    Returns: {"algorithm", "root", "artifacts": {name: "sha256:..." | None},
+              "leaves": [...], "rehashed": int}
+    """
+    hashes = {}
+    leaves = []
+    rehashed = 0
+
+    for name in sorted(artifacts):
+        path = artifacts[name]
+        if cache is not None:
+            digest = cache.digest(path)
+        elif os.path.exists(path):
+            digest = hash_file(path)
+            rehashed += 1
+        else:
+            digest = None
+
+        hashes[name] = f"sha256:{digest}" if digest else None
+        leaves.append({'name': name, 'path': str(path), 'leaf': leaf_hash(name, digest).hex()})
+
+    root = merkle_root([bytes.fromhex(leaf['leaf']) for leaf in leaves])
+
+    return {
+        'algorithm': 'sha256',
+        'root': f"sha256:{root.hex()}",
+        'artifacts': hashes,
+        'leaves': leaves,
+        'rehashed': cache.rehashed if cache is not None else rehashed,
+    }
+
+def build_incident_tree(incident_id, cache_file=CACHE_FILE):
+    """Build an incident's tree, reusing cached hashes of unchanged files."""
+    cache = HashCache(cache_file)
+    tree = build_tree(incident_artifacts(incident_id), cache)
+    cache.save()
+    return tree
+
+def verify_provenance(provenance):
+    """
+    Recompute the Merkle root from disk (no cache) and compare.
+
+    Returns: (ok, expected_root, actual_root)
+    """
+    tree_info = provenance.get('merkle_tree', {})
+    artifacts = {leaf['name']: leaf['path'] for leaf in tree_info.get('leaves', [])}
+    if not artifacts:
+        artifacts = incident_artifacts(provenance['incident_id'])
+
+    expected = provenance.get('merkle_root')
+    actual = build_tree(artifacts)['root']
+    return expected == actual, expected, actual
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in ('build', 'verify'):
+        print("Usage: merkle.py build <incident_id>")
+        print("       merkle.py verify <provenance_file>")
+        sys.exit(1)
+
+    if sys.argv[1] == 'build':
+        print(json.dumps(build_incident_tree(sys.argv[2]), indent=2))
+        return
+
+    with open(sys.argv[2], 'r') as f:
+        provenance = json.load(f)
+
+    ok, expected, actual = verify_provenance(provenance)
+    if expected is None:
+        print(f"⚠️  No merkle_root in {sys.argv[2]} (generated before Merkle provenance)")
+        sys.exit(1)
+    if ok:
+        print(f"✓ Provenance verified: {expected}")
+    else:
+        print("❌ PROVENANCE MISMATCH")
+        print(f"   Recorded: {expected}")
+        print(f"   Computed: {actual}")
+        print("   One or more artifacts changed since provenance was generated")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -16,7 +16,7 @@ fi
 # Locate artifacts
 REVIEW_RECORD="reports/review-record-${INCIDENT_ID}.yaml"
 IKR="incidents/${INCIDENT_ID}.yaml"
-POST_MORTEM="reports/post-mortem-${INCIDENT_ID}.md"
+POST_MORTEM="reports/postmortem-${INCIDENT_ID}.md"
 INCIDENT_BUNDLE="reports/incident-bundle-${INCIDENT_ID}.json"
 SCOPE_AUDIT="reports/scope-audit-${INCIDENT_ID}.json"
 REASONING_MANIFEST="adapters/trust-verification/reasoning-manifest.json"
@@ -63,17 +63,32 @@ echo
 echo "Computing cryptographic hashes..."
 echo "─────────────────────────────────────────────────────────────"
 
-INCIDENT_BUNDLE_HASH=$(shasum -a 256 "$INCIDENT_BUNDLE" 2>/dev/null | awk '{print $1}' || echo "not_found")
-SCOPE_AUDIT_HASH=$(shasum -a 256 "$SCOPE_AUDIT" 2>/dev/null | awk '{print $1}' || echo "not_found")
-POST_MORTEM_HASH=$(shasum -a 256 "$POST_MORTEM" 2>/dev/null | awk '{print $1}' || echo "not_found")
-REVIEW_RECORD_HASH=$(shasum -a 256 "$REVIEW_RECORD" | awk '{print $1}')
-IKR_HASH=$(shasum -a 256 "$IKR" | awk '{print $1}')
-
-echo "✓ Incident Bundle:   sha256:${INCIDENT_BUNDLE_HASH:0:16}..."
-echo "✓ Scope Audit:       sha256:${SCOPE_AUDIT_HASH:0:16}..."
-echo "✓ Post-Mortem:       sha256:${POST_MORTEM_HASH:0:16}..."
-echo "✓ Review Record:     sha256:${REVIEW_RECORD_HASH:0:16}..."
-echo "✓ IKR:               sha256:${IKR_HASH:0:16}..."
+# Merkle tree over all artifacts; unchanged files come from the hash cache
+MERKLE_TREE=$(python3 adapters/trust-verification/merkle.py build "$INCIDENT_ID")
+export MERKLE_TREE
+
+python3 - <<'SHOW_HASHES'
+import json
+import os
+
+tree = json.loads(os.environ['MERKLE_TREE'])
+labels = {
+    "incident_bundle": "Incident Bundle:",
+    "scope_audit": "Scope Audit:",
+    "postmortem": "Post-Mortem:",
+    "review_record": "Review Record:",
+    "incident_knowledge_record": "IKR:",
+}
+for name, label in labels.items():
+    digest = tree['artifacts'].get(name)
+    if digest:
+        print(f"✓ {label:<18} {digest[:23]}...")
+    else:
+        print(f"⚠️  {label:<17} not_found")
+print()
+print(f"✓ Merkle root:       {tree['root']}")
+print(f"  ({tree['rehashed']} artifact(s) rehashed, others unchanged since last run)")
+SHOW_HASHES
 echo
 
 # Step 3: Generate Provenance Record
@@ -87,6 +102,9 @@ import sys
 import json
 from datetime import datetime
 
+sys.path.insert(0, "incidents")
+from atomic import atomic_open
+
 incident_id = sys.argv[1]
 reasoning_manifest_path = sys.argv[2]
 output_path = sys.argv[3]
@@ -95,13 +113,9 @@ output_path = sys.argv[3]
 with open(reasoning_manifest_path, 'r') as f:
     manifest = json.load(f)
 
-# Load environment variables for hashes
+# Merkle tree computed in Step 2
 import os
-incident_bundle_hash = os.getenv('INCIDENT_BUNDLE_HASH', 'not_found')
-scope_audit_hash = os.getenv('SCOPE_AUDIT_HASH', 'not_found')
-post_mortem_hash = os.getenv('POST_MORTEM_HASH', 'not_found')
-review_record_hash = os.getenv('REVIEW_RECORD_HASH', 'not_found')
-ikr_hash = os.getenv('IKR_HASH', 'not_found')
+tree = json.loads(os.environ['MERKLE_TREE'])
 
 provenance = {
     "incident_id": incident_id,
@@ -113,11 +127,13 @@ provenance = {
         "hash": manifest["reasoning_protocol"]["protocol_hash"]
     },
     "artifacts": {
-        "incident_bundle": f"sha256:{incident_bundle_hash}",
-        "scope_audit": f"sha256:{scope_audit_hash}",
-        "postmortem": f"sha256:{post_mortem_hash}",
-        "review_record": f"sha256:{review_record_hash}",
-        "incident_knowledge_record": f"sha256:{ikr_hash}"
+        name: digest or "sha256:not_found"
+        for name, digest in tree["artifacts"].items()
+    },
+    "merkle_root": tree["root"],
+    "merkle_tree": {
+        "algorithm": tree["algorithm"],
+        "leaves": tree["leaves"]
     },
     "executed_phases": manifest["phases_enabled"],
     "phase_integrity": {
@@ -146,25 +162,18 @@ provenance = {
         "reasoning_manifest": "adapters/trust-verification/reasoning-manifest.json",
         "provenance_record": output_path,
         "trust_report": f"phase7/trust-report-{incident_id}.md",
-        "all_artifact_hashes_computed": True
+        "all_artifact_hashes_computed": all(tree["artifacts"].values())
     },
     "disclaimer": "This provenance record cryptographically binds this incident to a specific reasoning configuration. Any artifact modification will change hashes, making tampering detectable."
 }
 
 # Write provenance record
-with open(output_path, 'w') as f:
+with atomic_open(output_path) as f:
     json.dump(provenance, f, indent=2)
 
 print(f"✓ Provenance record generated: {output_path}")
 GENERATE_PROVENANCE
 
-# Export hashes for Python script
-export INCIDENT_BUNDLE_HASH
-export SCOPE_AUDIT_HASH
-export POST_MORTEM_HASH
-export REVIEW_RECORD_HASH
-export IKR_HASH
-
 echo
 
 # Step 4: Generate Trust Report
@@ -177,6 +186,9 @@ python3 - "$INCIDENT_ID" "$PROVENANCE_FILE" "$REASONING_MANIFEST" "$TRUST_REPORT
 import sys
 import json
 
+sys.path.insert(0, "incidents")
+from atomic import atomic_open
+
 incident_id = sys.argv[1]
 provenance_path = sys.argv[2]
 manifest_path = sys.argv[3]
@@ -292,6 +304,9 @@ for artifact_name, artifact_hash in provenance['artifacts'].items():
     trust_report += f"- **{artifact_name}:** `{artifact_hash.split(':')[0]}:{short_hash}...`\n"
 
 trust_report += f"""
+**Merkle Root:** `{provenance.get('merkle_root', 'not_computed')}`
+
+The Merkle root binds every artifact above; verifying the incident is a single comparison.
 
 **Tamper Detection:** Any modification to these artifacts will change their hashes, making tampering immediately detectable.
 
@@ -339,13 +354,16 @@ Anyone can verify this incident's processing by:
 # Verify artifact hashes
 shasum -a 256 reports/incident-bundle-{incident_id}.json
 shasum -a 256 reports/scope-audit-{incident_id}.json
-shasum -a 256 reports/post-mortem-{incident_id}.md
+shasum -a 256 reports/postmortem-{incident_id}.md
 shasum -a 256 reports/review-record-{incident_id}.yaml
 shasum -a 256 incidents/{incident_id}.yaml
 
 # Compare against provenance record
 cat {provenance['external_verifiability']['provenance_record']}
 
+# Or recompute the Merkle root and compare in one step
+python3 adapters/trust-verification/merkle.py verify {provenance['external_verifiability']['provenance_record']}
+
 # Verify reasoning manifest hasn't changed
 shasum -a 256 adapters/trust-verification/reasoning-manifest.json
 ```
@@ -357,7 +375,7 @@ shasum -a 256 adapters/trust-verification/reasoning-manifest.json
 """
 
 # Write trust report
-with open(output_path, 'w') as f:
+with atomic_open(output_path) as f:
     f.write(trust_report)
 
 print(f"✓ Trust report generated: {output_path}")
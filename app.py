@@ -1,10 +1,145 @@
 # app.py
-from collections import deque
+import hashlib
+import heapq
+import itertools
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
 
 # Keep a bounded in-memory cache to avoid unbounded growth in the demo app.
+# Bounded three ways: entry count, approximate bytes, and entry age.
 CACHE_MAX_ITEMS = 1000
-cache = deque(maxlen=CACHE_MAX_ITEMS)
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+CACHE_TTL_SECONDS = 300
+
+def approx_size(obj, _seen=None):
+    """Approximate deep size in bytes of JSON-like data (dicts, lists, scalars)."""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approx_size(k, _seen) + approx_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approx_size(item, _seen) for item in obj)
+    return size
+
+def request_key(data):
+    """Content key: identical payloads share one cache entry."""
+    encoded = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+class Cache:
+    """
+    Keyed cache with O(1) get/put.
+
+    Eviction: entries past `ttl` expire; then the least recently used
+    (policy="lru") or oldest inserted (policy="fifo") entries are evicted
+    until both `max_items` and `max_bytes` hold.
+    """
+
+    def __init__(self, max_items=CACHE_MAX_ITEMS, max_bytes=CACHE_MAX_BYTES,
+                 ttl=CACHE_TTL_SECONDS, policy="lru", clock=time.monotonic):
+        if policy not in ("lru", "fifo"):
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.policy = policy
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (value, size, expires_at)
+        # Expiry order, separate from recency: (expires_at, seq, key); stale
+        # items (key removed or re-put since) are skipped when popped
+        self.expiry = []
+        self.expiry_seq = itertools.count()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.bytes -= size
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if self.ttl and entry[2] <= self.clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            if self.policy == "lru":
+                self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = approx_size(value)
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                # Never cache a single value larger than the whole budget
+                self.evictions += 1
+                return
+
+            now = self.clock()
+            expires_at = now + self.ttl if self.ttl else None
+            self.entries[key] = (value, size, expires_at)
+            self.bytes += size
+            if self.ttl:
+                heapq.heappush(self.expiry, (expires_at, next(self.expiry_seq), key))
+            self._evict(now)
+
+    def _evict(self, now):
+        # Every expired entry goes first, wherever recency has moved it
+        if self.ttl:
+            while self.expiry and self.expiry[0][0] <= now:
+                expires_at, _, key = heapq.heappop(self.expiry)
+                entry = self.entries.get(key)
+                if entry is not None and entry[2] == expires_at:
+                    self._remove(key)
+                    self.expirations += 1
+            if len(self.expiry) > 2 * len(self.entries) + 64:
+                # Drop stale items so the heap stays proportional to the cache
+                self.expiry = [(entry[2], next(self.expiry_seq), key) for key, entry in self.entries.items()]
+                heapq.heapify(self.expiry)
+
+        while len(self.entries) > self.max_items or self.bytes > self.max_bytes:
+            key = next(iter(self.entries))
+            self._remove(key)
+            self.evictions += 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "bytes": self.bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+cache = Cache()
 
 def handle_request(data):
-    cache.append(data)
-    return {"status": "ok", "cache_size": len(cache)}
+    key = request_key(data)
+    if cache.get(key) is None:
+        cache.put(key, data)
+    stats = cache.stats()
+    return {"status": "ok", "cache_size": stats["size"], "cache": stats}
@@ -0,0 +1,989 @@
+#!/usr/bin/env python3
+"""
+Evidence Pipeline (Phase 2 → Phase 1)
+Scopes and reduces raw evidence, then normalizes and validates it into the
+incident evidence bundle and scope audit. Called by `sherlock investigate`.
+
+Stages, in run order, and what each one reads:
+    adapter      raw adapter log (evidence/hadoop.log, evidence/app.jsonl)
+    events       adapter, evidence/app.log, scope   Phase 2 event scoping + contract check
+    deployments  evidence/deployments.json, scope   anchoring, commit narrowing, diffs
+    logs         events, scope                      log scoping + normalization
+    metrics      evidence/metrics.json, scope       metric scoping + aggregation
+    bundle       events, deployments, logs, metrics bundle + scope audit
+
+Watch mode polls those inputs and, when one changes, re-runs only the
+stages downstream of it (STAGE_INPUTS). A growing adapter log is fed to
+the adapter from the last consumed byte (adapter_sdk.IncrementalRun) and
+a growing deployment history only parses and inserts the appended
+deploys (deployment_store), so a refresh costs about the size of the
+delta (plus one hash pass over the deployment file to confirm it only grew). A
+refresh that fails leaves the last good bundle in place and is retried on
+the next change.
+
+Sample mode (quick triage) runs the adapter over a stratified sample of
+byte ranges (adapter_sdk.SampledRun): signal counts are estimates with 95%
+intervals, flagged in the contract quality block and the scope audit.
+
+Environment (exported by sherlock): INCIDENT_ID, ENVIRONMENT, TIMEZONE,
+SCOPE_FILE, BUNDLE_FILE, SCOPE_AUDIT_FILE
+
+Usage:
+    evidence-pipeline.py                          # One run
+    evidence-pipeline.py --watch [--interval S]   # Re-run on evidence changes (Ctrl-C stops)
+    evidence-pipeline.py --sample RATE            # One run, adapter reads ~RATE of the log
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any
+
+sys.path.insert(0, "adapters")
+sys.path.insert(0, "incidents")
+from adapter_sdk import ContractViolation, IncrementalRun, SampledRun, describe_unclassified, load_adapter  # noqa: E402
+from atomic import atomic_open  # noqa: E402
+from bundle import write_bundle  # noqa: E402
+from deployment_store import DeploymentStore, DeploymentSourceError, commit_windows  # noqa: E402
+
+DEFAULT_INTERVAL = 0.5
+
+# Raw logs that need adapter processing (first match wins)
+ADAPTER_SOURCES = [
+    ("evidence/hadoop.log", "hadoop", "Hadoop logs"),
+    ("evidence/app.jsonl", "jsonl", "JSON Lines logs"),
+]
+APP_LOG = "evidence/app.log"
+DEPLOYMENTS_FILE = "evidence/deployments.json"
+METRICS_FILE = "evidence/metrics.json"
+
+# Stage -> inputs and upstream stages it reads, in run order
+STAGE_INPUTS = {
+    "adapter": {"adapter_log"},
+    "events": {"adapter", "app_log", "scope"},
+    "deployments": {"deployments_file", "scope"},
+    "logs": {"events", "scope"},
+    "metrics": {"metrics_file", "scope"},
+    "bundle": {"events", "deployments", "logs", "metrics"},
+}
+
+# ============================================================================
+# PHASE 2: INCIDENT SCOPING & EVIDENCE REDUCTION
+# ============================================================================
+
+def load_scope(scope_file: str) -> Dict[str, Any]:
+    """Load and validate incident scope object."""
+    with open(scope_file, "r") as f:
+        scope = json.load(f)
+
+    if "service" not in scope or "time_window" not in scope:
+        raise SystemExit("❌ Scope missing required fields")
+
+    if "start" not in scope["time_window"] or "end" not in scope["time_window"]:
+        raise SystemExit("❌ time_window missing start or end")
+
+    return scope
+
+def parse_iso(ts: str) -> datetime:
+    """Parse ISO timestamp to datetime (UTC)."""
+    if ts.endswith("Z"):
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    if re.search(r"[+-]\d{2}:\d{2}$", ts):
+        return datetime.fromisoformat(ts)
+    return datetime.fromisoformat(ts).replace(tzinfo=timezone.utc)
+
+def to_utc_iso(dt: datetime) -> str:
+    """Convert datetime to UTC ISO string."""
+    return dt.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+# STEP 2.2: Deployment anchoring
+def find_deployments(store: "DeploymentStore", service: str, start: datetime, end: datetime) -> List[Dict]:
+    """Find deployments in incident window (indexed range query)."""
+    return store.window(service, start, end)
+
+# STEP 2.3: Commit narrowing
+def get_commits_around_deployments(deployments: List[Dict], 
+                                   before: int, after: int) -> List[Dict]:
+    """Get commits around deployment times (one git log per merged window)."""
+    all_commits = []
+    seen = set()
+    
+    for window_start, window_end in commit_windows(deployments, before, after):
+        start_time = datetime.fromtimestamp(window_start, timezone.utc).isoformat()
+        end_time = datetime.fromtimestamp(window_end, timezone.utc).isoformat()
+        
+        cmd = ["git", "log", f"--since={start_time}", f"--until={end_time}",
+               "--pretty=format:%H|%an|%aI|%s"]
+        try:
+            output = subprocess.check_output(cmd, text=True).strip()
+            if output:
+                for line in output.splitlines():
+                    parts = line.split("|", 3)
+                    if len(parts) == 4:
+                        commit_hash, author, timestamp, message = parts
+                        commit = {
+                            "commit_hash": commit_hash,
+                            "author": author,
+                            "timestamp": to_utc_iso(parse_iso(timestamp)),
+                            "message": message,
+                        }
+                        if commit_hash not in seen:
+                            seen.add(commit_hash)
+                            all_commits.append(commit)
+        except subprocess.CalledProcessError:
+            pass
+    
+    return all_commits
+
+# STEP 2.5: Log scoping
+def filter_logs(lines: List[str], min_severity: str) -> tuple:
+    """Filter logs by severity."""
+    severity_order = {"INFO": 0, "WARN": 1, "ERROR": 2}
+    min_level = severity_order.get(min_severity, 1)
+    
+    included = []
+    excluded = 0
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        
+        parts = line.split(" ", 3)
+        if len(parts) < 4:
+            excluded += 1
+            continue
+        
+        severity = parts[1].strip()
+        if severity not in severity_order:
+            excluded += 1
+            continue
+        
+        if severity_order[severity] < min_level:
+            if severity == "INFO":
+                message = parts[3] if len(parts) >= 4 else ""
+                if not any(kw in message for kw in ["Starting", "Deployment", "Shutdown"]):
+                    excluded += 1
+                    continue
+            else:
+                excluded += 1
+                continue
+        
+        included.append(line)
+    
+    return included, excluded
+
+# STEP 2.6: Metric dimension scoping
+def filter_metrics(metrics: Dict, include_dims: List[str]) -> tuple:
+    """Filter metrics by dimension."""
+    if not include_dims:
+        return metrics, 0
+    
+    included = {}
+    excluded = 0
+    
+    for key, value in metrics.items():
+        if key == "timestamp" or key in include_dims:
+            included[key] = value
+        else:
+            excluded += 1
+    
+    return included, excluded
+
+# ============================================================================
+# PHASE 1: EVIDENCE CONTRACT VALIDATION (happens AFTER Phase 2 scoping)
+# ============================================================================
+
+def validate_evidence_contract(evidence: Dict, source_type: str) -> tuple:
+    """
+    Validate evidence against strict contract format.
+    
+    Returns: (is_valid, violations)
+    """
+    violations = []
+    
+    # Check required top-level keys
+    if "source" not in evidence:
+        violations.append("Missing 'source' field")
+    if "quality" not in evidence:
+        violations.append("Missing 'quality' metadata")
+    if "signals" not in evidence:
+        violations.append("Missing 'signals' array")
+    
+    if violations:
+        return False, violations
+    
+    # Validate quality metadata
+    quality = evidence.get("quality", {})
+    if "completeness" not in quality or quality["completeness"] not in ["COMPLETE", "PARTIAL", "INCOMPLETE"]:
+        violations.append(f"Invalid completeness: {quality.get('completeness')}")
+    if "confidence_penalty" not in quality or not isinstance(quality["confidence_penalty"], (int, float)):
+        violations.append("Missing or invalid confidence_penalty")
+    
+    # Validate signals
+    signals = evidence.get("signals", [])
+    if not isinstance(signals, list):
+        violations.append("Signals must be an array")
+        return False, violations
+    
+    for idx, signal in enumerate(signals):
+        # Check timestamp format (ISO-8601 UTC)
+        # Signals can have either 'timestamp' or 'first_seen' (for aggregated events)
+        timestamp_field = signal.get("timestamp") or signal.get("first_seen")
+        if not timestamp_field:
+            violations.append(f"Signal {idx}: missing timestamp/first_seen")
+        else:
+            if not re.match(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$", timestamp_field):
+                violations.append(f"Signal {idx}: invalid timestamp format (expected ISO-8601 UTC): {timestamp_field}")
+        
+        # Check severity (only INFO, WARN, ERROR allowed)
+        if "severity" not in signal:
+            violations.append(f"Signal {idx}: missing severity")
+        elif signal["severity"] not in ["INFO", "WARN", "ERROR"]:
+            violations.append(f"Signal {idx}: invalid severity '{signal['severity']}' (allowed: INFO, WARN, ERROR)")
+        
+        # Check event type (must be generic, no vendor jargon)
+        if "event" not in signal:
+            violations.append(f"Signal {idx}: missing event type")
+        else:
+            event = signal["event"]
+            # Reject vendor-specific terms
+            forbidden_terms = ["hadoop", "datanode", "namenode", "spark", "kafka", "kubernetes", "k8s"]
+            if any(term in event.lower() for term in forbidden_terms):
+                violations.append(f"Signal {idx}: event type contains vendor jargon: '{event}'")
+        
+        # Check aggregation (signals must have count if aggregated)
+        if "count" in signal and not isinstance(signal["count"], int):
+            violations.append(f"Signal {idx}: count must be integer")
+    
+    return len(violations) == 0, violations
+
+# ============================================================================
+# PHASE 2: INCIDENT SCOPING & EVIDENCE REDUCTION
+# ============================================================================
+
+def scope_events_by_time(events: List[Dict], start: datetime, end: datetime, buffer_minutes: int = 0) -> tuple:
+    """Step 2.1: Time window filtering (PRIMARY CUT)"""
+    included = []
+    excluded = 0
+    
+    if buffer_minutes > 0:
+        start = start - timedelta(minutes=buffer_minutes)
+        end = end + timedelta(minutes=buffer_minutes)
+    
+    for event in events:
+        timestamp_str = event.get("timestamp") or event.get("first_seen", "")
+        if not timestamp_str:
+            excluded += 1
+            continue
+        
+        try:
+            event_time = parse_iso(timestamp_str)
+            if start <= event_time <= end:
+                included.append(event)
+            else:
+                excluded += 1
+        except:
+            excluded += 1
+    
+    return included, excluded
+
+def scope_events_by_severity(events: List[Dict], min_severity: str, allow_lifecycle: bool) -> tuple:
+    """Step 2.2: Severity threshold filtering"""
+    severity_order = {"INFO": 0, "WARN": 1, "ERROR": 2}
+    min_level = severity_order.get(min_severity, 1)
+    
+    included = []
+    excluded = 0
+    
+    lifecycle_events = ["service_start", "service_shutdown", "startup", "shutdown", "deployment"]
+    
+    for event in events:
+        severity = event.get("severity", "INFO")
+        event_type = event.get("event", "")
+        
+        if severity not in severity_order:
+            excluded += 1
+            continue
+        
+        # Allow lifecycle events even if below threshold
+        if allow_lifecycle and event_type in lifecycle_events:
+            included.append(event)
+        elif severity_order[severity] >= min_level:
+            included.append(event)
+        else:
+            excluded += 1
+    
+    return included, excluded
+
+def scope_events_by_allowlist(events: List[Dict], allowlist: List[str]) -> tuple:
+    """Step 2.3: Event allowlist filtering (KEY for Hadoop)"""
+    if not allowlist:
+        return events, 0
+    
+    included = []
+    excluded = 0
+    
+    for event in events:
+        event_type = event.get("event", "")
+        if event_type in allowlist:
+            included.append(event)
+        else:
+            excluded += 1
+    
+    return included, excluded
+
+def scope_events_by_component(events: List[Dict], target_service: str, allowed_components: List[str]) -> tuple:
+    """Step 2.4: Component relevance check"""
+    included = []
+    excluded = 0
+    
+    # If no explicit allowlist, just check against target service
+    if not allowed_components:
+        allowed_components = [target_service]
+    
+    for event in events:
+        component = event.get("component", "")
+        if component in allowed_components:
+            included.append(event)
+        else:
+            excluded += 1
+    
+    return included, excluded
+
+def deduplicate_events(events: List[Dict]) -> List[Dict]:
+    """Step 2.5: Deduplication & consolidation"""
+    # Group by (event_type, severity, component)
+    groups = {}
+    
+    for event in events:
+        key = (event.get("event"), event.get("severity"), event.get("component"))
+        if key not in groups:
+            groups[key] = []
+        groups[key].append(event)
+    
+    deduplicated = []
+    for key, group in groups.items():
+        if len(group) == 1:
+            deduplicated.append(group[0])
+        else:
+            # Merge multiple events
+            total_count = sum(e.get("count", 1) for e in group)
+            timestamps = []
+            for e in group:
+                if "first_seen" in e:
+                    timestamps.append(e["first_seen"])
+                if "last_seen" in e:
+                    timestamps.append(e["last_seen"])
+                if "timestamp" in e:
+                    timestamps.append(e["timestamp"])
+            
+            timestamps.sort()
+            merged = group[0].copy()
+            merged["count"] = total_count
+            if timestamps:
+                merged["first_seen"] = timestamps[0]
+                merged["last_seen"] = timestamps[-1]
+                if "timestamp" in merged:
+                    del merged["timestamp"]  # Use first_seen/last_seen for aggregated events
+            
+            deduplicated.append(merged)
+    
+    return deduplicated
+
+# ============================================================================
+# PHASE 1: NORMALIZATION & VALIDATION
+# ============================================================================
+
+def diff_summary(commit_hash: str):
+    """Get semantic diff summary."""
+    cmd = ["git", "show", commit_hash, "--name-status", "--pretty=format:"]
+    try:
+        output = subprocess.check_output(cmd, text=True)
+    except subprocess.CalledProcessError:
+        return []
+    
+    diffs = []
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        parts = line.split("\t", 1)
+        if len(parts) != 2:
+            continue
+        change_type, path = parts
+        
+        semantic_hint = ""
+        if path == "app.py":
+            show = subprocess.check_output(["git", "show", commit_hash, "--", path], text=True)
+            if "cache.append" in show:
+                semantic_hint = "adds unbounded cache append"
+            elif '\"status\": \"error\"' in show:
+                semantic_hint = "adds lightweight input validation"
+        
+        diffs.append({
+            "file_path": path,
+            "change_type": change_type,
+            "semantic_hint": semantic_hint or "n/a",
+        })
+    return diffs
+
+def normalize_deployments(events: List[Dict], service: str) -> tuple:
+    """Normalize deployment events."""
+    normalized = []
+    invalid = 0
+    for ev in events:
+        if "time" not in ev:
+            invalid += 1
+            continue
+        try:
+            ts = to_utc_iso(parse_iso(ev["time"]))
+        except Exception:
+            invalid += 1
+            continue
+        normalized.append({
+            "timestamp": ts,
+            "service": service,
+            "version": ev.get("version"),
+            "commit_hash": ev.get("commit"),
+        })
+    return normalized, invalid
+
+def normalize_logs(lines: List[str], service: str) -> tuple:
+    """Normalize log entries."""
+    entries = []
+    invalid = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        parts = line.split(" ", 3)
+        if len(parts) < 4:
+            invalid += 1
+            continue
+        ts, severity, _, message = parts[0], parts[1], parts[2], parts[3]
+        try:
+            timestamp = to_utc_iso(parse_iso(ts))
+        except Exception:
+            invalid += 1
+            continue
+        entries.append({
+            "timestamp": timestamp,
+            "severity": severity.strip(),
+            "component": service,
+            "message": message.strip(),
+        })
+    return entries, invalid
+
+def aggregate_metrics(metrics: Dict) -> Dict:
+    """Aggregate metrics."""
+    summary = {}
+    for key, values in metrics.items():
+        if key == "timestamp" or not values:
+            continue
+        baseline = values[0]
+        pre_incident = values[1] if len(values) > 1 else values[0]
+        peak = max(values)
+        delta = peak - baseline
+        summary[key] = {
+            "baseline": baseline,
+            "pre_incident": pre_incident,
+            "peak": peak,
+            "delta": delta,
+            "unit": "mb" if "memory" in key else "pct",
+            "direction": "up" if delta > 0 else "down" if delta < 0 else "flat",
+        }
+    return summary
+
+# ============================================================================
+# STAGES
+# ============================================================================
+
+def detect_adapter_source():
+    """(log_path, source_type, label) of the first raw adapter log present, or None."""
+    return next((s for s in ADAPTER_SOURCES if os.path.exists(s[0])), None)
+
+def fingerprint(path):
+    """Cheap change signature for a polled input (None while it is missing)."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+class EvidencePipeline:
+    """Stage outputs of one incident, kept between runs so refreshes are incremental."""
+
+    def __init__(self, watch: bool = False, sample_rate: float = None):
+        self.watch = watch
+        self.sample_rate = sample_rate
+        self.scope_file = os.environ["SCOPE_FILE"]
+        self.deployment_store = DeploymentStore(DEPLOYMENTS_FILE)
+        self.adapter_source = None
+        self.adapter_run = None
+        self.adapter_evidence = None
+        self.adapter_update = None
+        self.diff_cache = {}
+        self.fingerprints = {}
+        self.input_paths = {}
+        self.unapplied = set()
+
+    def inputs(self) -> Dict[str, str]:
+        """Input name -> path currently read."""
+        adapter_source = detect_adapter_source()
+        inputs = {
+            "scope": self.scope_file,
+            "deployments_file": DEPLOYMENTS_FILE,
+            "metrics_file": METRICS_FILE,
+        }
+        if adapter_source:
+            inputs["adapter_log"] = adapter_source[0]
+        else:
+            inputs["app_log"] = APP_LOG
+        return inputs
+
+    def changed_inputs(self) -> set:
+        """Inputs whose fingerprint moved since the last snapshot (snapshot is updated)."""
+        inputs = self.inputs()
+        self.input_paths.update(inputs)
+        current = {name: fingerprint(path) for name, path in inputs.items()}
+        changed = {name for name in set(current) | set(self.fingerprints)
+                   if current.get(name) != self.fingerprints.get(name)}
+        self.fingerprints = current
+        return changed
+
+    def run(self, changed: set) -> List[str]:
+        """
+        Re-run every stage downstream of the changed inputs, in order.
+
+        Returns: names of the stages that ran
+        """
+        dirty = set(changed) | self.unapplied
+        self.unapplied = dirty
+        if "scope" in dirty:
+            self.load_scope()
+
+        ran = []
+        for stage, reads in STAGE_INPUTS.items():
+            if reads & dirty:
+                getattr(self, f"stage_{stage}")()
+                dirty.add(stage)
+                ran.append(stage)
+        self.unapplied = set()
+        return ran
+
+    def load_scope(self):
+        scope = load_scope(self.scope_file)
+        self.scope = scope
+        self.service = scope["service"]
+        self.start_time = parse_iso(scope["time_window"]["start"])
+        self.end_time = parse_iso(scope["time_window"]["end"])
+        self.commit_window = scope.get("commit_window", {"before": 20, "after": 5})
+        self.paths = scope.get("paths", [])
+        self.log_policy = scope.get("log_policy", {"min_severity": "WARN"})
+        self.metric_policy = scope.get("metric_policy", {"include": []})
+
+    def stage_adapter(self):
+        """Invoke the evidence contract adapter (raw events, NOT yet scoped or validated)."""
+        adapter_source = detect_adapter_source()
+        if adapter_source != self.adapter_source:
+            self.adapter_source = adapter_source
+            self.adapter_run = None
+            if adapter_source and self.sample_rate:
+                self.adapter_run = SampledRun(load_adapter(adapter_source[1]), adapter_source[0], self.sample_rate)
+            elif adapter_source:
+                self.adapter_run = IncrementalRun(load_adapter(adapter_source[1]), adapter_source[0])
+
+        self.adapter_evidence = None
+        self.adapter_update = None
+        if not self.adapter_run:
+            return
+
+        print(f"🔍 Detected raw {adapter_source[2]} - invoking evidence contract adapter")
+        adapter = self.adapter_run.adapter
+        try:
+            self.adapter_update = self.adapter_run.update(flush=not self.watch)
+        except FileNotFoundError:
+            raise SystemExit(f"❌ Adapter failed: Log file not found: {adapter_source[0]}")
+        except ContractViolation as e:
+            raise SystemExit(f"❌ Adapter failed: {e} ({adapter.source} logs, contract violation)")
+
+        result = self.adapter_run.result.snapshot(adapter)  # Watch mode: the open event counts too
+        for level, count in result.skipped["forbidden_severity"].items():
+            print(f"⚠️  Adapter: Skipped {count} line(s) with forbidden severity {level}")
+        if not result.events:
+            for line in describe_unclassified(result.unclassified.result()):
+                print(line)
+            raise SystemExit("❌ Adapter failed: No classifiable events found in logs")
+
+        self.adapter_evidence = self.adapter_run.contract_output()
+
+    def stage_events(self):
+        """Phase 2 event scoping and Phase 1 contract validation of the adapter output."""
+        if self.adapter_evidence is None:
+            # Fallback to standard app.log
+            try:
+                with open(APP_LOG, "r") as f:
+                    self.raw_logs = f.readlines()
+            except FileNotFoundError:
+                raise SystemExit("❌ Missing evidence/app.log and no adapter-provided logs found")
+            self.evidence_quality_penalties = []
+            self.phase2_scope_audit = None
+            return
+
+        adapter_evidence = self.adapter_evidence
+        adapter_type = self.adapter_source[1]
+        service = self.service
+        log_policy = self.log_policy
+
+        # ========================================================================
+        # PHASE 2: SCOPE & REDUCE (happens BEFORE validation)
+        # ========================================================================
+
+        print("📐 Phase 2: Scoping & Reducing events")
+
+        initial_count = len(adapter_evidence.get("signals", []))
+        scoped_events = adapter_evidence.get("signals", [])
+
+        exclusion_counts = {
+            "outside_time_window": 0,
+            "severity_below_threshold": 0,
+            "event_not_allowlisted": 0,
+            "component_mismatch": 0,
+            "deduplicated": 0
+        }
+
+        # Step 2.1: Time window filtering
+        scoped_events, excluded_time = scope_events_by_time(scoped_events, self.start_time, self.end_time, buffer_minutes=0)
+        exclusion_counts["outside_time_window"] = excluded_time
+        print(f"  Step 2.1 (Time): {initial_count} → {len(scoped_events)} events (-{excluded_time})")
+
+        # Step 2.2: Severity threshold filtering
+        min_severity = log_policy.get("min_severity", "WARN")
+        allow_lifecycle = log_policy.get("lifecycle_events", True)
+        before_severity = len(scoped_events)
+        scoped_events, excluded_severity = scope_events_by_severity(scoped_events, min_severity, allow_lifecycle)
+        exclusion_counts["severity_below_threshold"] = excluded_severity
+        print(f"  Step 2.2 (Severity): {before_severity} → {len(scoped_events)} events (-{excluded_severity})")
+
+        # Step 2.3: Event allowlist filtering
+        event_allowlist = log_policy.get("event_allowlist", [])
+        before_allowlist = len(scoped_events)
+        scoped_events, excluded_allowlist = scope_events_by_allowlist(scoped_events, event_allowlist)
+        exclusion_counts["event_not_allowlisted"] = excluded_allowlist
+        print(f"  Step 2.3 (Allowlist): {before_allowlist} → {len(scoped_events)} events (-{excluded_allowlist})")
+
+        # Step 2.4: Component relevance check
+        allowed_components = log_policy.get("include_components", [service])
+        before_component = len(scoped_events)
+        scoped_events, excluded_component = scope_events_by_component(scoped_events, service, allowed_components)
+        exclusion_counts["component_mismatch"] = excluded_component
+        print(f"  Step 2.4 (Component): {before_component} → {len(scoped_events)} events (-{excluded_component})")
+
+        # Step 2.5: Deduplication
+        before_dedup = len(scoped_events)
+        scoped_events = deduplicate_events(scoped_events)
+        exclusion_counts["deduplicated"] = before_dedup - len(scoped_events)
+        print(f"  Step 2.5 (Dedup): {before_dedup} → {len(scoped_events)} events (-{exclusion_counts['deduplicated']})")
+
+        # Failure mode: No events remaining
+        if not scoped_events:
+            raise SystemExit("❌ Phase 2: No events remain after scoping. Aborting investigation.")
+
+        # Failure mode: Only INFO remains (low signal)
+        has_error_or_warn = any(e.get("severity") in ["ERROR", "WARN"] for e in scoped_events)
+        if not has_error_or_warn:
+            print("⚠️  Phase 2: Only INFO events remain (low signal)")
+
+        # Generate scope audit
+        scope_audit = {
+            "source": adapter_evidence.get("source"),
+            "included": len(scoped_events),
+            "excluded": initial_count - len(scoped_events),
+            "exclusion_breakdown": exclusion_counts,
+            "reduction_ratio": f"{(1 - len(scoped_events)/initial_count)*100:.1f}%"
+        }
+
+        # Sampled adapter run: counts are estimates until an exact run replaces them
+        sampling = adapter_evidence["quality"].get("sampling")
+        if sampling:
+            scope_audit["estimated_counts"] = sampling
+            print(f"⚠️  Phase 2: Signal counts are estimates from a {sampling['rate'] * 100:.1f}% sample "
+                  f"(95% intervals in the contract signals)")
+
+        print(f"✓ Phase 2 complete: {initial_count} events → {len(scoped_events)} events (reduction: {scope_audit['reduction_ratio']})")
+
+        # ========================================================================
+        # PHASE 1: VALIDATE scoped events (happens AFTER reduction)
+        # ========================================================================
+
+        # Reconstruct evidence object with scoped events
+        scoped_evidence = {
+            "source": adapter_evidence["source"],
+            "quality": adapter_evidence["quality"],
+            "signals": scoped_events
+        }
+
+        # NOW validate the scoped evidence
+        is_valid, violations = validate_evidence_contract(scoped_evidence, adapter_type)
+        if not is_valid:
+            print("❌ Phase 1: Evidence contract validation FAILED:")
+            for v in violations:
+                print(f"   - {v}")
+            raise SystemExit("❌ Contract violations detected. Aborting investigation.")
+
+        print(f"✓ Phase 1 complete: Evidence contract validated ({len(scoped_events)} scoped signals)")
+
+        # Convert contract signals to log format for downstream processing
+        self.raw_logs = []
+        for signal in scoped_events:
+            timestamp = signal.get("timestamp") or signal.get("first_seen", "")
+            count = f"~{signal['count']}" if "estimate" in signal else signal.get("count", 1)
+            message = f"{signal['event']} (count: {count})"
+            if "context" in signal:
+                message += f" - {signal['context']}"
+            log_line = f"{timestamp} {signal['severity']} {adapter_evidence['source']} {message}\n"
+            self.raw_logs.append(log_line)
+
+        # Store quality penalties for later propagation
+        self.evidence_quality_penalties = [{
+            "source": f"{adapter_evidence['source']}_logs",
+            "reason": "; ".join(adapter_evidence['quality'].get('notes', [])),
+            "penalty": -adapter_evidence['quality']['confidence_penalty']
+        }]
+
+        # Store scope audit for reporting
+        self.phase2_scope_audit = scope_audit
+
+    def stage_deployments(self):
+        """Deployment anchoring, commit narrowing and diffs."""
+        # Deployments go through the time-indexed store (only appended deploys are re-parsed)
+        try:
+            self.deployment_store.sync()
+        except DeploymentSourceError as e:
+            raise SystemExit(f"❌ {e}")
+
+        # STEP 2.2: Deployment anchoring
+        deployments = find_deployments(self.deployment_store, self.service, self.start_time, self.end_time)
+        if not deployments:
+            raise SystemExit("❌ No deployment events in incident window. Aborting.")
+
+        print(f"✓ Found {len(deployments)} deployment(s) in incident window")
+
+        # STEP 2.3: Commit narrowing
+        self.commits = get_commits_around_deployments(
+            deployments,
+            self.commit_window["before"],
+            self.commit_window["after"]
+        )
+        self.excluded_commits = 0
+        print(f"✓ Commit narrowing: {len(self.commits)} commits in window")
+
+        # Generate diffs (a commit's diff never changes, so it is computed once)
+        self.diffs = []
+        for c in self.commits:
+            if c["commit_hash"] not in self.diff_cache:
+                self.diff_cache[c["commit_hash"]] = diff_summary(c["commit_hash"])
+            self.diffs.extend(self.diff_cache[c["commit_hash"]])
+
+        self.deployment_events, self.invalid_deployments = normalize_deployments(deployments, self.service)
+
+    def stage_logs(self):
+        """Log scoping and normalization."""
+        # STEP 2.5: Log scoping
+        self.filtered_logs, self.excluded_logs = filter_logs(
+            self.raw_logs,
+            self.log_policy.get("min_severity", "WARN")
+        )
+        print(f"✓ Log scoping: {len(self.filtered_logs)} logs included, {self.excluded_logs} excluded")
+
+        self.log_entries, self.invalid_log_lines = normalize_logs(self.filtered_logs, self.service)
+
+    def stage_metrics(self):
+        """Metric scoping and aggregation."""
+        try:
+            with open(METRICS_FILE, "r") as f:
+                raw_metrics = json.load(f)
+        except FileNotFoundError:
+            raise SystemExit("❌ Missing evidence/metrics.json")
+        except json.JSONDecodeError as e:
+            raise SystemExit(f"❌ Invalid JSON in evidence/metrics.json: {e}")
+
+        # STEP 2.6: Metric scoping
+        self.filtered_metrics, self.excluded_metrics = filter_metrics(
+            raw_metrics,
+            self.metric_policy.get("include", [])
+        )
+        print(f"✓ Metric scoping: {len(self.filtered_metrics)-1} dimensions included, {self.excluded_metrics} excluded")
+
+        self.metric_summary = aggregate_metrics(self.filtered_metrics)
+
+    def stage_bundle(self):
+        """Integrity accounting, bundle and scope audit."""
+        commit_window = self.commit_window
+        scope_audit = {
+            "scope_summary": {
+                "service": self.service,
+                "time_window": f"{to_utc_iso(self.start_time)} to {to_utc_iso(self.end_time)}",
+                "paths": self.paths if self.paths else "all",
+                "commit_buffer": f"-{commit_window['before']}m / +{commit_window['after']}m",
+            },
+            "reduction_summary": {
+                "commits": {"included": len(self.commits), "excluded": self.excluded_commits},
+                "logs": {"included": len(self.filtered_logs), "excluded": self.excluded_logs},
+                "metrics": {"included": len(self.filtered_metrics) - 1, "excluded": self.excluded_metrics},
+            },
+            "exclusion_reasons": [
+                "outside_commit_window",
+                "severity_below_threshold",
+                "metric_dimension_not_in_scope",
+            ],
+        }
+
+        # Add Phase 2 Hadoop event reduction audit if available
+        if self.phase2_scope_audit is not None:
+            scope_audit["hadoop_event_reduction"] = self.phase2_scope_audit
+
+        # Integrity accounting
+        missing_sources = []
+        confidence_penalties = self.evidence_quality_penalties.copy()  # Start with adapter penalties
+
+        if self.invalid_log_lines:
+            print(f"⚠️  Skipped {self.invalid_log_lines} malformed log line(s) during normalization")
+
+        if self.invalid_deployments:
+            print(f"⚠️  Skipped {self.invalid_deployments} malformed deployment event(s) during normalization")
+
+        if not self.log_entries:
+            missing_sources.append("application_logs")
+            confidence_penalties.append({"reason": "Missing or empty logs", "penalty": -10})
+
+        if not self.metric_summary:
+            missing_sources.append("metrics")
+            confidence_penalties.append({"reason": "Missing or empty metrics", "penalty": -15})
+
+        # Build final bundle
+        bundle = {
+            "metadata": {
+                "incident_id": os.environ["INCIDENT_ID"],
+                "service": self.service,
+                "environment": os.environ["ENVIRONMENT"],
+                "start_time": to_utc_iso(self.start_time),
+                "end_time": to_utc_iso(self.end_time),
+                "timezone": os.environ["TIMEZONE"],
+            },
+            "version_control": {
+                "commits": self.commits,
+                "diffs": self.diffs,
+            },
+            "deployments": {
+                "events": self.deployment_events,
+            },
+            "logs": {
+                "entries": self.log_entries,
+            },
+            "metrics": {
+                "aggregates": self.metric_summary,
+            },
+            "integrity": {
+                "missing_sources": missing_sources,
+                "confidence_penalties": confidence_penalties,
+            },
+        }
+
+        # Save artifacts (format follows the bundle path; a stale bundle in the
+        # other format is removed so readers never pick up an old run). Both
+        # files are replaced atomically so a watcher never reads a torn write.
+        write_bundle(bundle, os.environ["BUNDLE_FILE"])
+        for stale in (f"reports/incident-bundle-{os.environ['INCIDENT_ID']}.json",
+                      f"reports/incident-bundle-{os.environ['INCIDENT_ID']}.jsonl.gz"):
+            if stale != os.environ["BUNDLE_FILE"] and os.path.exists(stale):
+                os.remove(stale)
+
+        with atomic_open(os.environ["SCOPE_AUDIT_FILE"]) as f:
+            json.dump(scope_audit, f, indent=2)
+
+        print("✓ Phase 2 complete: Evidence scoped and reduced")
+        print("✓ Phase 1 complete: Evidence normalized and validated")
+
+# ============================================================================
+# WATCH MODE
+# ============================================================================
+
+def describe_change(pipeline: EvidencePipeline, changed: set) -> str:
+    described = []
+    for name in sorted(changed):
+        label = os.path.basename(pipeline.input_paths[name])
+        update = pipeline.adapter_update
+        if name == "adapter_log" and update:
+            label += " (re-read)" if update["mode"] == "full" else f" (+{update['lines']} lines)"
+        described.append(label)
+    return ", ".join(described)
+
+def watch(pipeline: EvidencePipeline, interval: float):
+    """Poll the pipeline inputs and refresh the bundle on every change until Ctrl-C."""
+    watched = ", ".join(sorted(set(pipeline.inputs().values())))
+    print()
+    print(f"👀 Watching {watched} (every {interval}s, Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            changed = pipeline.changed_inputs()
+            if not changed:
+                continue
+
+            stamp = datetime.now().strftime("%H:%M:%S")
+            started = time.perf_counter()
+            output = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(output):
+                    stages = pipeline.run(changed)
+            except (SystemExit, Exception) as e:
+                print(f"⚠️  [{stamp}] Refresh failed, keeping the last good bundle: {e}")
+                continue
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            print(f"🔄 [{stamp}] {describe_change(pipeline, changed)} → "
+                  f"{' → '.join(stages)} ({elapsed_ms:.0f} ms)")
+    except KeyboardInterrupt:
+        print()
+        print("✓ Watch stopped")
+
+def main():
+    args = sys.argv[1:]
+    interval = DEFAULT_INTERVAL
+    watch_mode = False
+    sample_rate = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == "--watch":
+            watch_mode = True
+            i += 1
+        elif args[i] == "--interval" and i + 1 < len(args):
+            interval = float(args[i + 1])
+            i += 2
+        elif args[i] == "--sample" and i + 1 < len(args):
+            sample_rate = float(args[i + 1])
+            i += 2
+        else:
+            raise SystemExit("Usage: evidence-pipeline.py [--watch] [--interval SECONDS] [--sample RATE]")
+
+    if sample_rate is not None and not 0 < sample_rate <= 1:
+        raise SystemExit(f"❌ Sample rate must be in (0, 1]: {sample_rate}")
+    if sample_rate and watch_mode:
+        raise SystemExit("❌ --sample and --watch cannot be combined (watch mode reads appended lines exactly)")
+
+    # Phase 2 → Phase 1 Pipeline: Scope & Reduce → Normalize & Validate
+    pipeline = EvidencePipeline(watch=watch_mode, sample_rate=sample_rate)
+    pipeline.run(pipeline.changed_inputs() | {"scope"})
+
+    if watch_mode:
+        watch(pipeline, interval)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Atomic Artifact Writes & Per-Incident Locks
+State and artifact writes go through write-then-rename, so a reader (a gate
+check, a concurrent investigation, watch mode) sees the old file or the new
+one, never a torn write.
+
+    atomic_write(path, data)                  # temp file beside path, fsync, os.replace
+    atomic_write(path, data, exclusive=True)  # publish only if path does not exist yet
+    with atomic_open(path) as f: ...          # streaming form, replaced on success only
+    with incident_lock("INC-123"): ...        # serialize one incident's read-modify-write
+
+Locks are advisory fcntl.flock locks on incidents/.locks/<id>.lock, one
+per incident: runs against different incidents never wait on each other.
+sherlock takes the lock for Phases 1-3 on a descriptor its child steps
+inherit and exports SHERLOCK_LOCKED_INCIDENT, so helpers it calls (status
+initialization) do not try to take the lock a second time.
+
+Usage:
+    atomic.py write <path> [--exclusive]   # stdin -> path
+    atomic.py lock-fd <fd> <incident_id>   # lock a descriptor opened by the calling shell
+"""
+
+import fcntl
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+LOCK_DIR = Path("incidents/.locks")
+HELD_ENV = "SHERLOCK_LOCKED_INCIDENT"
+QUIET_WAIT_SECONDS = 1.0
+
+@contextmanager
+def atomic_open(path, mode="w", exclusive=False):
+    """
+    Open a temp file next to `path`; it replaces `path` only if the block succeeds.
+
+    exclusive=True publishes with a hard link instead of a rename, so an
+    existing file is never overwritten (raises FileExistsError).
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if exclusive:
+            os.link(tmp_path, path)
+        else:
+            os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def atomic_write(path, data, exclusive=False):
+    """Write str or bytes to `path` atomically (see atomic_open)."""
+    with atomic_open(path, "wb" if isinstance(data, bytes) else "w", exclusive=exclusive) as f:
+        f.write(data)
+
+def _lock(fd, incident_id):
+    # Short critical sections (status writes) usually free up within the
+    # grace period; only a real wait (another run's Phases 1-3) is reported
+    deadline = time.monotonic() + QUIET_WAIT_SECONDS
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(0.02)
+    print(f"⏳ Waiting for another run on {incident_id} to release its lock...", file=sys.stderr)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+
+@contextmanager
+def incident_lock(incident_id, lock_dir=LOCK_DIR):
+    """Exclusive advisory lock on one incident (no-op if the calling run already holds it)."""
+    if os.environ.get(HELD_ENV) == incident_id:
+        yield
+        return
+    Path(lock_dir).mkdir(parents=True, exist_ok=True)
+    with open(Path(lock_dir) / f"{incident_id}.lock", "a") as lock_file:
+        _lock(lock_file.fileno(), incident_id)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+def main():
+    args = sys.argv[1:]
+    if args[:1] == ["write"] and len(args) in (2, 3) and args[2:] in ([], ["--exclusive"]):
+        try:
+            atomic_write(args[1], sys.stdin.buffer.read(), exclusive=len(args) == 3)
+        except FileExistsError:
+            raise SystemExit(f"❌ {args[1]} already exists (not overwritten)")
+        return
+
+    if args[:1] == ["lock-fd"] and len(args) == 3:
+        # The shell owns the descriptor, so the lock outlives this process
+        # and is released when the shell closes it (or exits)
+        _lock(int(args[1]), args[2])
+        return
+
+    print("Usage: atomic.py write <path> [--exclusive]")
+    print("       atomic.py lock-fd <fd> <incident_id>")
+    sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Incident Store Audit
+Checks the governance invariants (INVARIANTS.md) across every incident in
+the store at once, instead of one incident at a time by hand.
+
+An incident is anything with a status file, review record, knowledge record
+(IKR) or provenance record. Each one is audited in a worker process against:
+
+    rule                 severity  check
+    lifecycle.status     fail      status file parses and holds a valid state
+    lifecycle.history    warn      recorded transitions follow ALLOWED_TRANSITIONS
+    memory.gate          fail      an IKR exists only in a state the memory phase allows
+                                   (warn when the incident has no status file)
+    review.finalized     fail      every IKR has a FINALIZED review record (Invariant 3)
+    review.reviewer      fail      review records name the reviewer and role
+    review.decision      fail      decision is ACCEPTED, MODIFIED or REJECTED
+    ikr.consistency      fail      IKR decision, root cause and confidence match the review record
+    ikr.artifacts        warn      artifacts the IKR references exist
+    provenance.gate      fail      provenance exists only in a state the trust phase allows
+    provenance.root      fail      recorded Merkle root matches the artifacts on disk (Invariant 6)
+    provenance.hashes    fail      recorded per-artifact hashes match (records without a root)
+    provenance.legacy    warn      provenance holds nothing verifiable
+
+The report is written to reports/audit-report.json. --incremental reuses
+the findings of incidents whose files (every artifact the audit reads,
+by inode/size/mtime) are unchanged since the last audit
+(incidents/.audit-cache.json). Exit status is 1 when any rule fails.
+
+Usage:
+    audit-incidents.py [incident_id ...] [--incremental] [--jobs N] [--json]
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+INCIDENTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(INCIDENTS_DIR))
+sys.path.insert(0, str(INCIDENTS_DIR.parent / "adapters" / "trust-verification"))
+from atomic import atomic_write  # noqa: E402
+from batch import read_cache, run_pool, stat_key, write_cache  # noqa: E402
+from lifecycle import ALLOWED_TRANSITIONS, PHASE_REQUIREMENTS, VALID_STATES, load_status  # noqa: E402
+from merkle import hash_file, incident_artifacts, verify_provenance  # noqa: E402
+
+INCIDENT_STORE = Path("incidents")
+REPORTS_DIR = Path("reports")
+TRUST_DIR = Path("adapters/trust-verification")
+REPORT_FILE = REPORTS_DIR / "audit-report.json"
+CACHE_FILE = INCIDENT_STORE / ".audit-cache.json"
+
+# Bump when rules change, so --incremental re-audits everything once
+AUDIT_VERSION = 1
+
+DECISIONS = ('ACCEPTED', 'MODIFIED', 'REJECTED')
+RULE = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+# ============================================================================
+# RECORD READING
+# ============================================================================
+
+def _scalar(value):
+    """YAML scalar text -> str, dropping quotes and trailing comments."""
+    value = value.strip()
+    if value.startswith('"'):
+        end = value.find('"', 1)
+        return value[1:end] if end > 0 else value[1:]
+    return value.split(' #', 1)[0].strip()
+
+def read_fields(path):
+    """
+    Scalar fields of a two-level YAML record (review record, IKR).
+
+    Returns: {"key": value, "parent.child": value}; list items are skipped.
+    """
+    fields = {}
+    parent = None
+    with open(path, 'r') as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith(('#', '-')) or ':' not in stripped:
+                continue
+            key, value = stripped.split(':', 1)
+            indent = len(line) - len(line.lstrip(' '))
+            if indent == 0:
+                parent = key
+                if _scalar(value):
+                    fields[key] = _scalar(value)
+            elif indent == 2 and parent:
+                fields[f"{parent}.{key}"] = _scalar(value)
+    return fields
+
+def _first(fields, *keys):
+    return next((fields[k] for k in keys if fields.get(k)), None)
+
+# ============================================================================
+# DISCOVERY
+# ============================================================================
+
+def discover(incident_ids=None):
+    """
+    Group the store's files by incident.
+
+    Returns: {incident_id: {"status", "reviews", "ikrs", "provenance"}}
+    where reviews/ikrs map a file suffix (<id> or <id>-<service>) to a path.
+    """
+    incidents = {}
+
+    def entry(incident_id):
+        return incidents.setdefault(incident_id, {'status': None, 'reviews': {}, 'ikrs': {}, 'provenance': None})
+
+    for path in sorted(INCIDENT_STORE.glob("*.status.yaml")):
+        entry(path.name[:-len(".status.yaml")])['status'] = str(path)
+    for path in sorted(REPORTS_DIR.glob("review-record-*.yaml")):
+        suffix = path.name[len("review-record-"):-len(".yaml")]
+        incident_id = read_fields(path).get('incident_id') or suffix
+        entry(incident_id)['reviews'][suffix] = str(path)
+    for path in sorted(INCIDENT_STORE.glob("*.yaml")):
+        if path.name.endswith((".status.yaml", ".coordination.yaml")):
+            continue
+        incident_id = read_fields(path).get('incident_id') or path.stem
+        entry(incident_id)['ikrs'][path.stem] = str(path)
+    for path in sorted(TRUST_DIR.glob("provenance-*.json")):
+        entry(path.name[len("provenance-"):-len(".json")])['provenance'] = str(path)
+
+    if incident_ids:
+        return {i: incidents.get(i) or {'status': None, 'reviews': {}, 'ikrs': {}, 'provenance': None}
+                for i in incident_ids}
+    return dict(sorted(incidents.items()))
+
+def audited_files(incident_id, sources):
+    """Every file an incident's audit reads (for the incremental fingerprint)."""
+    files = {sources['status'] or str(INCIDENT_STORE / f"{incident_id}.status.yaml")}
+    files.update(sources['reviews'].values())
+    files.update(sources['ikrs'].values())
+    files.update(incident_artifacts(incident_id).values())
+    if sources['provenance']:
+        files.add(sources['provenance'])
+        try:
+            with open(sources['provenance'], 'r') as f:
+                leaves = json.load(f).get('merkle_tree', {}).get('leaves', [])
+            files.update(leaf['path'] for leaf in leaves)
+        except (OSError, ValueError):
+            pass
+    for path in sources['ikrs'].values():
+        files.update(v for k, v in read_fields(path).items() if k.startswith('artifacts.'))
+    return sorted(files)
+
+def fingerprint(files):
+    return [[path, stat_key(path)] for path in files]
+
+# ============================================================================
+# RULES
+# ============================================================================
+
+def audit_incident(incident_id, sources):
+    """Findings for one incident: [{"rule", "severity", "message", "artifact"}]."""
+    findings = []
+
+    def finding(rule, severity, message, artifact=None):
+        findings.append({'rule': rule, 'severity': severity, 'message': message, 'artifact': artifact})
+
+    # Lifecycle
+    state = None
+    if sources['status']:
+        try:
+            status = load_status(incident_id)
+        except Exception as e:
+            status = None
+            finding('lifecycle.status', 'fail', f"Status file unreadable: {e}", sources['status'])
+        if status is not None:
+            state = status.get('status')
+            if state not in VALID_STATES:
+                finding('lifecycle.status', 'fail', f"Invalid state {state!r}", sources['status'])
+            history = [item.get('state') for item in status.get('history', [])]
+            for before, after in zip(history, history[1:]):
+                if after not in ALLOWED_TRANSITIONS.get(before, []):
+                    finding('lifecycle.history', 'warn', f"Recorded transition {before} → {after} is not allowed",
+                            sources['status'])
+
+    def gate(rule, phase, what, artifact):
+        # Records older than lifecycle tracking have no status file: flag, don't fail
+        allowed = PHASE_REQUIREMENTS[phase]
+        if not sources['status']:
+            finding(rule, 'warn', f"{what} exists but the incident has no status file", artifact)
+        elif state not in allowed:
+            finding(rule, 'fail', f"{what} exists but state is {state} (requires {' or '.join(allowed)})", artifact)
+
+    # Review records
+    reviews = {}
+    for suffix, path in sources['reviews'].items():
+        fields = reviews[suffix] = read_fields(path)
+        if not fields.get('reviewer.name') or not fields.get('reviewer.role'):
+            finding('review.reviewer', 'fail', "Reviewer name or role missing", path)
+        decision = fields.get('human_decision.decision')
+        if decision not in DECISIONS:
+            finding('review.decision', 'fail', f"Decision {decision!r} is not one of {', '.join(DECISIONS)}", path)
+
+    # Knowledge records (both the Phase 5 index layout and the flat seed layout)
+    for suffix, path in sources['ikrs'].items():
+        gate('memory.gate', 'memory', "IKR", path)
+        ikr = read_fields(path)
+        review = reviews.get(suffix)
+        if review is None:
+            finding('review.finalized', 'fail', f"IKR has no review record (reports/review-record-{suffix}.yaml)",
+                    path)
+        else:
+            if review.get('approval.status') != 'FINALIZED':
+                finding('review.finalized', 'fail',
+                        f"Review record is {review.get('approval.status') or 'not finalized'}, IKR written anyway",
+                        sources['reviews'][suffix])
+            pairs = [
+                ('decision', _first(ikr, 'decision.type', 'decision'), review.get('human_decision.decision')),
+                ('root cause', _first(ikr, 'final_root_cause.summary', 'primary_root_cause'),
+                 review.get('human_decision.final_root_cause')),
+                ('confidence', _first(ikr, 'decision.final_confidence', 'human_confidence'),
+                 review.get('human_decision.final_confidence')),
+            ]
+            for label, recorded, reviewed in pairs:
+                if recorded and reviewed and recorded != reviewed:
+                    finding('ikr.consistency', 'fail',
+                            f"IKR {label} {recorded!r} differs from review record {reviewed!r}", path)
+        for key, artifact in ikr.items():
+            if key.startswith('artifacts.') and not os.path.exists(artifact):
+                finding('ikr.artifacts', 'warn', f"Referenced artifact missing: {artifact}", path)
+
+    # Provenance
+    path = sources['provenance']
+    if path:
+        gate('provenance.gate', 'trust', "Provenance record", path)
+        try:
+            with open(path, 'r') as f:
+                provenance = json.load(f)
+        except (OSError, ValueError) as e:
+            provenance = None
+            finding('provenance.root', 'fail', f"Provenance record unreadable: {e}", path)
+        if provenance and provenance.get('merkle_root'):
+            ok, expected, actual = verify_provenance(provenance)
+            if not ok:
+                finding('provenance.root', 'fail', f"Merkle root {expected} recomputes as {actual}", path)
+        elif provenance:
+            artifacts = incident_artifacts(incident_id)
+            recorded = {name: value for name, value in provenance.get('artifacts', {}).items()
+                        if isinstance(value, str) and value.startswith('sha256:') and value != 'sha256:not_found'}
+            if not recorded:
+                finding('provenance.legacy', 'warn', "No Merkle root or artifact hashes to verify", path)
+            for name, value in recorded.items():
+                artifact = artifacts.get(name)
+                actual = hash_file(artifact) if artifact and os.path.exists(artifact) else None
+                if value != f"sha256:{actual}":
+                    finding('provenance.hashes', 'fail', f"{name} hash does not match {artifact}", path)
+
+    return findings
+
+def _audit_job(job):
+    incident_id, sources = job
+    return audit_incident(incident_id, sources)
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def run_audit(incident_ids=None, incremental=False, jobs_count=None):
+    """
+    Audit the store.
+
+    Returns: report dict (as written to reports/audit-report.json)
+    """
+    incidents = discover(incident_ids)
+    cache = read_cache(CACHE_FILE, AUDIT_VERSION, 'incidents') if incremental else {}
+    prints = {i: fingerprint(audited_files(i, sources)) for i, sources in incidents.items()}
+
+    results = {}
+    pending = []
+    for incident_id, sources in incidents.items():
+        cached = cache.get(incident_id)
+        if cached and cached['fingerprint'] == prints[incident_id]:
+            results[incident_id] = {'audited': 'cached', 'findings': cached['findings']}
+        else:
+            pending.append((incident_id, sources))
+
+    fresh = run_pool(_audit_job, pending, jobs_count)
+    for (incident_id, _), findings in zip(pending, fresh):
+        results[incident_id] = {'audited': 'fresh', 'findings': findings}
+
+    # The cache always reflects the latest audit of each incident
+    cache = read_cache(CACHE_FILE, AUDIT_VERSION, 'incidents')
+    for incident_id, result in results.items():
+        cache[incident_id] = {'fingerprint': prints[incident_id], 'findings': result['findings']}
+    write_cache(CACHE_FILE, AUDIT_VERSION, 'incidents', cache, indent=2)
+
+    rule_counts = {}
+    for result in results.values():
+        for f in result['findings']:
+            rule_counts[f['rule']] = rule_counts.get(f['rule'], 0) + 1
+    findings = [f for result in results.values() for f in result['findings']]
+    report = {
+        'generated_at': datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        'audit_version': AUDIT_VERSION,
+        'incremental': incremental,
+        'summary': {
+            'incidents': len(results),
+            'audited': len(pending),
+            'cached': len(results) - len(pending),
+            'failures': sum(1 for f in findings if f['severity'] == 'fail'),
+            'warnings': sum(1 for f in findings if f['severity'] == 'warn'),
+        },
+        'rule_counts': dict(sorted(rule_counts.items())),
+        'incidents': {i: results[i] for i in incidents},
+    }
+    atomic_write(REPORT_FILE, json.dumps(report, indent=2) + "\n")
+    return report
+
+def print_report(report):
+    summary = report['summary']
+    print(RULE)
+    print("🔎 Incident Store Audit")
+    print(RULE)
+    print(f"  Incidents: {summary['incidents']} ({summary['audited']} audited, "
+          f"{summary['cached']} unchanged since last audit)")
+    print()
+    for incident_id, result in report['incidents'].items():
+        findings = result['findings']
+        if not findings:
+            print(f"  {incident_id:<24} ✓")
+            continue
+        for n, f in enumerate(findings):
+            mark = "✗" if f['severity'] == 'fail' else "⚠"
+            print(f"  {incident_id if n == 0 else '':<24} {mark} {f['rule']}: {f['message']}")
+    print()
+    if report['rule_counts']:
+        print("  By rule: " + ", ".join(f"{rule} {count}" for rule, count in report['rule_counts'].items()))
+    icon = "❌" if summary['failures'] else "✓"
+    print(f"{icon} Audit: {summary['failures']} failure(s), {summary['warnings']} warning(s) "
+          f"— report: {REPORT_FILE}")
+
+def main():
+    args = sys.argv[1:]
+    incident_ids = []
+    incremental = as_json = False
+    jobs_count = None
+
+    i = 0
+    while i < len(args):
+        if args[i] == '--incremental':
+            incremental = True
+            i += 1
+        elif args[i] == '--json':
+            as_json = True
+            i += 1
+        elif args[i] == '--jobs' and i + 1 < len(args):
+            jobs_count = int(args[i + 1])
+            i += 2
+        elif args[i].startswith('--'):
+            raise SystemExit("Usage: audit-incidents.py [incident_id ...] [--incremental] [--jobs N] [--json]")
+        else:
+            incident_ids.append(args[i])
+            i += 1
+
+    report = run_audit(incident_ids or None, incremental, jobs_count)
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    sys.exit(1 if report['summary']['failures'] else 0)
+
+if __name__ == '__main__':
+    main()
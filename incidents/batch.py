@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Batch Helpers: Stat-Keyed JSON Caches & Process Pools
+Shared by the sweeps that re-derive results from many artifacts (audit,
+reindex, hypothesis re-validation, policy and hash caches).
+
+    stat_key(path)                                  # [inode, size, mtime_ns] or None
+    read_cache(path, version, section)              # {} when missing, corrupt or stale
+    write_cache(path, version, section, entries)    # atomic; skipped on a read-only tree
+    run_pool(func, jobs, jobs_count)                # map, in a process pool when worth it
+
+A cache file is {"version": n, "<section>": entries}; bumping the version
+discards every entry, so a changed entry layout never needs migrating.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from atomic import atomic_write
+
+# Pool start-up costs more than running a handful of jobs inline
+MIN_POOL_JOBS = 8
+
+def stat_key(path):
+    """Identity of a file's current contents without reading it (None if absent)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+def read_cache(cache_file, version, section):
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != version:
+        return {}
+    return cache.get(section, {})
+
+def write_cache(cache_file, version, section, entries, **dump_options):
+    try:
+        atomic_write(cache_file, json.dumps({'version': version, section: entries}, **dump_options))
+    except OSError:
+        pass  # Cache is an optimization; a read-only checkout still works
+
+def run_pool(func, jobs, jobs_count=None, min_jobs=MIN_POOL_JOBS):
+    """
+    [func(job) for job in jobs], fanned out over processes for large batches.
+
+    jobs_count caps the workers (default: CPU count). func must be a
+    module-level function so it can be pickled.
+    """
+    jobs = list(jobs)
+    workers = min(jobs_count or os.cpu_count() or 1, len(jobs))
+    if workers > 1 and len(jobs) >= min_jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    return [func(job) for job in jobs]
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Incident Evidence Bundle Storage
+Reads and writes incident bundles in either of two on-disk formats:
+
+  reports/incident-bundle-<id>.json       one pretty-printed JSON document
+  reports/incident-bundle-<id>.jsonl.gz   compact sectioned format
+
+Compact format (the whole file is a valid multi-member gzip stream, so
+`zcat` prints it as JSON Lines):
+
+  member 0   header line, stored uncompressed-deflate and padded to a
+             fixed size so it can be rewritten in place after streaming:
+             {"format": "sherlock-bundle", "version": 2,
+              "sections": {"logs": {"offset", "length", "lines", "fields"}, ...}}
+  member N   one gzip member per top-level section; its JSON Lines are
+             the section object with list fields emptied, then one
+             ["<field>", item] line per list item. A section that is not
+             an object is stored as {"value": x} and flagged "scalar": true
+             in the header; only flagged sections are unwrapped on read
+
+Readers seek to a section's offset and inflate only that member, so
+reading `integrity` out of a large bundle never touches `logs`.
+
+    import sys; sys.path.insert(0, "incidents")
+    from bundle import load_bundle, load_section, write_bundle
+
+    integrity = load_section("reports/incident-bundle-INC-123.jsonl.gz", "integrity")
+    for entry in BundleReader(path).iter_items("logs", "entries"): ...
+
+Both loaders accept either format, so callers do not need to know which
+one sherlock was configured to write.
+"""
+
+import json
+import zlib
+from pathlib import Path
+
+from atomic import atomic_open
+
+FORMAT_NAME = "sherlock-bundle"
+FORMAT_VERSION = 2
+# Version 1 did not flag wrapped scalar sections; its readers guessed from the shape
+READABLE_VERSIONS = (1, 2)
+COMPACT_SUFFIX = ".jsonl.gz"
+
+# Header JSON is padded to this many bytes (incl. newline) so its stored
+# gzip member has a fixed size and can be rewritten once offsets are known
+HEADER_BYTES = 4096
+COMPRESS_LEVEL = 6
+READ_CHUNK = 64 * 1024
+GZIP_WBITS = 31
+
+def bundle_path(incident_id, reports_dir="reports"):
+    """Existing bundle for an incident (.json preferred), else the .json path."""
+    json_path = Path(reports_dir) / f"incident-bundle-{incident_id}.json"
+    compact_path = Path(reports_dir) / f"incident-bundle-{incident_id}{COMPACT_SUFFIX}"
+    if not json_path.exists() and compact_path.exists():
+        return compact_path
+    return json_path
+
+def is_compact(path):
+    return str(path).endswith(COMPACT_SUFFIX)
+
+# ============================================================================
+# WRITING
+# ============================================================================
+
+def _gzip_member(data, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+class BundleWriter:
+    """
+    Streams a compact bundle section by section.
+
+        with BundleWriter(path) as writer:
+            writer.write_section("metadata", metadata)
+            writer.write_section("logs", {"entries": []}, {"entries": entry_iter})
+
+    Output goes through atomic_open: it replaces `path` only on success.
+    """
+
+    def __init__(self, path, level=COMPRESS_LEVEL):
+        self.path = Path(path)
+        self.level = level
+        self.sections = {}
+        self.output = None
+        self.file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.output = atomic_open(self.path, "wb")
+        self.file = self.output.__enter__()
+        self.file.write(self._header_member())  # Placeholder, rewritten on close
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            try:
+                self.file.seek(0)
+                self.file.write(self._header_member())
+            except BaseException as e:
+                self.output.__exit__(type(e), e, e.__traceback__)
+                raise
+        return self.output.__exit__(exc_type, exc, tb)
+
+    def _header_member(self):
+        header = json.dumps({
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "sections": self.sections,
+        }, separators=(",", ":")).encode()
+        if len(header) >= HEADER_BYTES:
+            raise ValueError(f"Bundle header exceeds {HEADER_BYTES} bytes ({len(self.sections)} sections)")
+        return _gzip_member(header.ljust(HEADER_BYTES - 1) + b"\n", 0)
+
+    def write_section(self, name, shell, lists=None, scalar=False):
+        """
+        Write one section.
+
+        shell: the section object; fields named in `lists` are written empty
+        lists: {field: iterable of items}, streamed one line per item
+        scalar: shell is {"value": x} wrapping a non-object section
+        """
+        lists = lists or {}
+        shell = dict(shell)
+        for field in lists:
+            shell[field] = []
+
+        offset = self.file.tell()
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, GZIP_WBITS)
+        lines = 1
+        counts = {}
+
+        self.file.write(compressor.compress(json.dumps(shell, separators=(",", ":")).encode() + b"\n"))
+        for field, items in lists.items():
+            counts[field] = 0
+            for item in items:
+                line = json.dumps([field, item], separators=(",", ":")).encode() + b"\n"
+                self.file.write(compressor.compress(line))
+                counts[field] += 1
+                lines += 1
+        self.file.write(compressor.flush())
+
+        self.sections[name] = {
+            "offset": offset,
+            "length": self.file.tell() - offset,
+            "lines": lines,
+            "fields": counts,
+        }
+        if scalar:
+            self.sections[name]["scalar"] = True
+
+def write_compact(bundle, path, level=COMPRESS_LEVEL):
+    """Write a bundle dict in the compact format (list fields are streamed)."""
+    with BundleWriter(path, level) as writer:
+        for name, value in bundle.items():
+            if isinstance(value, dict):
+                lists = {k: v for k, v in value.items() if isinstance(v, list)}
+                writer.write_section(name, value, lists)
+            else:
+                writer.write_section(name, {"value": value}, scalar=True)
+
+def write_bundle(bundle, path):
+    """Write a bundle in the format implied by its path."""
+    if is_compact(path):
+        write_compact(bundle, path)
+        return
+    with atomic_open(path) as f:
+        json.dump(bundle, f, indent=2)
+
+# ============================================================================
+# READING
+# ============================================================================
+
+class BundleReader:
+    """Lazy reader: only the header is read until a section is requested."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            decompressor = zlib.decompressobj(GZIP_WBITS)
+            header = decompressor.decompress(f.read(HEADER_BYTES + 1024))
+        try:
+            self.header = json.loads(header)
+        except ValueError:
+            raise ValueError(f"Not a compact incident bundle: {self.path}")
+        if self.header.get("format") != FORMAT_NAME:
+            raise ValueError(f"Not a compact incident bundle: {self.path}")
+        if self.header.get("version") not in READABLE_VERSIONS:
+            raise ValueError(f"Unsupported bundle version {self.header.get('version')}: {self.path}")
+        self.sections = self.header["sections"]
+
+    def _lines(self, name):
+        """Decompressed lines of one section, inflated incrementally."""
+        if name not in self.sections:
+            raise KeyError(f"Bundle has no section '{name}': {self.path}")
+        entry = self.sections[name]
+
+        decompressor = zlib.decompressobj(GZIP_WBITS)
+        pending = b""
+        with open(self.path, "rb") as f:
+            f.seek(entry["offset"])
+            remaining = entry["length"]
+            while remaining:
+                chunk = f.read(min(READ_CHUNK, remaining))
+                if not chunk:
+                    raise ValueError(f"Truncated section '{name}': {self.path}")
+                remaining -= len(chunk)
+                pending += decompressor.decompress(chunk)
+                *complete, pending = pending.split(b"\n")
+                for line in complete:
+                    yield line
+        pending += decompressor.flush()
+        if pending.strip():
+            yield pending
+
+    def section(self, name):
+        """Fully materialized section object."""
+        lines = self._lines(name)
+        shell = json.loads(next(lines))
+        for line in lines:
+            field, item = json.loads(line)
+            shell[field].append(item)
+        entry = self.sections[name]
+        if entry.get("scalar"):
+            return shell["value"]
+        if self.header["version"] == 1 and set(shell) == {"value"} and not entry["fields"]:
+            return shell["value"]
+        return shell
+
+    def iter_items(self, name, field):
+        """Stream the items of one list field without materializing the section."""
+        lines = self._lines(name)
+        next(lines)
+        for line in lines:
+            item_field, item = json.loads(line)
+            if item_field == field:
+                yield item
+
+    def load(self):
+        return {name: self.section(name) for name in self.sections}
+
+def load_bundle(path):
+    """Whole bundle as a dict, from either format."""
+    if is_compact(path):
+        return BundleReader(path).load()
+    with open(path, "r") as f:
+        return json.load(f)
+
+def load_section(path, name):
+    """One top-level bundle section, from either format (lazy for compact)."""
+    if is_compact(path):
+        return BundleReader(path).section(name)
+    with open(path, "r") as f:
+        return json.load(f)[name]
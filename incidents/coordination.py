@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Incident Coordination Model
+Parsed, indexed form of incidents/<id>.coordination.yaml.
+
+Platform-wide incidents can declare hundreds of services. The record is
+parsed once per incident and indexed by service name and by role, so
+scope checks and role lookups are dict lookups instead of list scans:
+
+    import sys; sys.path.insert(0, "incidents")
+    from coordination import load_coordination
+
+    coord = load_coordination("INC-456")
+    coord.has_service("api-gateway")              # O(1)
+    coord.service_role("api-gateway")             # "downstream_impact"
+    coord.services_with_role("primary_candidate") # [{"name": ...}, ...]
+
+No inference happens here. Roles are exactly what the incident
+commander declared.
+"""
+
+from collections import Counter
+from pathlib import Path
+
+COORDINATION_DIR = Path("incidents")
+
+def parse_yaml_simple(file_path):
+    """Simple YAML parser for our coordination record format."""
+    with open(file_path, 'r') as f:
+        lines = f.readlines()
+
+    data = {}
+    current_key = None
+    services = []
+    current_service = None
+    notes = []
+
+    for line in lines:
+        line = line.rstrip('\n')
+
+        # Skip empty lines and comments
+        if not line.strip() or line.strip().startswith('#'):
+            continue
+
+        # Top-level keys (no indentation)
+        if line and not line.startswith(' '):
+            if ':' in line:
+                key, value = line.split(':', 1)
+                key = key.strip()
+                value = value.strip().strip('"')
+
+                if key in ('declared_by', 'services', 'coordination_notes'):
+                    current_key = key
+                    if key == 'declared_by':
+                        data[key] = {}
+                else:
+                    data[key] = value if value else ''
+                    current_key = key
+
+        # Second-level indentation (2 spaces)
+        elif line.startswith('  ') and not line.startswith('    '):
+            if current_key == 'declared_by':
+                if ':' in line:
+                    key, value = line.strip().split(':', 1)
+                    data['declared_by'][key.strip()] = value.strip().strip('"')
+
+            elif current_key == 'services':
+                if line.strip().startswith('- name:'):
+                    # Save previous service
+                    if current_service and 'name' in current_service:
+                        services.append(current_service)
+                    # Start new service
+                    current_service = {'name': line.split(':', 1)[1].strip()}
+
+            elif current_key == 'coordination_notes':
+                if line.strip().startswith('- '):
+                    note = line.strip()[2:].strip().strip('"')
+                    notes.append(note)
+
+        # Third-level indentation (4 spaces) - service properties
+        elif line.startswith('    ') and current_service is not None and current_key == 'services':
+            if ':' in line:
+                key, value = line.strip().split(':', 1)
+                current_service[key.strip()] = value.strip().strip('"')
+
+    # Add last service
+    if current_service and 'name' in current_service:
+        services.append(current_service)
+
+    if services:
+        data['services'] = services
+    if notes:
+        data['coordination_notes'] = notes
+
+    return data
+
+class CoordinationRecord:
+    """Coordination record indexed by service name and role."""
+
+    def __init__(self, data):
+        self.data = data
+        self.services = data.get('services', [])
+        self.by_name = {}
+        self.by_role = {}
+
+        for service in self.services:
+            name = service.get('name')
+            # First declaration wins; duplicates are reported by duplicate_services()
+            self.by_name.setdefault(name, service)
+            self.by_role.setdefault(service.get('role', 'unknown'), []).append(service)
+
+    @property
+    def incident_id(self):
+        return self.data.get('incident_id', 'Unknown')
+
+    def get(self, key, default=None):
+        """Dict-style access to top-level record fields."""
+        return self.data.get(key, default)
+
+    def service_names(self):
+        return [s.get('name') for s in self.services]
+
+    def has_service(self, service_name):
+        return service_name in self.by_name
+
+    def service(self, service_name):
+        return self.by_name.get(service_name)
+
+    def service_role(self, service_name):
+        service = self.by_name.get(service_name)
+        return service.get('role', 'unknown') if service else 'unknown'
+
+    def services_with_role(self, role):
+        return self.by_role.get(role, [])
+
+    def duplicate_services(self):
+        """Service names declared more than once (a record authoring error)."""
+        counts = Counter(s.get('name') for s in self.services)
+        return sorted(name for name, count in counts.items() if count > 1)
+
+def coordination_path(incident_id, coordination_dir=COORDINATION_DIR):
+    return Path(coordination_dir) / f"{incident_id}.coordination.yaml"
+
+def load_coordination(incident_id, coordination_dir=COORDINATION_DIR):
+    """
+    Load and index an incident coordination record.
+
+    Returns: CoordinationRecord, or None for single-service incidents
+    (no coordination file). Parse errors propagate to the caller.
+    """
+    coord_file = coordination_path(incident_id, coordination_dir)
+    if not coord_file.exists():
+        return None
+    return CoordinationRecord(parse_yaml_simple(coord_file))
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Incident Knowledge Record Extraction (Phase 5)
+Derives an incident's knowledge record (IKR) from its review record,
+postmortem and scope audit.
+
+Signals and category come from one scan per text: every keyword the rules
+use is found by a single overlapping-match regex over the lowercased text
+(KeywordMatcher), then the rules are evaluated against that set.
+
+Two modes:
+  - Phase 5 (called by sherlock investigate): one incident, published
+    exclusively so an existing record is never overwritten
+  - Reindex (sherlock reindex): every FINALIZED review record whose
+    incident passes the memory gate is extracted in a process pool.
+    Missing IKRs are created; an existing IKR is only rewritten when it was
+    written under an older INDEX_SCHEMA, and never when its decision, root
+    cause or confidence differ from the review record (reported as a
+    conflict; --force rewrites both cases). Review records, postmortems
+    and audits are only read, never rewritten
+
+Usage:
+    extract-index.py <review_record> <postmortem> <scope_audit> <output>
+    extract-index.py reindex [--jobs N] [--force] [--dry-run]
+"""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from atomic import atomic_write, incident_lock  # noqa: E402
+from batch import run_pool  # noqa: E402
+from lifecycle import check_phase_gate  # noqa: E402
+
+REPORTS_DIR = Path("reports")
+INCIDENT_STORE = Path("incidents")
+
+# Recorded in every IKR; bump when the record layout or extraction rules
+# change so reindex rewrites records written under an older schema
+INDEX_SCHEMA = 1
+
+# Postmortem signals: every keyword group must match (any keyword within a group)
+SIGNAL_RULES = [
+    ('memory_growth', [('memory',), ('growth',)]),
+    ('error_rate_spike', [('error rate', 'error_rate')]),
+    ('latency_degradation', [('latency', 'timeout')]),
+    ('crash_loop', [('crash',)]),
+]
+
+# Root cause category: first rule with a matching keyword wins
+CATEGORY_RULES = [
+    ('Application', ('cache', 'code')),
+    ('Config', ('config', 'deployment')),
+    ('Infra', ('infra', 'hardware')),
+    ('Dependency', ('dependency', 'library')),
+    ('Traffic', ('traffic', 'load')),
+]
+DEFAULT_CATEGORY = 'Application'
+
+class KeywordMatcher:
+    """Substring search for many keywords in one regex pass (overlapping matches included)."""
+
+    def __init__(self, keywords):
+        # Longest first: at one position only the first alternative is reported,
+        # so no keyword may be a prefix of another
+        ordered = sorted(set(keywords), key=len, reverse=True)
+        self.pattern = re.compile('(?=(' + '|'.join(re.escape(k) for k in ordered) + '))')
+
+    def found(self, text):
+        return {match.group(1) for match in self.pattern.finditer(text.lower())}
+
+SIGNAL_MATCHER = KeywordMatcher(k for _, groups in SIGNAL_RULES for group in groups for k in group)
+CATEGORY_MATCHER = KeywordMatcher(k for _, keywords in CATEGORY_RULES for k in keywords)
+
+# ============================================================================
+# EXTRACTION
+# ============================================================================
+
+def parse_yaml_value(lines, key):
+    """Simple YAML parser for our specific format"""
+    for i, line in enumerate(lines):
+        if line.strip().startswith(f'{key}:'):
+            value = line.split(':', 1)[1].strip().strip('"')
+            return value
+    return None
+
+def parse_nested_yaml_value(lines, parent_key, child_key):
+    """Parse nested YAML values"""
+    in_section = False
+    for line in lines:
+        if line.strip().startswith(f'{parent_key}:'):
+            in_section = True
+            continue
+        if in_section:
+            if line.startswith('  ') and child_key in line:
+                value = line.split(':', 1)[1].strip().strip('"')
+                return value
+            if not line.startswith('  '):
+                break
+    return None
+
+def extract_signals(postmortem):
+    found = SIGNAL_MATCHER.found(postmortem)
+    return [signal for signal, groups in SIGNAL_RULES
+            if all(any(k in found for k in group) for group in groups)]
+
+def extract_category(root_cause):
+    found = CATEGORY_MATCHER.found(root_cause)
+    return next((category for category, keywords in CATEGORY_RULES if any(k in found for k in keywords)),
+                DEFAULT_CATEGORY)
+
+def extract_record(review_record_path, postmortem_path, scope_audit_path):
+    """
+    Build one IKR from its source artifacts.
+
+    Returns: (record_text, summary) where summary holds the fields printed
+    after indexing (incident_id, category, signals, hypotheses, delta)
+    """
+    # Load review record (YAML format - parse manually to avoid dependency)
+    with open(review_record_path, 'r') as f:
+        lines = f.readlines()
+
+    incident_id = parse_yaml_value(lines, 'incident_id')
+    review_time = parse_yaml_value(lines, 'review_time')
+    reviewer_role = parse_nested_yaml_value(lines, 'reviewer', 'role')
+    ai_confidence = parse_nested_yaml_value(lines, 'ai_proposal', 'confidence')
+    final_confidence = parse_nested_yaml_value(lines, 'human_decision', 'final_confidence')
+    final_root_cause = parse_nested_yaml_value(lines, 'human_decision', 'final_root_cause')
+    decision_type = parse_nested_yaml_value(lines, 'human_decision', 'decision')
+
+    # Load scope audit
+    with open(scope_audit_path, 'r') as f:
+        scope_audit = json.load(f)
+
+    service = scope_audit['scope_summary']['service']
+
+    # Load postmortem for signal extraction
+    with open(postmortem_path, 'r') as f:
+        postmortem = f.read()
+
+    signals = extract_signals(postmortem)
+    category = extract_category(final_root_cause)
+
+    # Count hypotheses from postmortem
+    hypothesis_count = len(re.findall(r'### Hypothesis \d+:', postmortem))
+    ruled_out_count = len(re.findall(r'\*\*Status:\*\* RULED_OUT', postmortem))
+
+    # Extract remediation promises from postmortem
+    remediation_section = ""
+    if '## Remediation' in postmortem:
+        remediation_section = postmortem.split('## Remediation')[1].split('##')[0]
+
+    promised_actions = []
+    for line in remediation_section.split('\n'):
+        if line.strip().startswith('-') or re.match(r'^\d+\.', line.strip()):
+            action = re.sub(r'^[-\d\.]+\s*', '', line.strip())
+            if action and len(action) > 10:  # Filter out short lines
+                promised_actions.append(action[:100])  # Limit length
+
+    ai_conf = int(ai_confidence.split('#')[0].strip()) if ai_confidence else 0
+    human_conf = int(final_confidence.split('#')[0].strip()) if final_confidence else 0
+    delta = human_conf - ai_conf
+
+    # Build incident index record
+    incident_record = f"""# Incident Index Record: {incident_id}
+
+incident_id: {incident_id}
+timestamp: {review_time}
+index_schema: {INDEX_SCHEMA}
+
+service: {service}
+environment: demo
+
+final_root_cause:
+  summary: "{final_root_cause}"
+  category: {category}
+
+decision:
+  type: {decision_type}
+  reviewer_role: {reviewer_role}
+  final_confidence: {human_conf}
+
+ai_vs_human:
+  ai_confidence: {ai_conf}
+  human_confidence: {human_conf}
+  delta: {delta}
+
+signals:
+"""
+
+    for signal in signals:
+        incident_record += f"  - {signal}\n"
+
+    if not signals:
+        incident_record += "  []\n"
+
+    incident_record += f"""
+hypotheses:
+  total: {hypothesis_count}
+  ruled_out: {ruled_out_count}
+
+remediation:
+  promised:
+"""
+
+    for action in promised_actions[:5]:  # Limit to 5 actions
+        incident_record += f'    - "{action}"\n'
+
+    if not promised_actions:
+        incident_record += "    []\n"
+
+    incident_record += """  status:
+"""
+
+    for action in promised_actions[:5]:
+        incident_record += f'''    - action: "{action}"
+      completed: false
+'''
+
+    if not promised_actions:
+        incident_record += "    []\n"
+
+    incident_record += f"""
+artifacts:
+  review_record: {review_record_path}
+  postmortem: {postmortem_path}
+"""
+
+    summary = {
+        'incident_id': incident_id,
+        'category': category,
+        'signals': signals,
+        'hypotheses': (hypothesis_count, ruled_out_count),
+        'delta': delta,
+    }
+    return incident_record, summary
+
+def print_summary(output_path, summary):
+    hypothesis_count, ruled_out_count = summary['hypotheses']
+    print(f"✓ Incident indexed: {output_path}")
+    print(f"  • Category: {summary['category']}")
+    print(f"  • Signals: {', '.join(summary['signals']) if summary['signals'] else 'none'}")
+    print(f"  • Hypotheses: {hypothesis_count} total, {ruled_out_count} ruled out")
+    print(f"  • Confidence delta: {summary['delta']:+d}%")
+
+def index_incident(review_record_path, postmortem_path, scope_audit_path, output_path):
+    """Phase 5: extract one IKR and publish it exclusively (append-only)."""
+    incident_record, summary = extract_record(review_record_path, postmortem_path, scope_audit_path)
+
+    # Write to institutional memory (exclusive publish: a concurrent run that
+    # raced past the duplicate check cannot overwrite an existing record)
+    try:
+        with incident_lock(summary['incident_id']):
+            atomic_write(output_path, incident_record, exclusive=True)
+    except FileExistsError:
+        print(f"⚠️  Incident {summary['incident_id']} already exists in memory: {output_path}")
+        print("   Phase 5 write aborted (append-only guarantee)")
+        sys.exit(1)
+
+    print_summary(output_path, summary)
+
+# ============================================================================
+# REINDEX
+# ============================================================================
+
+def find_sources(reports_dir=REPORTS_DIR, store=INCIDENT_STORE, status_dir=INCIDENT_STORE):
+    """
+    IKR jobs for every review record in reports/ that Phase 5 would index.
+
+    A review record is only indexed when it is FINALIZED and its incident
+    passes the memory phase gate (POSTMORTEM_COMPLETE), the same checks
+    sherlock investigate makes before Phase 5.
+
+    Returns: (jobs, skipped) - jobs are (review_record, postmortem,
+    scope_audit, output) paths; skipped is [(review_record, reason)]
+    """
+    jobs = []
+    skipped = []
+    for review_record in sorted(reports_dir.glob("review-record-*.yaml")):
+        # File suffix is <incident_id> or <incident_id>-<service>; the scope
+        # audit is per incident, the postmortem and IKR follow the suffix
+        suffix = review_record.name[len("review-record-"):-len(".yaml")]
+        with open(review_record, 'r') as f:
+            lines = f.readlines()
+        incident_id = parse_yaml_value(lines, 'incident_id') or suffix
+        approval = _field(parse_nested_yaml_value(lines, 'approval', 'status'))
+        postmortem = reports_dir / f"postmortem-{suffix}.md"
+        scope_audit = reports_dir / f"scope-audit-{incident_id}.json"
+        if approval != 'FINALIZED':
+            skipped.append((str(review_record), f"review record is {approval or 'not finalized'}, not FINALIZED"))
+            continue
+        try:
+            gate = check_phase_gate(incident_id, 'memory', status_dir)
+        except Exception as e:
+            skipped.append((str(review_record), f"status file unreadable: {e}"))
+            continue
+        if not gate['allowed']:
+            state = gate['state'] or 'no status file'
+            skipped.append((str(review_record), f"memory gate closed ({state})"))
+        elif not postmortem.exists():
+            skipped.append((str(review_record), f"no {postmortem}"))
+        elif not scope_audit.exists():
+            skipped.append((str(review_record), f"no {scope_audit}"))
+        else:
+            jobs.append((str(review_record), str(postmortem), str(scope_audit), str(store / f"{suffix}.yaml")))
+    return jobs, skipped
+
+def _field(value):
+    """Parsed YAML value without its trailing comment or quotes."""
+    if value is None:
+        return None
+    return value.split(' #', 1)[0].strip().strip('"') or None
+
+def record_schema(lines):
+    """INDEX_SCHEMA an IKR was written with (records predating the field are schema 1)."""
+    schema = parse_yaml_value(lines, 'index_schema')
+    return int(schema) if schema else 1
+
+def decision_conflicts(ikr_lines, review_lines):
+    """
+    Decision fields where an existing IKR and its review record disagree.
+
+    Returns: [(label, ikr_value, review_value)]
+    """
+    pairs = [
+        ('decision', parse_nested_yaml_value(ikr_lines, 'decision', 'type'),
+         parse_nested_yaml_value(review_lines, 'human_decision', 'decision')),
+        ('root cause', parse_nested_yaml_value(ikr_lines, 'final_root_cause', 'summary'),
+         parse_nested_yaml_value(review_lines, 'human_decision', 'final_root_cause')),
+        ('confidence', parse_nested_yaml_value(ikr_lines, 'decision', 'final_confidence'),
+         parse_nested_yaml_value(review_lines, 'human_decision', 'final_confidence')),
+    ]
+    return [(label, _field(recorded), _field(reviewed)) for label, recorded, reviewed in pairs
+            if _field(recorded) != _field(reviewed)]
+
+def _extract_job(job):
+    return extract_record(*job[:3])
+
+def reindex(jobs_count=None, force=False, dry_run=False):
+    jobs, skipped = find_sources()
+
+    # Existing IKRs are institutional memory: only a schema bump (or --force)
+    # rewrites them, and never over a decision that differs from the review
+    pending = []
+    current = 0
+    conflicts = []
+    for job in jobs:
+        review_record, output_path = job[0], job[3]
+        try:
+            with open(output_path, 'r') as f:
+                ikr_lines = f.readlines()
+        except FileNotFoundError:
+            pending.append(job)
+            continue
+        if not force and record_schema(ikr_lines) >= INDEX_SCHEMA:
+            current += 1
+            continue
+        with open(review_record, 'r') as f:
+            differences = decision_conflicts(ikr_lines, f.readlines())
+        if differences and not force:
+            conflicts.append((output_path, differences))
+        else:
+            pending.append(job)
+
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print("📚 Reindexing Incident Knowledge Records")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(f"  Review records: {len(jobs) + len(skipped)} "
+          f"({len(pending)} to extract, {current} current, {len(conflicts)} in conflict, {len(skipped)} skipped)")
+
+    results = run_pool(_extract_job, pending, jobs_count)
+
+    counts = {'written': 0, 'same': 0}
+    for job, (incident_record, summary) in zip(pending, results):
+        output_path = job[3]
+        exists = os.path.exists(output_path)
+        if exists:
+            with open(output_path, 'r') as f:
+                if f.read() == incident_record:
+                    counts['same'] += 1
+                    continue
+        counts['written'] += 1
+        action = "would write" if dry_run else ("updated" if exists else "created")
+        print(f"  ✏️  {output_path} ({action}; category {summary['category']}, "
+              f"signals: {', '.join(summary['signals']) or 'none'})")
+        if not dry_run:
+            # New records are published exclusively, like Phase 5
+            with incident_lock(summary['incident_id']):
+                atomic_write(output_path, incident_record, exclusive=not exists)
+
+    for output_path, differences in conflicts:
+        for label, recorded, reviewed in differences:
+            print(f"  ⚠️  {output_path} conflict: IKR {label} {recorded!r} ≠ review record {reviewed!r}")
+        print("      left as recorded (use --force to overwrite)")
+
+    for review_record, reason in skipped:
+        print(f"  ⏭️  {review_record} skipped ({reason})")
+
+    print()
+    verb = "would change" if dry_run else "written"
+    print(f"✓ Reindex complete: {counts['written']} {verb}, {counts['same'] + current} already current, "
+          f"{len(conflicts)} conflicts left as recorded")
+
+def main():
+    args = sys.argv[1:]
+    if args[:1] == ['reindex']:
+        jobs_count = None
+        force = dry_run = False
+        i = 1
+        while i < len(args):
+            if args[i] == '--jobs' and i + 1 < len(args):
+                jobs_count = int(args[i + 1])
+                i += 2
+            elif args[i] == '--force':
+                force = True
+                i += 1
+            elif args[i] == '--dry-run':
+                dry_run = True
+                i += 1
+            else:
+                raise SystemExit("Usage: extract-index.py reindex [--jobs N] [--force] [--dry-run]")
+        reindex(jobs_count, force, dry_run)
+        return
+
+    if len(args) != 4:
+        print("Usage: extract-index.py <review_record> <postmortem> <scope_audit> <output>")
+        print("       extract-index.py reindex [--jobs N] [--force] [--dry-run]")
+        sys.exit(1)
+    index_incident(*args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Incident Summary Generator
+Aggregates per-service analyses into multi-service incident summary.
+
+Purpose: Show complete incident picture WITHOUT violating service sovereignty.
+Each service keeps its own RCA. Summary reports facts, not synthesis.
+
+The coordination record is parsed once. Per-service artifacts (review
+record, postmortem) are loaded concurrently in a thread pool and the
+report is written section by section as results arrive, in coordination
+record order.
+
+Usage: generate-summary.py <incident_id>
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from atomic import atomic_open  # noqa: E402
+from coordination import coordination_path, load_coordination  # noqa: E402
+
+REPORTS_DIR = Path("reports")
+MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+BLUE = '\033[0;34m'
+NC = '\033[0m'
+
+RULE = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+HEADER = """# Multi-Service Incident Summary
+
+**Purpose:** This document aggregates per-service analyses for a multi-service incident.  
+**Not a synthesis:** Each service maintains sovereignty. No cross-service root cause.  
+**Not AI-generated:** Facts from coordination record and service postmortems only.
+
+---
+
+"""
+
+FOOTER = """
+## Reading This Summary
+
+This summary aggregates service-specific analyses. Key principles:
+
+1. **Service Sovereignty:** Each service owns its root cause analysis
+2. **No Cross-Service Synthesis:** This summary reports facts, not correlations
+3. **Incident ≠ RCA:** Incident has coordination; each service has its own RCA
+4. **Primary Candidate:** Service most likely to contain root cause (must be finalized)
+5. **Governance Preserved:** Each service follows its own approval requirements
+
+For detailed analysis of any service, refer to its individual postmortem.
+
+"""
+
+def strip_value(value):
+    """Strip trailing comment and quotes from a simple YAML scalar."""
+    return value.split('#', 1)[0].strip().strip('"')
+
+def parse_review_record(review_file):
+    """Single pass over a review record for the fields the summary reports."""
+    review = {
+        'status': '',
+        'reviewed_by': '',
+        'determination': '',
+        'action_items': [],
+    }
+    section = None
+
+    with open(review_file, 'r') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#') or ':' not in stripped:
+                continue
+
+            key, value = stripped.split(':', 1)
+            key = key.lstrip('- ').strip()
+
+            if not line.startswith(' '):
+                section = key
+
+            if key == 'status' and section == 'approval' and not review['status']:
+                review['status'] = strip_value(value)
+            elif key == 'name' and section in ('approval', 'reviewer') and not review['reviewed_by']:
+                review['reviewed_by'] = strip_value(value)
+            elif key == 'determination' and not review['determination']:
+                review['determination'] = strip_value(value)
+            elif key == 'action_item':
+                review['action_items'].append(strip_value(value))
+
+    return review
+
+def extract_what_happened(postmortem_file):
+    """Lines of the postmortem's 'What Happened' section, or None if absent."""
+    lines = None
+    with open(postmortem_file, 'r') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            if lines is None:
+                if '## What Happened' in line:
+                    lines = []
+            elif line.startswith('##'):
+                break
+            else:
+                lines.append(line)
+    return lines
+
+def load_service_artifacts(incident_id, service, reports_dir=REPORTS_DIR):
+    """Load one service's review record and postmortem (runs in the pool)."""
+    service_name = service.get('name')
+    review_file = Path(reports_dir) / f"review-record-{incident_id}-{service_name}.yaml"
+    postmortem_file = Path(reports_dir) / f"postmortem-{incident_id}-{service_name}.md"
+
+    artifacts = {
+        'name': service_name,
+        'role': service.get('role', 'unknown'),
+        'review': None,
+        'postmortem': None,
+        'what_happened': None,
+    }
+
+    if review_file.exists():
+        artifacts['review'] = parse_review_record(review_file)
+        if postmortem_file.exists():
+            artifacts['postmortem'] = str(postmortem_file)
+            artifacts['what_happened'] = extract_what_happened(postmortem_file)
+
+    return artifacts
+
+def render_service(artifacts):
+    """Markdown section for one service."""
+    out = [f"### Service: {artifacts['name']}", "", f"**Role:** {artifacts['role']}", ""]
+
+    review = artifacts['review']
+    if review is None:
+        out += [
+            "⚠️  **STATUS:** Not yet reviewed", "",
+            "_No review record found. This service's analysis is incomplete._", "",
+        ]
+    else:
+        out += [
+            f"✓ **STATUS:** {review['status']}",
+            f"**Reviewed by:** {review['reviewed_by']}",
+            f"**Determination:** {review['determination']}",
+            "",
+        ]
+
+        if artifacts['postmortem']:
+            out += ["**Root Cause (Service-Local):**", ""]
+            if artifacts['what_happened'] is not None:
+                out += artifacts['what_happened']
+            else:
+                out.append(f"_See postmortem: {artifacts['postmortem']}_")
+            out.append("")
+
+        if review['action_items']:
+            out += ["**Action Items:**", ""]
+            out += [f"- {item}" for item in review['action_items']]
+            out.append("")
+
+    out += ["---", ""]
+    return "\n".join(out) + "\n"
+
+def render_summary(coordination, reports_dir=REPORTS_DIR, stats=None):
+    """
+    Yield the summary markdown in chunks, in document order.
+
+    Per-service artifacts load concurrently; each service section is
+    yielded as soon as it and all services before it are ready.
+    `stats` (if given) is filled with service/finalized counts.
+    """
+    incident_id = coordination.incident_id
+    declared_by = coordination.get('declared_by', {})
+    generated = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+    yield HEADER
+    yield (
+        "## Incident Metadata\n\n"
+        f"- **Incident ID:** {incident_id}\n"
+        f"- **Title:** {coordination.get('incident_title', '')}\n"
+        f"- **Severity:** {coordination.get('incident_severity', '')}\n"
+        f"- **Declared by:** {declared_by.get('name', '')}\n"
+        f"- **Generated:** {generated}\n\n"
+        "---\n\n"
+        "## Services Involved\n\n"
+    )
+
+    yield "".join(
+        f"- **{s.get('name')}** ({s.get('role', 'unknown')})\n  - {s.get('justification', '')}\n"
+        for s in coordination.services
+    )
+    yield "\n---\n\n## Per-Service Analysis\n\n"
+
+    stats = stats if stats is not None else {}
+    stats.update(services=0, finalized=0)
+    review_status = {}
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        loaded = pool.map(lambda s: load_service_artifacts(incident_id, s, reports_dir),
+                          coordination.services)
+        for artifacts in loaded:
+            stats['services'] += 1
+            print(f"Processing: {artifacts['name']}")
+            if artifacts['review'] is not None:
+                review_status[artifacts['name']] = artifacts['review']['status']
+                if artifacts['review']['status'] == 'FINALIZED':
+                    stats['finalized'] += 1
+            yield render_service(artifacts)
+
+    notes = coordination.get('coordination_notes', [])
+    if notes:
+        yield "## Coordination Notes\n\n" + "".join(f"- {n}\n" for n in notes) + "\n---\n\n"
+
+    yield (
+        "\n## Summary Statistics\n\n"
+        f"- **Total Services:** {stats['services']}\n"
+        f"- **Finalized Reviews:** {stats['finalized']}\n"
+        f"- **Pending Reviews:** {stats['services'] - stats['finalized']}\n\n"
+    )
+
+    primary_services = coordination.services_with_role('primary_candidate')
+    closure = []
+    for service in primary_services:
+        name = service.get('name')
+        status = review_status.get(name)
+        if status is None:
+            closure.append(f"**Incident Closure:** ⚠️  Awaiting primary candidate review ({name})")
+        elif status == 'FINALIZED':
+            closure.append(f"**Incident Closure:** ✓ Primary candidate finalized ({name})")
+        else:
+            closure.append(f"**Incident Closure:** ⚠️  Awaiting primary candidate finalization ({name})")
+    if not closure:
+        closure.append("**Incident Closure:** No primary candidate declared")
+
+    yield "\n".join(closure) + "\n\n---\n\n"
+    yield FOOTER
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: generate-summary.py <incident_id>")
+        sys.exit(1)
+
+    incident_id = sys.argv[1]
+    output_file = REPORTS_DIR / f"incident-summary-{incident_id}.md"
+
+    print(f"{BLUE}{RULE}{NC}")
+    print(f"{BLUE}Incident Summary Generator{NC}")
+    print(f"{BLUE}{RULE}{NC}")
+    print()
+
+    coordination_file = coordination_path(incident_id)
+    coordination = load_coordination(incident_id)
+    if coordination is None:
+        print(f"{RED}❌ COORDINATION FILE NOT FOUND{NC}")
+        print(f"   Expected: {coordination_file}")
+        print()
+        print("   This tool is for multi-service incidents only.")
+        print("   For single-service incidents, use the standard postmortem.")
+        sys.exit(1)
+
+    print(f"Incident: {incident_id}")
+    print(f"Coordination: {coordination_file}")
+    print()
+    print(f"Title: {coordination.get('incident_title', '')}")
+    print(f"Severity: {coordination.get('incident_severity', '')}")
+    print(f"Declared by: {coordination.get('declared_by', {}).get('name', '')}")
+    print()
+
+    print("Extracting service analyses...")
+    REPORTS_DIR.mkdir(exist_ok=True)
+
+    stats = {}
+    with atomic_open(output_file) as f:
+        for chunk in render_summary(coordination, stats=stats):
+            f.write(chunk)
+
+    print()
+    print(f"{GREEN}✓ Summary generated{NC}")
+    print(f"   Output: {output_file}")
+    print()
+    print(f"Services processed: {stats['services']}")
+    print(f"Finalized reviews: {stats['finalized']}")
+    print()
+
+    # Display summary
+    print(f"{BLUE}{RULE}{NC}")
+    print(f"{BLUE}Summary Preview{NC}")
+    print(f"{BLUE}{RULE}{NC}")
+    print()
+    with open(output_file, 'r') as f:
+        for _, line in zip(range(30), f):
+            print(line, end='')
+    print()
+    print(f"... (see full report at {output_file})")
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Incident Lifecycle Gate API
+Importable form of the lifecycle rules enforced by validate-status.py.
+
+Core Principle: Human sets state. System enforces. AI never changes state.
+
+Usage (in-process, no interpreter start-up per check):
+
+    import sys; sys.path.insert(0, "incidents")
+    from lifecycle import check_phase_gate, check_gates
+
+    check_phase_gate("INC-123", "finalize")
+    check_gates(["INC-123", "INC-999"], ["investigate", "memory"])
+
+Results are plain dicts so they can be serialized straight to JSON:
+
+    {"incident_id": "INC-123", "phase": "finalize", "allowed": False,
+     "state": "POSTMORTEM_COMPLETE", "required_states": ["RESOLVED"],
+     "reason": "state_not_allowed"}
+"""
+
+from pathlib import Path
+
+# Default location of incidents/<id>.status.yaml (relative to repo root)
+STATUS_DIR = Path("incidents")
+
+# Valid lifecycle states
+VALID_STATES = [
+    'OPEN',
+    'MITIGATING',
+    'MONITORING',
+    'RESOLVED',
+    'POSTMORTEM_COMPLETE'
+]
+
+# State transition rules
+ALLOWED_TRANSITIONS = {
+    'OPEN': ['MITIGATING', 'RESOLVED'],  # Can skip straight to RESOLVED if quick fix
+    'MITIGATING': ['MONITORING', 'RESOLVED'],
+    'MONITORING': ['MITIGATING', 'RESOLVED'],  # Can regress if issue returns
+    'RESOLVED': ['POSTMORTEM_COMPLETE', 'MITIGATING'],  # Can regress if issue returns
+    'POSTMORTEM_COMPLETE': []  # Terminal state
+}
+
+# Role-based transition authorization
+TRANSITION_ROLES = {
+    'OPEN->MITIGATING': ['Incident Commander', 'SRE', 'SRE Lead'],
+    'MITIGATING->MONITORING': ['Incident Commander', 'SRE Lead'],
+    'MONITORING->RESOLVED': ['Incident Commander'],
+    'RESOLVED->POSTMORTEM_COMPLETE': ['Incident Commander', 'SRE', 'SRE Lead'],
+    # Regression paths (issue returns)
+    'MONITORING->MITIGATING': ['Incident Commander', 'SRE Lead'],
+    'RESOLVED->MITIGATING': ['Incident Commander'],
+}
+
+# Phase requirements
+PHASE_REQUIREMENTS = {
+    'investigate': ['OPEN', 'MITIGATING'],
+    'finalize': ['RESOLVED'],
+    'memory': ['POSTMORTEM_COMPLETE'],
+    'actions': ['MITIGATING'],
+    'trust': ['POSTMORTEM_COMPLETE'],
+}
+
+def parse_yaml_simple(file_path):
+    """Simple YAML parser for status files."""
+    with open(file_path, 'r') as f:
+        lines = f.readlines()
+
+    data = {}
+    current_key = None
+    history = []
+    current_history_item = None
+    notes = []
+
+    for line in lines:
+        line = line.rstrip('\n')
+
+        # Skip empty lines and comments
+        if not line.strip() or line.strip().startswith('#'):
+            continue
+
+        # Top-level keys
+        if line and not line.startswith(' '):
+            if ':' in line:
+                key, value = line.split(':', 1)
+                key = key.strip()
+                value = value.strip().strip('"')
+
+                if key in ('set_by', 'history', 'notes'):
+                    current_key = key
+                    if key == 'set_by':
+                        data[key] = {}
+                    elif value:
+                        data[key] = value
+                else:
+                    data[key] = value if value else ''
+                    current_key = key
+
+        # Second-level indentation
+        elif line.startswith('  ') and not line.startswith('    '):
+            if current_key == 'set_by':
+                if ':' in line:
+                    key, value = line.strip().split(':', 1)
+                    data['set_by'][key.strip()] = value.strip().strip('"')
+
+            elif current_key == 'history':
+                if line.strip().startswith('- state:'):
+                    if current_history_item:
+                        history.append(current_history_item)
+                    current_history_item = {'state': line.split(':', 1)[1].strip()}
+
+            elif current_key == 'notes':
+                if line.strip().startswith('- '):
+                    note = line.strip()[2:].strip().strip('"')
+                    notes.append(note)
+
+        # Third-level indentation (history details)
+        elif line.startswith('    ') and current_history_item is not None:
+            if ':' in line:
+                key, value = line.strip().split(':', 1)
+                current_history_item[key.strip()] = value.strip().strip('"')
+
+    # Add last history item
+    if current_history_item:
+        history.append(current_history_item)
+
+    if history:
+        data['history'] = history
+    if notes:
+        data['notes'] = notes
+
+    return data
+
+def status_path(incident_id, status_dir=STATUS_DIR):
+    """Path of an incident's lifecycle status file."""
+    return Path(status_dir) / f"{incident_id}.status.yaml"
+
+def load_status(incident_id, status_dir=STATUS_DIR):
+    """
+    Load incident status file.
+
+    Returns: parsed status dict, or None if no status file exists.
+    Parse errors propagate to the caller.
+    """
+    status_file = status_path(incident_id, status_dir)
+
+    if not status_file.exists():
+        return None
+
+    return parse_yaml_simple(status_file)
+
+def discover_incidents(status_dir=STATUS_DIR):
+    """List incident IDs that have a lifecycle status file."""
+    suffix = '.status.yaml'
+    return sorted(p.name[:-len(suffix)] for p in Path(status_dir).glob(f"*{suffix}"))
+
+def evaluate_phase_gate(incident_id, phase, status):
+    """
+    Evaluate a phase gate against an already-loaded status.
+
+    Returns: gate result dict (see module docstring). `reason` is one of
+    None (allowed), "no_status_file", "unknown_phase", "state_not_allowed".
+    """
+    current_state = status.get('status', 'UNKNOWN') if status else None
+    result = {
+        'incident_id': incident_id,
+        'phase': phase,
+        'allowed': False,
+        'state': current_state,
+        'required_states': PHASE_REQUIREMENTS.get(phase, []),
+        'reason': None,
+    }
+
+    if status is None:
+        result['reason'] = 'no_status_file'
+    elif phase not in PHASE_REQUIREMENTS:
+        # Matches the CLI: unknown phases warn but do not block
+        result['allowed'] = True
+        result['reason'] = 'unknown_phase'
+    elif current_state not in PHASE_REQUIREMENTS[phase]:
+        result['reason'] = 'state_not_allowed'
+    else:
+        result['allowed'] = True
+
+    return result
+
+def check_phase_gate(incident_id, phase, status_dir=STATUS_DIR):
+    """Check whether an incident's current state allows a phase."""
+    return evaluate_phase_gate(incident_id, phase, load_status(incident_id, status_dir))
+
+def check_gates(incident_ids=None, phases=None, status_dir=STATUS_DIR):
+    """
+    Batch gate check: every (incident, phase) pair in one call.
+
+    Each status file is parsed once regardless of how many phases are
+    checked against it. Defaults to all incidents with a status file and
+    all known phases. Unparseable status files yield results with
+    reason "status_file_error" and an `error` message instead of aborting
+    the sweep.
+
+    Returns: list of gate result dicts, ordered by incident then phase.
+    """
+    if incident_ids is None:
+        incident_ids = discover_incidents(status_dir)
+    if phases is None:
+        phases = list(PHASE_REQUIREMENTS)
+
+    results = []
+    for incident_id in incident_ids:
+        try:
+            status = load_status(incident_id, status_dir)
+            error = None
+        except Exception as e:
+            status = None
+            error = str(e)
+
+        for phase in phases:
+            result = evaluate_phase_gate(incident_id, phase, status)
+            if error is not None:
+                result['reason'] = 'status_file_error'
+                result['error'] = error
+            results.append(result)
+
+    return results
+
+def validate_transition(current_state, new_state, user_role):
+    """
+    Validate a state transition and the role requesting it.
+
+    Returns: (is_valid, reason) where reason is None, "invalid_state",
+    "invalid_transition" or "unauthorized_role".
+    """
+    if new_state not in VALID_STATES:
+        return False, 'invalid_state'
+
+    if current_state in ALLOWED_TRANSITIONS:
+        if new_state not in ALLOWED_TRANSITIONS[current_state]:
+            return False, 'invalid_transition'
+
+    transition_key = f"{current_state}->{new_state}"
+    if transition_key in TRANSITION_ROLES:
+        if user_role not in TRANSITION_ROLES[transition_key]:
+            return False, 'unauthorized_role'
+
+    return True, None
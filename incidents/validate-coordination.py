@@ -11,94 +11,14 @@ import sys
 import os
 from pathlib import Path
 
-def parse_yaml_simple(file_path):
-    """Simple YAML parser for our coordination record format."""
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    
-    data = {}
-    current_key = None
-    services = []
-    current_service = None
-    notes = []
-    
-    for line in lines:
-        line = line.rstrip('\n')
-        
-        # Skip empty lines and comments
-        if not line.strip() or line.strip().startswith('#'):
-            continue
-        
-        # Top-level keys (no indentation)
-        if line and not line.startswith(' '):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip().strip('"')
-                
-                if key in ('declared_by', 'services', 'coordination_notes'):
-                    current_key = key
-                    if key == 'declared_by':
-                        data[key] = {}
-                    if value and key not in ('declared_by', 'services', 'coordination_notes'):
-                        data[key] = value
-                else:
-                    data[key] = value if value else ''
-                    current_key = key
-        
-        # Second-level indentation (2 spaces)
-        elif line.startswith('  ') and not line.startswith('    '):
-            if current_key == 'declared_by':
-                if ':' in line:
-                    key, value = line.strip().split(':', 1)
-                    data['declared_by'][key.strip()] = value.strip().strip('"')
-            
-            elif current_key == 'services':
-                if line.strip().startswith('- name:'):
-                    # Save previous service
-                    if current_service and 'name' in current_service:
-                        services.append(current_service)
-                    # Start new service
-                    current_service = {'name': line.split(':', 1)[1].strip()}
-            
-            elif current_key == 'coordination_notes':
-                if line.strip().startswith('- '):
-                    note = line.strip()[2:].strip().strip('"')
-                    notes.append(note)
-        
-        # Third-level indentation (4 spaces) - service properties
-        elif line.startswith('    ') and current_service is not None:
-            if ':' in line:
-                key, value = line.strip().split(':', 1)
-                current_service[key.strip()] = value.strip().strip('"')
-    
-    # Add last service
-    if current_service and 'name' in current_service:
-        services.append(current_service)
-    
-    if services:
-        data['services'] = services
-    if notes:
-        data['coordination_notes'] = notes
-    
-    return data
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from coordination import load_coordination  # noqa: E402
 
 def load_coordination_record(incident_id):
-    """Load incident coordination record."""
-    coord_file = Path(f"incidents/{incident_id}.coordination.yaml")
-    
-    if not coord_file.exists():
-        print(f"⚠️  NO COORDINATION RECORD FOUND")
-        print(f"   Incident: {incident_id}")
-        print(f"   Expected: incidents/{incident_id}.coordination.yaml")
-        print()
-        print("   This appears to be a single-service incident.")
-        print("   Proceeding with standard single-service workflow.")
-        return None
-    
+    """Load incident coordination record (parsed and indexed once)."""
     try:
-        coord = parse_yaml_simple(coord_file)
-        return coord
+        coord = load_coordination(incident_id)
     except Exception as e:
         print(f"❌ COORDINATION RECORD ERROR")
         print(f"   Failed to parse: incidents/{incident_id}.coordination.yaml")
@@ -106,39 +26,75 @@ def load_coordination_record(incident_id):
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    
+    if coord is None:
+        print(f"⚠️  NO COORDINATION RECORD FOUND")
+        print(f"   Incident: {incident_id}")
+        print(f"   Expected: incidents/{incident_id}.coordination.yaml")
+        print()
+        print("   This appears to be a single-service incident.")
+        print("   Proceeding with standard single-service workflow.")
+    
+    return coord
 
-def validate_service_in_coordination(coordination, service_name):
-    """Validate requested service is part of incident scope."""
+def find_services_out_of_scope(coordination, service_names):
+    """Return requested services not declared in the coordination record."""
     if coordination is None:
         # Single-service incident, no validation needed
+        return []
+    return [name for name in service_names if not coordination.has_service(name)]
+
+def validate_service_in_coordination(coordination, service_name):
+    """Validate requested service is part of incident scope."""
+    if not find_services_out_of_scope(coordination, [service_name]):
         return True
     
-    services = coordination.get('services', [])
-    service_names = [s.get('name') for s in services]
-    
-    if service_name not in service_names:
-        print(f"❌ SERVICE NOT IN INCIDENT SCOPE")
-        print(f"   Incident: {coordination.get('incident_id', 'Unknown')}")
-        print(f"   Requested service: {service_name}")
-        print(f"   Services in scope: {', '.join(service_names)}")
-        print()
-        print("   This service is not part of the coordinated incident.")
-        print("   Update coordination record or use correct service name.")
-        sys.exit(1)
-    
-    return True
+    print(f"❌ SERVICE NOT IN INCIDENT SCOPE")
+    print(f"   Incident: {coordination.incident_id}")
+    print(f"   Requested service: {service_name}")
+    print(f"   Services in scope: {', '.join(coordination.service_names())}")
+    print()
+    print("   This service is not part of the coordinated incident.")
+    print("   Update coordination record or use correct service name.")
+    sys.exit(1)
 
 def get_service_role(coordination, service_name):
     """Get the role of a service in the incident."""
     if coordination is None:
         return "single_service"
+    return coordination.service_role(service_name)
+
+ROLE_GUIDANCE = {
+    'primary_candidate': [
+        "⚠️  PRIMARY CAUSE CANDIDATE",
+        "   This service requires finalized analysis to close incident",
+    ],
+    'downstream_impact': [
+        "ℹ️  DOWNSTREAM IMPACT",
+        "   Affected by primary cause but may have contributing factors",
+    ],
+    'symptom_only': [
+        "ℹ️  SYMPTOM ONLY",
+        "   Surfaced alert but no fault expected",
+        "   No remediation required unless issues found",
+    ],
+}
+
+def display_coordination_header(coordination):
+    """Display incident-level coordination details (once per incident)."""
+    print()
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(f"Multi-Service Incident Coordination: {coordination.incident_id}")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print()
     
-    services = coordination.get('services', [])
-    for service in services:
-        if service.get('name') == service_name:
-            return service.get('role', 'unknown')
+    print(f"Incident Title: {coordination.get('incident_title', 'N/A')}")
+    print(f"Severity: {coordination.get('incident_severity', 'N/A')}")
+    print()
     
-    return 'unknown'
+    declared_by = coordination.get('declared_by', {})
+    print(f"Declared by: {declared_by.get('name', 'Unknown')} ({declared_by.get('role', 'Unknown')})")
+    print()
 
 def display_coordination_context(coordination, service_name):
     """Display coordination context for this service."""
@@ -153,21 +109,9 @@ def display_coordination_context(coordination, service_name):
         print()
         return
     
-    print()
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print(f"Multi-Service Incident Coordination: {coordination.get('incident_id', 'Unknown')}")
-    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-    print()
+    display_coordination_header(coordination)
     
-    print(f"Incident Title: {coordination.get('incident_title', 'N/A')}")
-    print(f"Severity: {coordination.get('incident_severity', 'N/A')}")
-    print()
-    
-    declared_by = coordination.get('declared_by', {})
-    print(f"Declared by: {declared_by.get('name', 'Unknown')} ({declared_by.get('role', 'Unknown')})")
-    print()
-    
-    services = coordination.get('services', [])
+    services = coordination.services
     print(f"Services involved ({len(services)}):")
     for service in services:
         marker = "→" if service.get('name') == service_name else " "
@@ -180,27 +124,70 @@ def display_coordination_context(coordination, service_name):
     print(f"This service role: {service_role.replace('_', ' ').upper()}")
     print()
     
-    if service_role == 'primary_candidate':
-        print("⚠️  PRIMARY CAUSE CANDIDATE")
-        print("   This service requires finalized analysis to close incident")
+    if service_role in ROLE_GUIDANCE:
+        for line in ROLE_GUIDANCE[service_role]:
+            print(line)
+        print()
+
+def display_all_services(coordination):
+    """Display every declared service in one pass, grouped by role."""
+    display_coordination_header(coordination)
+    
+    print(f"Services involved ({len(coordination.services)}):")
+    for role, services in coordination.by_role.items():
         print()
-    elif service_role == 'downstream_impact':
-        print("ℹ️  DOWNSTREAM IMPACT")
-        print("   Affected by primary cause but may have contributing factors")
+        print(f"  {role.replace('_', ' ').upper()} ({len(services)})")
+        for service in services:
+            print(f"    • {service.get('name')}")
+            if service.get('lead_investigator'):
+                print(f"      Lead: {service['lead_investigator']}")
+    print()
+    
+    for role in coordination.by_role:
+        if role in ROLE_GUIDANCE:
+            print(ROLE_GUIDANCE[role][0])
+            for line in ROLE_GUIDANCE[role][1:]:
+                print(line)
+            print()
+
+def validate_services_bulk(coordination, service_names):
+    """Validate many services against incident scope in one pass."""
+    if coordination is None:
+        return True
+    
+    ok = True
+    
+    duplicates = coordination.duplicate_services()
+    if duplicates:
+        print(f"⚠️  DUPLICATE SERVICE DECLARATIONS")
+        print(f"   {', '.join(duplicates)}")
         print()
-    elif service_role == 'symptom_only':
-        print("ℹ️  SYMPTOM ONLY")
-        print("   Surfaced alert but no fault expected")
-        print("   No remediation required unless issues found")
+    
+    missing = find_services_out_of_scope(coordination, service_names)
+    if missing:
+        print(f"❌ SERVICES NOT IN INCIDENT SCOPE ({len(missing)})")
+        print(f"   Incident: {coordination.incident_id}")
+        for name in missing:
+            print(f"   • {name}")
         print()
+        print("   These services are not part of the coordinated incident.")
+        print("   Update coordination record or use correct service names.")
+        ok = False
+    
+    in_scope = len(service_names) - len(missing)
+    print(f"✓ {in_scope}/{len(service_names)} service(s) in incident scope")
+    for role, services in coordination.by_role.items():
+        print(f"  {role}: {len(services)}")
+    print()
+    
+    return ok
 
 def validate_primary_candidate_finalization(coordination):
     """Ensure primary candidate has finalized review before incident closure."""
     if coordination is None:
         return True
     
-    services = coordination.get('services', [])
-    primary_services = [s for s in services if s.get('role') == 'primary_candidate']
+    primary_services = coordination.services_with_role('primary_candidate')
     
     if not primary_services:
         print("⚠️  NO PRIMARY CANDIDATE DECLARED")
@@ -209,7 +196,7 @@ def validate_primary_candidate_finalization(coordination):
     
     for service in primary_services:
         service_name = service.get('name')
-        incident_id = coordination.get('incident_id', 'Unknown')
+        incident_id = coordination.incident_id
         review_file = Path(f"reports/review-record-{incident_id}-{service_name}.yaml")
         
         if not review_file.exists():
@@ -240,9 +227,33 @@ def validate_primary_candidate_finalization(coordination):
     
     return True
 
+def run_bulk(coordination, service_arg, actions):
+    """Bulk mode: --all or a comma-separated service list, one pass."""
+    if coordination is None:
+        return
+    
+    if service_arg == '--all':
+        service_names = coordination.service_names()
+    else:
+        service_names = [s for s in service_arg.split(',') if s]
+    
+    for action in actions:
+        if action == "validate":
+            if not validate_services_bulk(coordination, service_names):
+                sys.exit(1)
+        elif action == "display":
+            display_all_services(coordination)
+            print("✓ Coordination context displayed")
+            print(f"  Services: {len(coordination.services)}")
+            print()
+        else:
+            print(f"Unknown action: {action}")
+            sys.exit(1)
+
 def main():
     if len(sys.argv) < 2:
-        print("Usage: validate-coordination.py <incident_id> [service_name] [action]")
+        print("Usage: validate-coordination.py <incident_id> [service_name] [action[,action]]")
+        print("       validate-coordination.py <incident_id> --all|svc1,svc2,... [validate,display]")
         print()
         print("Actions:")
         print("  display    - Show coordination context (requires service_name)")
@@ -254,45 +265,50 @@ def main():
     
     # Check if second arg is an action (for check-primary)
     if len(sys.argv) >= 3 and sys.argv[2] == 'check-primary':
-        action = 'check-primary'
+        actions = ['check-primary']
         service_name = None
     else:
         service_name = sys.argv[2] if len(sys.argv) >= 3 else None
-        action = sys.argv[3] if len(sys.argv) >= 4 else "display"
+        actions = (sys.argv[3] if len(sys.argv) >= 4 else "display").split(',')
     
-    # Load coordination record
+    # Load coordination record (parsed and indexed once for all actions)
     coordination = load_coordination_record(incident_id)
     
-    if action == "display":
-        if not service_name:
-            print("Error: display action requires service_name")
-            sys.exit(1)
-        display_coordination_context(coordination, service_name)
+    if service_name and (service_name == '--all' or ',' in service_name):
+        run_bulk(coordination, service_name, actions)
+        return
+    
+    for action in actions:
+        if action == "display":
+            if not service_name:
+                print("Error: display action requires service_name")
+                sys.exit(1)
+            display_coordination_context(coordination, service_name)
+            
+            if coordination:
+                service_role = get_service_role(coordination, service_name)
+                print("✓ Coordination context displayed")
+                print(f"  Service role: {service_role}")
+                print()
         
-        if coordination:
-            service_role = get_service_role(coordination, service_name)
-            print("✓ Coordination context displayed")
-            print(f"  Service role: {service_role}")
+        elif action == "validate":
+            if not service_name:
+                print("Error: validate action requires service_name")
+                sys.exit(1)
+            validate_service_in_coordination(coordination, service_name)
+            print(f"✓ Service '{service_name}' is in incident scope")
             print()
-    
-    elif action == "validate":
-        if not service_name:
-            print("Error: validate action requires service_name")
-            sys.exit(1)
-        validate_service_in_coordination(coordination, service_name)
-        print(f"✓ Service '{service_name}' is in incident scope")
-        print()
-    
-    elif action == "check-primary":
-        if validate_primary_candidate_finalization(coordination):
-            print("✓ Primary candidate finalization satisfied")
+        
+        elif action == "check-primary":
+            if validate_primary_candidate_finalization(coordination):
+                print("✓ Primary candidate finalization satisfied")
+            else:
+                print("❌ Primary candidate finalization required")
+                sys.exit(1)
+        
         else:
-            print("❌ Primary candidate finalization required")
+            print(f"Unknown action: {action}")
             sys.exit(1)
-    
-    else:
-        print(f"Unknown action: {action}")
-        sys.exit(1)
 
 if __name__ == '__main__':
     main()
@@ -18,126 +18,27 @@ Phase Gates:
 
 import sys
 import os
+import json
 from pathlib import Path
 from datetime import datetime
 
-# Valid lifecycle states
-VALID_STATES = [
-    'OPEN',
-    'MITIGATING',
-    'MONITORING',
-    'RESOLVED',
-    'POSTMORTEM_COMPLETE'
-]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-# State transition rules
-ALLOWED_TRANSITIONS = {
-    'OPEN': ['MITIGATING', 'RESOLVED'],  # Can skip straight to RESOLVED if quick fix
-    'MITIGATING': ['MONITORING', 'RESOLVED'],
-    'MONITORING': ['MITIGATING', 'RESOLVED'],  # Can regress if issue returns
-    'RESOLVED': ['POSTMORTEM_COMPLETE', 'MITIGATING'],  # Can regress if issue returns
-    'POSTMORTEM_COMPLETE': []  # Terminal state
-}
-
-# Role-based transition authorization
-TRANSITION_ROLES = {
-    'OPEN->MITIGATING': ['Incident Commander', 'SRE', 'SRE Lead'],
-    'MITIGATING->MONITORING': ['Incident Commander', 'SRE Lead'],
-    'MONITORING->RESOLVED': ['Incident Commander'],
-    'RESOLVED->POSTMORTEM_COMPLETE': ['Incident Commander', 'SRE', 'SRE Lead'],
-    # Regression paths (issue returns)
-    'MONITORING->MITIGATING': ['Incident Commander', 'SRE Lead'],
-    'RESOLVED->MITIGATING': ['Incident Commander'],
-}
-
-# Phase requirements
-PHASE_REQUIREMENTS = {
-    'investigate': ['OPEN', 'MITIGATING'],
-    'finalize': ['RESOLVED'],
-    'memory': ['POSTMORTEM_COMPLETE'],
-    'actions': ['MITIGATING'],
-    'trust': ['POSTMORTEM_COMPLETE'],
-}
-
-def parse_yaml_simple(file_path):
-    """Simple YAML parser for status files."""
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-    
-    data = {}
-    current_key = None
-    history = []
-    current_history_item = None
-    notes = []
-    
-    for line in lines:
-        line = line.rstrip('\n')
-        
-        # Skip empty lines and comments
-        if not line.strip() or line.strip().startswith('#'):
-            continue
-        
-        # Top-level keys
-        if line and not line.startswith(' '):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip().strip('"')
-                
-                if key in ('set_by', 'history', 'notes'):
-                    current_key = key
-                    if key == 'set_by':
-                        data[key] = {}
-                    elif value:
-                        data[key] = value
-                else:
-                    data[key] = value if value else ''
-                    current_key = key
-        
-        # Second-level indentation
-        elif line.startswith('  ') and not line.startswith('    '):
-            if current_key == 'set_by':
-                if ':' in line:
-                    key, value = line.strip().split(':', 1)
-                    data['set_by'][key.strip()] = value.strip().strip('"')
-            
-            elif current_key == 'history':
-                if line.strip().startswith('- state:'):
-                    if current_history_item:
-                        history.append(current_history_item)
-                    current_history_item = {'state': line.split(':', 1)[1].strip()}
-            
-            elif current_key == 'notes':
-                if line.strip().startswith('- '):
-                    note = line.strip()[2:].strip().strip('"')
-                    notes.append(note)
-        
-        # Third-level indentation (history details)
-        elif line.startswith('    ') and current_history_item is not None:
-            if ':' in line:
-                key, value = line.strip().split(':', 1)
-                current_history_item[key.strip()] = value.strip().strip('"')
-    
-    # Add last history item
-    if current_history_item:
-        history.append(current_history_item)
-    
-    if history:
-        data['history'] = history
-    if notes:
-        data['notes'] = notes
-    
-    return data
+from lifecycle import (  # noqa: E402
+    VALID_STATES,
+    ALLOWED_TRANSITIONS,
+    TRANSITION_ROLES,
+    check_gates,
+    evaluate_phase_gate,
+    validate_transition,
+)
+import lifecycle  # noqa: E402
+from atomic import atomic_open, incident_lock  # noqa: E402
 
 def load_status(incident_id):
     """Load incident status file."""
-    status_file = Path(f"incidents/{incident_id}.status.yaml")
-    
-    if not status_file.exists():
-        return None
-    
     try:
-        return parse_yaml_simple(status_file)
+        return lifecycle.load_status(incident_id)
     except Exception as e:
         print(f"❌ STATUS FILE ERROR")
         print(f"   Failed to parse: incidents/{incident_id}.status.yaml")
@@ -225,11 +126,14 @@ def display_status(incident_id):
             print("No transitions allowed (terminal state)")
     print()
 
-def validate_phase_gate(incident_id, phase):
+def validate_phase_gate(incident_id, phase, status=None):
     """Validate incident state allows requested phase."""
-    status = load_status(incident_id)
+    if status is None:
+        status = load_status(incident_id)
     
-    if not status:
+    gate = evaluate_phase_gate(incident_id, phase, status)
+    
+    if gate['reason'] == 'no_status_file':
         print()
         print("❌ LIFECYCLE VIOLATION")
         print(f"   No status file found for {incident_id}")
@@ -240,20 +144,16 @@ def validate_phase_gate(incident_id, phase):
         print()
         sys.exit(1)
     
-    current_state = status.get('status', 'UNKNOWN')
-    
-    if phase not in PHASE_REQUIREMENTS:
+    if gate['reason'] == 'unknown_phase':
         print(f"⚠️  Unknown phase: {phase}")
         return True
     
-    allowed_states = PHASE_REQUIREMENTS[phase]
-    
-    if current_state not in allowed_states:
+    if not gate['allowed']:
         print()
         print("❌ INCIDENT STATE VIOLATION")
         print(f"   Cannot execute {phase} for {incident_id}")
-        print(f"   Current state: {current_state}")
-        print(f"   Required state: {' or '.join(allowed_states)}")
+        print(f"   Current state: {gate['state']}")
+        print(f"   Required state: {' or '.join(gate['required_states'])}")
         print()
         
         # Helpful guidance
@@ -277,6 +177,12 @@ def validate_phase_gate(incident_id, phase):
 
 def set_status(incident_id, new_state, user_name, user_role, user_id, notes_text=None):
     """Set incident status with validation."""
+    # Read-modify-write of the history: serialized per incident, and the
+    # file is replaced atomically so concurrent gate checks never see it torn
+    with incident_lock(incident_id):
+        _set_status(incident_id, new_state, user_name, user_role, user_id, notes_text)
+
+def _set_status(incident_id, new_state, user_name, user_role, user_id, notes_text=None):
     status_file = Path(f"incidents/{incident_id}.status.yaml")
     
     # Validate state
@@ -291,29 +197,26 @@ def set_status(incident_id, new_state, user_name, user_role, user_id, notes_text
     if existing:
         current_state = existing.get('status', 'UNKNOWN')
         
-        # Validate transition
-        if current_state in ALLOWED_TRANSITIONS:
+        _, reason = validate_transition(current_state, new_state, user_role)
+        
+        if reason == 'invalid_transition':
             allowed = ALLOWED_TRANSITIONS[current_state]
-            if new_state not in allowed:
-                print()
-                print("❌ INVALID STATE TRANSITION")
-                print(f"   Current: {current_state}")
-                print(f"   Requested: {new_state}")
-                print(f"   Allowed: {', '.join(allowed) if allowed else 'None (terminal state)'}")
-                print()
-                sys.exit(1)
+            print()
+            print("❌ INVALID STATE TRANSITION")
+            print(f"   Current: {current_state}")
+            print(f"   Requested: {new_state}")
+            print(f"   Allowed: {', '.join(allowed) if allowed else 'None (terminal state)'}")
+            print()
+            sys.exit(1)
         
-        # Validate role authorization
-        transition_key = f"{current_state}->{new_state}"
-        if transition_key in TRANSITION_ROLES:
-            allowed_roles = TRANSITION_ROLES[transition_key]
-            if user_role not in allowed_roles:
-                print()
-                print("❌ AUTHORITY VIOLATION")
-                print(f"   Role '{user_role}' cannot transition {current_state} → {new_state}")
-                print(f"   Allowed roles: {', '.join(allowed_roles)}")
-                print()
-                sys.exit(1)
+        if reason == 'unauthorized_role':
+            allowed_roles = TRANSITION_ROLES[f"{current_state}->{new_state}"]
+            print()
+            print("❌ AUTHORITY VIOLATION")
+            print(f"   Role '{user_role}' cannot transition {current_state} → {new_state}")
+            print(f"   Allowed roles: {', '.join(allowed_roles)}")
+            print()
+            sys.exit(1)
     
     # Generate new status file
     timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -335,7 +238,7 @@ def set_status(incident_id, new_state, user_name, user_role, user_id, notes_text
     history_entries.append(history_entry)
     
     # Write new status
-    with open(status_file, 'w') as f:
+    with atomic_open(status_file) as f:
         f.write("# Incident Lifecycle State\n")
         f.write("# Purpose: Gate pipeline behavior based on real-world incident progression\n")
         f.write("# Rule: Human sets state. System enforces. AI never changes state.\n\n")
@@ -381,14 +284,58 @@ def set_status(incident_id, new_state, user_name, user_role, user_id, notes_text
     print(f"  Updated by: {user_name} ({user_role})")
     print()
 
+def sweep_gates(args):
+    """Batch gate check across incidents and phases in one process."""
+    phases = None
+    as_json = False
+    incident_ids = []
+    
+    i = 0
+    while i < len(args):
+        if args[i] == '--phases' and i + 1 < len(args):
+            phases = [p for p in args[i + 1].split(',') if p]
+            i += 2
+        elif args[i] == '--json':
+            as_json = True
+            i += 1
+        else:
+            incident_ids.append(args[i])
+            i += 1
+    
+    results = check_gates(incident_ids or None, phases)
+    
+    if as_json:
+        print(json.dumps(results, indent=2))
+        return
+    
+    print(f"{'ID':<12} | {'State':<20} | {'Phase':<12} | Gate")
+    print("─" * 62)
+    for r in results:
+        if r['allowed']:
+            gate = "✓ allowed"
+        elif r['reason'] == 'state_not_allowed':
+            gate = f"✗ requires {' or '.join(r['required_states'])}"
+        else:
+            gate = f"✗ {r['reason']}"
+        print(f"{r['incident_id']:<12} | {str(r['state']):<20} | {r['phase']:<12} | {gate}")
+    
+    print()
+    allowed = sum(1 for r in results if r['allowed'])
+    print(f"Total: {len(results)} gate check(s), {allowed} allowed, {len(results) - allowed} blocked")
+
 def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print("  validate-status.py <incident_id> display")
-        print("  validate-status.py <incident_id> check <phase>")
+        print("  validate-status.py <incident_id> check <phase>[,<phase>...]")
         print("  validate-status.py <incident_id> set <state> <name> <role> <id> [notes]")
+        print("  validate-status.py sweep [--phases <phase>,...] [--json] [incident_id ...]")
         sys.exit(1)
     
+    if sys.argv[1] == 'sweep':
+        sweep_gates(sys.argv[2:])
+        return
+    
     incident_id = sys.argv[1]
     action = sys.argv[2] if len(sys.argv) > 2 else 'display'
     
@@ -397,11 +344,13 @@ def main():
     
     elif action == 'check':
         if len(sys.argv) < 4:
-            print("Usage: validate-status.py <incident_id> check <phase>")
+            print("Usage: validate-status.py <incident_id> check <phase>[,<phase>...]")
             sys.exit(1)
-        phase = sys.argv[3]
-        validate_phase_gate(incident_id, phase)
-        print(f"✓ Phase '{phase}' allowed at current incident state")
+        # Several phases share one status parse (e.g. "check memory,trust")
+        status = load_status(incident_id)
+        for phase in sys.argv[3].split(','):
+            validate_phase_gate(incident_id, phase, status)
+            print(f"✓ Phase '{phase}' allowed at current incident state")
     
     elif action == 'set':
         if len(sys.argv) < 7:
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Phase 3 Hypothesis-Structure Validator
+Checks that a post-mortem follows the investigation prompt's reasoning
+protocol: 3-5 competing hypotheses with symmetric evidence, confidence and
+status, explicit ruled-out hypotheses, generic (vendor-neutral) language
+and every required section.
+
+Rules (error = protocol violated, warning = weak but usable):
+    hypotheses.section     error    "## Hypotheses Considered" present
+    hypotheses.count       error    at least 3 hypotheses (warning above 5)
+    hypotheses.categories  warning  at least 2 distinct categories
+    hypotheses.evidence    error    one FOR and one AGAINST block per hypothesis
+    hypotheses.confidence  warning  confidence scores present, total <= 100%
+    hypotheses.status      warning  one status marker per hypothesis
+    ruled_out.section      error    "## Ruled-Out Hypotheses" present
+    ruled_out.count        warning  at least one hypothesis RULED_OUT
+    vendor_jargon          warning  no vendor/product terms
+    required_sections      error    Timeline, Evidence Evaluation, Primary Root
+                                    Cause, Remaining Uncertainty, Confidence Summary
+
+The document is read in one scan, whatever the number of rules: a single
+precompiled alternation finds the "## " section headings and the hypothesis
+headers, categories, evidence, confidence and status markers together.
+Vendor terms are plain substring checks.
+
+Batch mode validates every reports/postmortem-*.md in a process pool and
+prints failure counts per rule, to re-check the archive when rules tighten.
+
+Usage:
+    hypotheses.py <postmortem_file>
+    hypotheses.py batch [postmortem_file ...] [--jobs N] [--json]
+
+Exit status is 1 when any post-mortem has an error.
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "incidents"))
+from batch import run_pool  # noqa: E402
+
+REPORTS_DIR = Path("reports")
+
+MIN_HYPOTHESES = 3
+MAX_HYPOTHESES = 5
+MIN_CATEGORIES = 2
+CONFIDENCE_BUDGET = 100
+
+CATEGORIES = ('Application', 'Resource', 'Infrastructure', 'Traffic', 'Dependency')
+VENDOR_TERMS = ('hadoop', 'hdfs', 'datanode', 'namenode', 'spark', 'kafka', 'kubernetes', 'k8s')
+HYPOTHESES_SECTION = '## Hypotheses Considered'
+RULED_OUT_SECTION = '## Ruled-Out Hypotheses'
+REQUIRED_SECTIONS = (
+    '## Timeline',
+    '## Evidence Evaluation',
+    '## Primary Root Cause',
+    '## Remaining Uncertainty',
+    '## Confidence Summary',
+)
+
+# Section headings and every counted marker in one alternation (none can
+# overlap another). The lookahead lets the scan skip positions that cannot
+# start a match without trying each branch.
+TOKENS = re.compile(
+    r'(?=[#(*R])(?:'
+    r'^(?P<heading>## [^\n]*)'
+    r'|(?P<hypothesis>### Hypothesis \d+:)'
+    r'|\(Category: (?P<category>' + '|'.join(CATEGORIES) + r')\)'
+    r'|\*\*Confidence:\*\* (?P<confidence>\d+)%'
+    r'|\*\*(?P<marker>Evidence FOR|Evidence AGAINST|Status):\*\*'
+    r'|(?P<ruled_out>RULED_OUT))',
+    re.MULTILINE
+)
+
+RULE = "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+class Document:
+    """A post-mortem split into "## " sections, with its markers counted."""
+
+    def __init__(self, content):
+        self.sections = {}  # "## Heading" -> body text, in document order
+        self.counts = {'hypothesis': 0, 'Evidence FOR': 0, 'Evidence AGAINST': 0, 'Status': 0, 'ruled_out': 0}
+        self.categories = []
+        self.confidences = []
+
+        heading = None
+        body_start = 0
+        for match in TOKENS.finditer(content):
+            kind = match.lastgroup
+            if kind == 'heading':
+                if heading is not None:
+                    self.sections[heading] = content[body_start:match.start()].strip('\n')
+                heading = match.group('heading').rstrip()
+                body_start = match.end()
+            elif kind == 'marker':
+                self.counts[match.group('marker')] += 1
+            elif kind == 'category':
+                self.categories.append(match.group('category'))
+            elif kind == 'confidence':
+                self.confidences.append(int(match.group('confidence')))
+            else:
+                self.counts[kind] += 1
+        if heading is not None:
+            self.sections[heading] = content[body_start:].strip('\n')
+
+    def has_section(self, name):
+        # "## Timeline (UTC)" satisfies "## Timeline"
+        return any(heading.startswith(name) for heading in self.sections)
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+
+def validate(content):
+    """
+    Validate one post-mortem's reasoning structure.
+
+    Returns: {"passed": [check lines], "findings": [{"rule", "severity", "message"}]}
+    """
+    passed = []
+    findings = []
+
+    def finding(rule, severity, message):
+        findings.append({'rule': rule, 'severity': severity, 'message': message})
+
+    doc = Document(content)
+    counts = doc.counts
+
+    # Check 1: Hypotheses Considered section
+    if not doc.has_section(HYPOTHESES_SECTION):
+        finding('hypotheses.section', 'error', f"Missing '{HYPOTHESES_SECTION}' section")
+    else:
+        hyp_count = counts['hypothesis']
+        if hyp_count < MIN_HYPOTHESES:
+            finding('hypotheses.count', 'error', f"Only {hyp_count} hypotheses found (minimum: {MIN_HYPOTHESES})")
+        elif hyp_count > MAX_HYPOTHESES:
+            finding('hypotheses.count', 'warning',
+                    f"Found {hyp_count} hypotheses (recommended: {MIN_HYPOTHESES}-{MAX_HYPOTHESES})")
+        else:
+            passed.append(f"✓ Found {hyp_count} hypotheses")
+
+        unique_categories = list(dict.fromkeys(doc.categories))
+        if len(unique_categories) < MIN_CATEGORIES:
+            finding('hypotheses.categories', 'warning',
+                    f"Low category diversity: only {len(unique_categories)} unique categories (recommended: 3+)")
+        else:
+            passed.append(f"✓ Category diversity: {len(unique_categories)} distinct categories "
+                          f"({', '.join(unique_categories)})")
+
+        for_count = counts['Evidence FOR']
+        against_count = counts['Evidence AGAINST']
+        if for_count != hyp_count or against_count != hyp_count:
+            finding('hypotheses.evidence', 'error',
+                    f"Evidence asymmetry detected: {for_count} FOR, {against_count} AGAINST "
+                    f"(expected {hyp_count} each)")
+        else:
+            passed.append(f"✓ Evidence symmetry maintained ({hyp_count} FOR + {hyp_count} AGAINST)")
+
+        if doc.confidences:
+            total_confidence = sum(doc.confidences)
+            if total_confidence > CONFIDENCE_BUDGET:
+                finding('hypotheses.confidence', 'warning',
+                        f"Confidence budget exceeded: {total_confidence}% (maximum: {CONFIDENCE_BUDGET}%) "
+                        f"- AI may show supporting hypotheses")
+                passed.append(f"⚠ Confidence total: {total_confidence}% (expected ≤{CONFIDENCE_BUDGET}%)")
+            else:
+                passed.append(f"✓ Confidence budget: {total_confidence}% used, "
+                              f"{CONFIDENCE_BUDGET - total_confidence}% uncertainty")
+        else:
+            finding('hypotheses.confidence', 'warning', "No confidence scores found")
+
+        status_count = counts['Status']
+        if status_count != hyp_count:
+            finding('hypotheses.status', 'warning',
+                    f"Missing status markers: found {status_count}, expected {hyp_count}")
+        else:
+            passed.append("✓ All hypotheses have status markers")
+
+    # Check 2: Ruled-Out Hypotheses section
+    if not doc.has_section(RULED_OUT_SECTION):
+        finding('ruled_out.section', 'error', f"Missing '{RULED_OUT_SECTION}' section")
+    elif counts['ruled_out'] == 0:
+        finding('ruled_out.count', 'warning', "No hypotheses explicitly ruled out")
+    else:
+        passed.append(f"✓ {counts['ruled_out']} hypothesis(es) explicitly ruled out")
+
+    # Check 3: No vendor jargon (generic systems reasoning)
+    content_lower = content.lower()
+    found_jargon = [term for term in VENDOR_TERMS if term in content_lower]
+    if found_jargon:
+        finding('vendor_jargon', 'warning',
+                f"Vendor jargon detected: {', '.join(found_jargon)} - prefer generic systems terms")
+    else:
+        passed.append("✓ Generic systems reasoning (no vendor jargon)")
+
+    # Check 4: Required sections present
+    missing_sections = [s for s in REQUIRED_SECTIONS if not doc.has_section(s)]
+    if missing_sections:
+        finding('required_sections', 'error', f"Missing required sections: {', '.join(missing_sections)}")
+    else:
+        passed.append("✓ All required sections present")
+
+    return {'passed': passed, 'findings': findings}
+
+def validate_file(path):
+    with open(path, 'r') as f:
+        return validate(f.read())
+
+def _validate_job(path):
+    try:
+        return validate_file(path)
+    except (OSError, UnicodeDecodeError) as e:
+        return {'passed': [], 'findings': [{'rule': 'unreadable', 'severity': 'error', 'message': str(e)}]}
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def print_result(result):
+    """Single post-mortem report, as printed during Phase 3."""
+    for line in result['passed']:
+        print(f"   {line}")
+
+    errors = [f['message'] for f in result['findings'] if f['severity'] == 'error']
+    warnings = [f['message'] for f in result['findings'] if f['severity'] == 'warning']
+    if errors:
+        print("\n⚠️  Validation ERRORS:")
+        for e in errors:
+            print(f"   ✗ {e}")
+        return 1
+
+    if warnings:
+        print("\n⚠️  Validation WARNINGS:")
+        for w in warnings:
+            print(f"   • {w}")
+    else:
+        print("\n✅ Hypothesis validation passed")
+    return 0
+
+def validate_batch(paths=None, jobs_count=None):
+    """
+    Validate many post-mortems concurrently.
+
+    Returns: {"documents": {path: result}, "rule_counts": {rule: {"error": n, "warning": n}},
+              "summary": {...}}
+    """
+    if not paths:
+        paths = [str(p) for p in sorted(REPORTS_DIR.glob("postmortem-*.md"))]
+
+    results = run_pool(_validate_job, paths, jobs_count)
+
+    rule_counts = {}
+    for result in results:
+        for f in result['findings']:
+            counts = rule_counts.setdefault(f['rule'], {'error': 0, 'warning': 0})
+            counts[f['severity']] += 1
+    failed = sum(1 for r in results if any(f['severity'] == 'error' for f in r['findings']))
+    return {
+        'summary': {
+            'documents': len(results),
+            'failed': failed,
+            'warned': sum(1 for r in results if r['findings']) - failed,
+        },
+        'rule_counts': dict(sorted(rule_counts.items())),
+        'documents': dict(zip(paths, results)),
+    }
+
+def print_batch(report):
+    summary = report['summary']
+    print(RULE)
+    print("🔍 Phase 3 Hypothesis Validation (batch)")
+    print(RULE)
+    for path, result in report['documents'].items():
+        errors = sum(1 for f in result['findings'] if f['severity'] == 'error')
+        warnings = len(result['findings']) - errors
+        mark = "✗" if errors else ("⚠" if warnings else "✓")
+        print(f"  {mark} {path}: {errors} error(s), {warnings} warning(s)")
+    if report['rule_counts']:
+        print()
+        print(f"  {'Rule':<24} {'Errors':>7} {'Warnings':>9}")
+        for rule, counts in report['rule_counts'].items():
+            print(f"  {rule:<24} {counts['error']:>7} {counts['warning']:>9}")
+    print()
+    icon = "❌" if summary['failed'] else "✓"
+    print(f"{icon} {summary['documents']} post-mortem(s): {summary['failed']} with errors, "
+          f"{summary['warned']} with warnings only")
+
+def main():
+    usage = ("Usage: hypotheses.py <postmortem_file>\n"
+             "       hypotheses.py batch [postmortem_file ...] [--jobs N] [--json]")
+    args = sys.argv[1:]
+    if not args:
+        raise SystemExit(usage)
+
+    if args[0] != 'batch':
+        if len(args) != 1:
+            raise SystemExit(usage)
+        sys.exit(print_result(validate_file(args[0])))
+
+    paths = []
+    as_json = False
+    jobs_count = None
+    i = 1
+    while i < len(args):
+        if args[i] == '--json':
+            as_json = True
+            i += 1
+        elif args[i] == '--jobs' and i + 1 < len(args):
+            jobs_count = int(args[i + 1])
+            i += 2
+        elif args[i].startswith('--'):
+            raise SystemExit(usage)
+        else:
+            paths.append(args[i])
+            i += 1
+
+    report = validate_batch(paths, jobs_count)
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_batch(report)
+    sys.exit(1 if report['summary']['failed'] else 0)
+
+if __name__ == '__main__':
+    main()
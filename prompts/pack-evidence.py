@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Token-Budget Evidence Packer
+Fits the Incident Evidence Bundle into the investigation prompt's token
+budget, keeping the highest-signal evidence and recording what was dropped.
+
+Ranking (highest first; metadata and integrity are always kept):
+  1. Deployment events
+  2. ERROR / FATAL / CRITICAL log entries
+  3. Metric aggregates, by relative delta (|delta| / |baseline|)
+  4. Commits, deployed commits first, then by distance to nearest deployment
+  5. WARN log entries
+  6. Diff summaries
+  7. Remaining log entries (INFO, DEBUG, ...)
+Ties break on timestamp, then original position, so the same bundle and
+budget always produce the same packed bundle.
+
+Items are admitted greedily in rank order; an item that does not fit is
+dropped and packing continues with smaller items. Kept items are emitted
+in their original (chronological) order.
+
+Token cost is estimated as ceil(chars / 4) of each item's JSON as rendered
+in the prompt (indent=2).
+
+Budget: --budget N, else scope file "prompt_budget.max_tokens", else 6000.
+
+Usage:
+    pack-evidence.py <bundle_file> <scope_audit_file> [--scope FILE] [--budget N]
+
+Prints the packed bundle JSON to stdout and adds a "prompt_packing"
+section to the scope audit.
+"""
+
+import json
+import math
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "incidents"))
+from atomic import atomic_open  # noqa: E402
+from bundle import load_bundle  # noqa: E402
+
+DEFAULT_BUDGET_TOKENS = 6000
+CHARS_PER_TOKEN = 4
+
+# Dropped items are listed individually in the scope audit up to this many
+MAX_DROPPED_LISTED = 50
+
+ERROR_SEVERITIES = {"ERROR", "FATAL", "CRITICAL"}
+WARN_SEVERITIES = {"WARN", "WARNING"}
+
+# Rank tiers (lower is kept first)
+TIER_DEPLOYMENT = 0
+TIER_ERROR_LOG = 1
+TIER_METRIC = 2
+TIER_COMMIT = 3
+TIER_WARN_LOG = 4
+TIER_DIFF = 5
+TIER_OTHER_LOG = 6
+
+def estimate_tokens(obj):
+    """Approximate prompt tokens for obj rendered as prompt JSON."""
+    text = obj if isinstance(obj, str) else json.dumps(obj, indent=2)
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+def parse_ts(value):
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+# ============================================================================
+# RANKING
+# ============================================================================
+
+def rank_candidates(bundle):
+    """
+    Flatten rankable bundle content into candidates.
+
+    Returns: list of (rank_key, section, index, item), sorted by rank_key
+    """
+    candidates = []
+
+    events = bundle.get("deployments", {}).get("events", [])
+    deployed_commits = {e.get("commit_hash") for e in events if e.get("commit_hash")}
+    deploy_times = [t for t in (parse_ts(e.get("timestamp")) for e in events) if t is not None]
+
+    for i, event in enumerate(events):
+        candidates.append(((TIER_DEPLOYMENT, 0, event.get("timestamp", ""), i), "deployments", i, event))
+
+    for i, entry in enumerate(bundle.get("logs", {}).get("entries", [])):
+        severity = str(entry.get("severity", "")).upper()
+        if severity in ERROR_SEVERITIES:
+            tier = TIER_ERROR_LOG
+        elif severity in WARN_SEVERITIES:
+            tier = TIER_WARN_LOG
+        else:
+            tier = TIER_OTHER_LOG
+        candidates.append(((tier, 0, entry.get("timestamp", ""), i), "logs", i, entry))
+
+    for i, (name, aggregate) in enumerate(sorted(bundle.get("metrics", {}).get("aggregates", {}).items())):
+        delta = abs(aggregate.get("delta") or 0)
+        baseline = abs(aggregate.get("baseline") or 0)
+        relative = delta / baseline if baseline else delta
+        candidates.append(((TIER_METRIC, -relative, name, i), "metrics", name, aggregate))
+
+    for i, commit in enumerate(bundle.get("version_control", {}).get("commits", [])):
+        if commit.get("commit_hash") in deployed_commits:
+            distance = -1.0
+        else:
+            ts = parse_ts(commit.get("timestamp"))
+            distance = min((abs(ts - t) for t in deploy_times), default=math.inf) if ts is not None else math.inf
+        candidates.append(((TIER_COMMIT, distance, commit.get("timestamp", ""), i), "commits", i, commit))
+
+    for i, diff in enumerate(bundle.get("version_control", {}).get("diffs", [])):
+        candidates.append(((TIER_DIFF, 0, "", i), "diffs", i, diff))
+
+    candidates.sort(key=lambda c: c[0])
+    return candidates
+
+# ============================================================================
+# PACKING
+# ============================================================================
+
+def skeleton(bundle):
+    """Bundle with every rankable section emptied (always kept)."""
+    return {
+        "metadata": bundle.get("metadata", {}),
+        "version_control": {"commits": [], "diffs": []},
+        "deployments": {"events": []},
+        "logs": {"entries": []},
+        "metrics": {"aggregates": {}},
+        "integrity": bundle.get("integrity", {}),
+    }
+
+def describe_item(section, index, item):
+    """Short audit reference for a dropped item."""
+    if section == "logs":
+        return {"section": section, "index": index, "timestamp": item.get("timestamp"),
+                "severity": item.get("severity")}
+    if section == "commits":
+        return {"section": section, "index": index, "commit_hash": item.get("commit_hash")}
+    if section == "diffs":
+        return {"section": section, "index": index, "file_path": item.get("file_path")}
+    if section == "metrics":
+        return {"section": section, "metric": index}
+    return {"section": section, "index": index, "timestamp": item.get("timestamp")}
+
+def render(bundle):
+    return json.dumps(bundle, indent=2)
+
+# Items sit three levels deep in the rendered bundle (section/list/item)
+ITEM_INDENT = 6
+# An empty "[]" / "{}" grows by this much (newlines + closing indent, less
+# the trailing comma) when its first item is added
+FIRST_ITEM_OVERHEAD = 4
+
+def item_chars(section, index, item):
+    """Characters an item adds to the rendered bundle, including indentation."""
+    text = json.dumps(item, indent=2)
+    if section == "metrics":
+        text = f"{json.dumps(index)}: {text}"
+    return len(text) + ITEM_INDENT * (text.count("\n") + 1) + 2  # ",\n"
+
+def pack_bundle(bundle, budget_tokens=DEFAULT_BUDGET_TOKENS):
+    """
+    Pack bundle into budget_tokens.
+
+    Returns: (packed_bundle, packing_record)
+    """
+    packed = skeleton(bundle)
+    # Accounted in characters so per-item rounding cannot overshoot the budget
+    budget_chars = budget_tokens * CHARS_PER_TOKEN
+    used = len(render(packed))
+    candidates = rank_candidates(bundle)
+
+    kept = {"deployments": [], "logs": [], "metrics": [], "commits": [], "diffs": []}
+    dropped = {section: 0 for section in kept}
+    dropped_tiers = set()
+    dropped_items = []
+
+    for rank_key, section, index, item in candidates:
+        cost = item_chars(section, index, item)
+        if not kept[section]:
+            cost += FIRST_ITEM_OVERHEAD
+        if used + cost <= budget_chars:
+            kept[section].append((index, item))
+            used += cost
+        else:
+            dropped[section] += 1
+            dropped_tiers.add(rank_key[0])
+            if len(dropped_items) < MAX_DROPPED_LISTED:
+                dropped_items.append(describe_item(section, index, item))
+
+    # Restore original order within each section
+    for items in kept.values():
+        items.sort(key=lambda pair: pair[0])
+
+    packed["deployments"]["events"] = [item for _, item in kept["deployments"]]
+    packed["logs"]["entries"] = [item for _, item in kept["logs"]]
+    packed["metrics"]["aggregates"] = {name: item for name, item in kept["metrics"]}
+    packed["version_control"]["commits"] = [item for _, item in kept["commits"]]
+    packed["version_control"]["diffs"] = [item for _, item in kept["diffs"]]
+
+    tier_names = {
+        TIER_DEPLOYMENT: "deployment events",
+        TIER_ERROR_LOG: "ERROR log entries",
+        TIER_METRIC: "metric aggregates",
+        TIER_COMMIT: "commits",
+        TIER_WARN_LOG: "WARN log entries",
+        TIER_DIFF: "diff summaries",
+        TIER_OTHER_LOG: "low-severity log entries",
+    }
+
+    record = {
+        "budget_tokens": budget_tokens,
+        "estimated_tokens": {
+            "full_bundle": estimate_tokens(bundle),
+            "packed_bundle": estimate_tokens(render(packed)),
+        },
+        "truncated": any(dropped.values()),
+        "kept": {section: len(items) for section, items in kept.items()},
+        "dropped": dropped,
+        "dropped_categories": [tier_names[t] for t in sorted(dropped_tiers)],
+        "dropped_items": dropped_items,
+        "estimator": f"ceil(chars / {CHARS_PER_TOKEN}) of prompt JSON",
+    }
+    return packed, record
+
+def resolve_budget(scope_file=None, override=None):
+    if override is not None:
+        return override
+    if scope_file and os.path.exists(scope_file):
+        with open(scope_file, "r") as f:
+            scope = json.load(f)
+        budget = scope.get("prompt_budget", {}).get("max_tokens")
+        if budget:
+            return int(budget)
+    return DEFAULT_BUDGET_TOKENS
+
+def record_packing(scope_audit_file, record):
+    """Add the packing record to the scope audit (atomic replace)."""
+    with open(scope_audit_file, "r") as f:
+        scope_audit = json.load(f)
+    scope_audit["prompt_packing"] = record
+
+    with atomic_open(scope_audit_file) as f:
+        json.dump(scope_audit, f, indent=2)
+
+def main():
+    args = sys.argv[1:]
+    options = {"--scope": None, "--budget": None}
+    positional = []
+    i = 0
+    while i < len(args):
+        if args[i] in options and i + 1 < len(args):
+            options[args[i]] = args[i + 1]
+            i += 2
+        else:
+            positional.append(args[i])
+            i += 1
+
+    if len(positional) != 2:
+        print("Usage: pack-evidence.py <bundle_file> <scope_audit_file> [--scope FILE] [--budget N]",
+              file=sys.stderr)
+        sys.exit(1)
+
+    bundle_file, scope_audit_file = positional
+    try:
+        override = int(options["--budget"]) if options["--budget"] is not None else None
+    except ValueError:
+        print(f"❌ Invalid token budget: {options['--budget']}", file=sys.stderr)
+        sys.exit(1)
+
+    bundle = load_bundle(bundle_file)
+
+    budget = resolve_budget(options["--scope"], override)
+    packed, record = pack_bundle(bundle, budget)
+    record_packing(scope_audit_file, record)
+
+    if record["truncated"]:
+        dropped = ", ".join(f"{n} {s}" for s, n in record["dropped"].items() if n)
+        print(f"⚠️  Evidence packed to {budget} token budget: dropped {dropped}", file=sys.stderr)
+
+    print(render(packed))
+
+if __name__ == "__main__":
+    main()
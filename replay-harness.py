@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Load-Replay Harness for app.handle_request
+Replays captured traffic into the demo service and records memory-growth
+evidence in the evidence/metrics.json format.
+
+Input: JSON Lines, one request per line (default: requests.jsonl), streamed
+       so arbitrarily large captures replay in constant harness memory.
+       --amplify K replays every captured request K times.
+       --synthetic N appends N generated requests (or replaces the capture
+       when no traffic file exists).
+
+Output: parallel series, one point per sample interval:
+    {"timestamp": [...], "memory_mb": [...], "heap_mb": [...],
+     "error_rate_pct": [...], "throughput_rps": [...],
+     "latency_p50_ms": [...], "latency_p99_ms": [...]}
+
+memory_mb is process RSS; heap_mb is tracemalloc's traced Python heap.
+Sherlock aggregates every numeric series, so the output can be dropped in
+as evidence/metrics.json (pass --output explicitly; the default never
+overwrites the demo evidence).
+
+Usage:
+    replay-harness.py [traffic.jsonl] [--rate RPS] [--threads N] [--amplify K]
+                      [--synthetic N] [--duration S] [--sample-interval S]
+                      [--output PATH] [--no-tracemalloc]
+"""
+
+import json
+import os
+import queue
+import random
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from app import handle_request
+
+DEFAULT_TRAFFIC = "requests.jsonl"
+DEFAULT_OUTPUT = "reports/replay-metrics.json"
+
+OPTIONS = {
+    '--rate': float,             # Target requests/second overall (0 = unthrottled)
+    '--threads': int,
+    '--amplify': int,
+    '--synthetic': int,
+    '--duration': float,         # Stop after S seconds even if input remains
+    '--sample-interval': float,
+    '--output': str,
+}
+
+DEFAULTS = {
+    '--rate': 0.0,
+    '--threads': 4,
+    '--amplify': 1,
+    '--synthetic': 0,
+    '--duration': 0.0,
+    '--sample-interval': 1.0,
+    '--output': DEFAULT_OUTPUT,
+}
+
+# ============================================================================
+# TRAFFIC
+# ============================================================================
+
+def captured_requests(path):
+    """Stream requests from a JSON Lines file; malformed lines are skipped."""
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+def synthetic_requests(count, seed=0):
+    """Generated requests with varied payload sizes (reproducible via seed)."""
+    rng = random.Random(seed)
+    for i in range(count):
+        size = rng.choice((64, 256, 1024, 4096))
+        yield {
+            'request_id': f"synthetic-{i}",
+            'path': rng.choice(('/api/items', '/api/search', '/api/upload')),
+            'body': rng.randbytes(size // 2).hex(),
+        }
+
+def traffic(path, amplify, synthetic):
+    if path and os.path.exists(path):
+        for request in captured_requests(path):
+            for _ in range(amplify):
+                yield request
+    if synthetic:
+        yield from synthetic_requests(synthetic)
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def rss_bytes():
+    """Current resident set size (Linux /proc); peak RSS elsewhere."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+# Whole-run latencies are reservoir-sampled so the harness's own memory
+# stays flat and does not pollute the RSS series it is measuring
+RESERVOIR_SIZE = 100_000
+
+class Recorder:
+    """Thread-safe per-interval counters plus whole-run latency samples."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rng = random.Random(0)
+        self.interval_latencies = []
+        self.interval_errors = 0
+        self.all_latencies = []
+        self.total = 0
+        self.errors = 0
+        self.max_latency = 0.0
+
+    def record(self, latency, ok):
+        with self.lock:
+            self.interval_latencies.append(latency)
+            if len(self.all_latencies) < RESERVOIR_SIZE:
+                self.all_latencies.append(latency)
+            else:
+                slot = self.rng.randrange(self.total + 1)
+                if slot < RESERVOIR_SIZE:
+                    self.all_latencies[slot] = latency
+            self.total += 1
+            self.max_latency = max(self.max_latency, latency)
+            if not ok:
+                self.interval_errors += 1
+                self.errors += 1
+
+    def take_interval(self):
+        with self.lock:
+            latencies, errors = self.interval_latencies, self.interval_errors
+            self.interval_latencies, self.interval_errors = [], 0
+        return latencies, errors
+
+def take_sample(series, recorder, elapsed, trace_heap):
+    latencies, errors = recorder.take_interval()
+    latencies.sort()
+    count = len(latencies)
+
+    series['timestamp'].append(datetime.now().strftime("%H:%M:%S"))
+    series['memory_mb'].append(round(rss_bytes() / (1024 * 1024), 1))
+    if trace_heap:
+        series['heap_mb'].append(round(tracemalloc.get_traced_memory()[0] / (1024 * 1024), 2))
+    series['error_rate_pct'].append(round(100 * errors / count, 2) if count else 0.0)
+    series['throughput_rps'].append(round(count / elapsed, 1) if elapsed > 0 else 0.0)
+    series['latency_p50_ms'].append(round(percentile(latencies, 50) * 1000, 3))
+    series['latency_p99_ms'].append(round(percentile(latencies, 99) * 1000, 3))
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+def worker(work, recorder, start, rate):
+    while True:
+        item = work.get()
+        if item is None:
+            return
+        index, request = item
+
+        # Open-loop pacing: request i is due at start + i / rate
+        if rate:
+            delay = start + index / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        began = time.perf_counter()
+        try:
+            response = handle_request(request)
+            ok = isinstance(response, dict) and response.get('status') == 'ok'
+        except Exception:
+            ok = False
+        recorder.record(time.perf_counter() - began, ok)
+
+def replay(requests, rate=0.0, threads=4, duration=0.0, sample_interval=1.0, trace_heap=True):
+    """
+    Replay requests into handle_request and sample evidence series.
+
+    Returns: (series, summary)
+    """
+    series = {key: [] for key in ('timestamp', 'memory_mb', 'heap_mb', 'error_rate_pct',
+                                  'throughput_rps', 'latency_p50_ms', 'latency_p99_ms')}
+    if not trace_heap:
+        del series['heap_mb']
+    elif not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+    recorder = Recorder()
+    work = queue.Queue(maxsize=threads * 64)
+    start = time.perf_counter()
+
+    pool = [threading.Thread(target=worker, args=(work, recorder, start, rate), daemon=True)
+            for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+
+    stop_sampling = threading.Event()
+
+    def sampler():
+        last = time.perf_counter()
+        take_sample(series, recorder, 0, trace_heap)  # Baseline point
+        while not stop_sampling.wait(sample_interval):
+            now = time.perf_counter()
+            take_sample(series, recorder, now - last, trace_heap)
+            last = now
+        now = time.perf_counter()
+        take_sample(series, recorder, now - last, trace_heap)
+
+    sampling = threading.Thread(target=sampler, daemon=True)
+    sampling.start()
+
+    submitted = 0
+    for request in requests:
+        if duration and time.perf_counter() - start >= duration:
+            break
+        work.put((submitted, request))
+        submitted += 1
+
+    for _ in pool:
+        work.put(None)
+    for thread in pool:
+        thread.join()
+
+    elapsed = time.perf_counter() - start
+    stop_sampling.set()
+    sampling.join()
+
+    latencies = sorted(recorder.all_latencies)
+    summary = {
+        'requests': recorder.total,
+        'errors': recorder.errors,
+        'elapsed_seconds': round(elapsed, 3),
+        'throughput_rps': round(recorder.total / elapsed, 1) if elapsed > 0 else 0.0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50) * 1000, 3),
+            'p90': round(percentile(latencies, 90) * 1000, 3),
+            'p99': round(percentile(latencies, 99) * 1000, 3),
+            'max': round(recorder.max_latency * 1000, 3),
+        },
+        'memory_mb': {'start': series['memory_mb'][0], 'end': series['memory_mb'][-1]},
+    }
+    if trace_heap:
+        summary['heap_mb'] = {'start': series['heap_mb'][0], 'end': series['heap_mb'][-1]}
+
+    return series, summary
+
+# ============================================================================
+# CLI
+# ============================================================================
+
+def parse_args(argv):
+    options = dict(DEFAULTS)
+    options['trace_heap'] = True
+    traffic_file = DEFAULT_TRAFFIC
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == '--no-tracemalloc':
+            options['trace_heap'] = False
+            i += 1
+        elif arg in OPTIONS and i + 1 < len(argv):
+            try:
+                options[arg] = OPTIONS[arg](argv[i + 1])
+            except ValueError:
+                raise SystemExit(f"❌ Invalid value for {arg}: {argv[i + 1]}")
+            i += 2
+        elif arg.startswith('--'):
+            raise SystemExit(f"❌ Unknown option: {arg}")
+        else:
+            traffic_file = arg
+            i += 1
+
+    return traffic_file, options
+
+def main():
+    if '-h' in sys.argv or '--help' in sys.argv:
+        print(__doc__.strip())
+        return
+
+    traffic_file, options = parse_args(sys.argv[1:])
+
+    if not os.path.exists(traffic_file) and not options['--synthetic']:
+        raise SystemExit(f"❌ Traffic file not found: {traffic_file} (use --synthetic N to generate load)")
+
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print("Load Replay: app.handle_request")
+    print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
+    print(f"Traffic: {traffic_file if os.path.exists(traffic_file) else '(none)'}"
+          f" x{options['--amplify']} + {options['--synthetic']} synthetic")
+    print(f"Rate: {options['--rate'] or 'unthrottled'} rps | Threads: {options['--threads']}")
+    print()
+
+    series, summary = replay(
+        traffic(traffic_file, options['--amplify'], options['--synthetic']),
+        rate=options['--rate'],
+        threads=options['--threads'],
+        duration=options['--duration'],
+        sample_interval=options['--sample-interval'],
+        trace_heap=options['trace_heap'],
+    )
+
+    output = Path(options['--output'])
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(series, f, indent=2)
+
+    latency = summary['latency_ms']
+    print(f"✓ Replayed {summary['requests']} request(s) in {summary['elapsed_seconds']}s"
+          f" ({summary['throughput_rps']} rps, {summary['errors']} error(s))")
+    print(f"  Latency: p50 {latency['p50']}ms | p90 {latency['p90']}ms | p99 {latency['p99']}ms | max {latency['max']}ms")
+    print(f"  RSS: {summary['memory_mb']['start']} MB -> {summary['memory_mb']['end']} MB")
+    if 'heap_mb' in summary:
+        print(f"  Python heap: {summary['heap_mb']['start']} MB -> {summary['heap_mb']['end']} MB")
+    print()
+    print(f"✓ Metrics series written: {output} ({len(series['timestamp'])} samples)")
+
+if __name__ == '__main__':
+    main()
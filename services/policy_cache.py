@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Service Policy Cache
+Compiles services/<name>.yaml ownership records once into a validated,
+fast-loading JSON cache and checks review records against them.
+
+Cache: services/.policy-cache.json
+  - One entry per policy file, keyed by service name
+  - Entry is reused while the file's mtime and size are unchanged
+  - Stale or new files are re-parsed with yaml.safe_load and re-validated
+  - Fresh entries load without PyYAML (plain JSON)
+
+Checks return violation lists instead of exiting, so a compliance sweep
+reports every problem across every review record in one run:
+
+    {"rule": "forbidden_role", "severity": "error", "message": "..."}
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "incidents"))
+from batch import read_cache, write_cache  # noqa: E402
+
+SERVICES_DIR = Path("services")
+CACHE_FILE = SERVICES_DIR / ".policy-cache.json"
+CACHE_VERSION = 1
+
+class PolicyError(Exception):
+    """Raised when a service policy cannot be loaded or compiled."""
+
+# ============================================================================
+# COMPILATION
+# ============================================================================
+
+def validate_policy(service_name, policy):
+    """
+    Validate the parts of an ownership record that enforcement relies on.
+
+    Returns: list of error strings (empty if valid)
+    """
+    if not isinstance(policy, dict):
+        return ["Policy is not a mapping"]
+
+    errors = []
+
+    if policy.get('service') != service_name:
+        errors.append(f"'service' field ({policy.get('service')}) does not match file name ({service_name})")
+
+    review_policy = policy.get('review_policy')
+    if not isinstance(review_policy, dict):
+        errors.append("Missing 'review_policy' section")
+    else:
+        for key in ('allowed_roles', 'forbidden_roles'):
+            if not isinstance(review_policy.get(key, []), list):
+                errors.append(f"review_policy.{key} must be a list")
+        if not review_policy.get('allowed_roles'):
+            errors.append("review_policy.allowed_roles is empty (no one could review)")
+
+    constraints = policy.get('decision_constraints', {})
+    if not isinstance(constraints, dict):
+        errors.append("decision_constraints must be a mapping")
+    else:
+        for key in ('max_confidence_without_override', 'max_confidence_without_evidence_explanation'):
+            if key in constraints and not isinstance(constraints[key], (int, float)):
+                errors.append(f"decision_constraints.{key} must be a number")
+
+    return errors
+
+def compile_policy(policy_file):
+    """Parse and validate one policy file into a cache entry."""
+    if not YAML_AVAILABLE:
+        raise PolicyError("PyYAML not installed - cannot compile service policies")
+
+    policy_file = Path(policy_file)
+    service_name = policy_file.stem
+    stat = policy_file.stat()
+
+    try:
+        with open(policy_file, 'r') as f:
+            policy = yaml.safe_load(f)
+        errors = validate_policy(service_name, policy)
+    except Exception as e:
+        policy = None
+        errors = [f"Failed to parse: {e}"]
+
+    return {
+        'file': str(policy_file),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'policy': policy,
+        'errors': errors,
+    }
+
+def _entry_is_fresh(entry, policy_file):
+    try:
+        stat = policy_file.stat()
+    except FileNotFoundError:
+        return False
+    return entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size
+
+def load_policies(services_dir=SERVICES_DIR, cache_file=None):
+    """
+    Load all compiled service policies, recompiling only changed files.
+
+    Returns: {service_name: cache entry} where entry has 'policy' and 'errors'
+    """
+    services_dir = Path(services_dir)
+    cache_file = Path(cache_file) if cache_file else services_dir / CACHE_FILE.name
+
+    cached = read_cache(cache_file, CACHE_VERSION, 'policies')
+    entries = {}
+    dirty = False
+
+    for policy_file in sorted(services_dir.glob("*.yaml")):
+        name = policy_file.stem
+        entry = cached.get(name)
+        if entry is None or not _entry_is_fresh(entry, policy_file):
+            entry = compile_policy(policy_file)
+            dirty = True
+        entries[name] = entry
+
+    # Policies removed from disk drop out of the cache
+    if dirty or set(cached) != set(entries):
+        write_cache(cache_file, CACHE_VERSION, 'policies', entries, default=str)
+
+    return entries
+
+def load_policy(service_name, services_dir=SERVICES_DIR, cache_file=None):
+    """
+    Load one compiled service policy via the cache.
+
+    Raises: PolicyError if the service has no ownership record or it is invalid
+    """
+    entry = load_policies(services_dir, cache_file).get(service_name)
+    if entry is None:
+        raise PolicyError(f"Service '{service_name}' has no ownership record")
+    if entry['errors']:
+        raise PolicyError(f"Invalid policy for '{service_name}': {'; '.join(entry['errors'])}")
+    return entry['policy']
+
+# ============================================================================
+# CHECKS (return violations, never exit)
+# ============================================================================
+
+def violation(rule, message, severity='error'):
+    return {'rule': rule, 'severity': severity, 'message': message}
+
+def check_reviewer_authority(policy, reviewer_role):
+    """Check reviewer role against review_policy."""
+    review_policy = policy.get('review_policy', {})
+    allowed_roles = review_policy.get('allowed_roles', [])
+    forbidden_roles = review_policy.get('forbidden_roles', [])
+
+    # Forbidden takes precedence over allowed
+    if reviewer_role in forbidden_roles:
+        return [violation('forbidden_role', f"Role '{reviewer_role}' is explicitly forbidden")]
+    if reviewer_role not in allowed_roles:
+        return [violation('role_not_allowed', f"Role '{reviewer_role}' not authorized (allowed: {', '.join(allowed_roles)})")]
+    return []
+
+def check_decision_constraints(policy, decision_data):
+    """Check decision details against decision_constraints."""
+    constraints = policy.get('decision_constraints', {})
+    violations = []
+
+    decision_type = decision_data.get('decision', 'UNKNOWN')
+    final_confidence = decision_data.get('final_confidence', 0)
+    evidence_quality = decision_data.get('evidence_quality', 'UNKNOWN')
+    has_override = decision_data.get('has_override', False)
+    has_evidence_explanation = decision_data.get('has_evidence_explanation', False)
+
+    reject_threshold = constraints.get('reject_if_evidence_quality', None)
+    if reject_threshold and evidence_quality == reject_threshold and decision_type != 'REJECTED':
+        violations.append(violation(
+            'evidence_quality_requires_reject',
+            f"Evidence quality {evidence_quality} requires REJECTED (got {decision_type})"))
+
+    max_without_override = constraints.get('max_confidence_without_override', 100)
+    if final_confidence > max_without_override and not has_override:
+        violations.append(violation(
+            'confidence_without_override',
+            f"Final confidence {final_confidence}% exceeds {max_without_override}% without override"))
+
+    max_without_explanation = constraints.get('max_confidence_without_evidence_explanation', 100)
+    if final_confidence > max_without_explanation and not has_evidence_explanation:
+        violations.append(violation(
+            'confidence_without_explanation',
+            f"Final confidence {final_confidence}% > {max_without_explanation}% requires evidence explanation",
+            severity='warning'))
+
+    if constraints.get('require_remediation_for_modified', False) and decision_type == 'MODIFIED':
+        if not decision_data.get('remediation_promises'):
+            violations.append(violation(
+                'remediation_required',
+                "MODIFIED decisions must include remediation actions"))
+
+    return violations
+
+# ============================================================================
+# REVIEW RECORDS
+# ============================================================================
+
+def _to_int(value, default=0):
+    try:
+        return int(str(value).split('#')[0].strip())
+    except (TypeError, ValueError):
+        return default
+
+def decision_data_from_review_record(record, ikr=None):
+    """
+    Flatten a Phase 4 review record (and optional IKR) into decision data.
+
+    Flat decision-data documents (no `human_decision` section) are
+    returned unchanged.
+    """
+    if not isinstance(record, dict) or 'human_decision' not in record:
+        return record or {}
+
+    human_decision = record.get('human_decision') or {}
+    overrides = record.get('overrides') or []
+    notes = record.get('notes') or []
+
+    remediation = []
+    if isinstance(ikr, dict):
+        remediation = ikr.get('remediation_promises') or (ikr.get('remediation') or {}).get('promised') or []
+
+    return {
+        'decision': human_decision.get('decision', 'UNKNOWN'),
+        'final_confidence': _to_int(human_decision.get('final_confidence')),
+        'evidence_quality': record.get('evidence_quality', 'UNKNOWN'),
+        'has_override': bool(overrides),
+        'has_evidence_explanation': bool(overrides) or bool(notes),
+        'remediation_promises': remediation,
+    }
+
+def _load_yaml(path):
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+def resolve_record_service(record_path, record, ikr, known_services):
+    """
+    Determine which service a review record belongs to.
+
+    Order: multi-service filename suffix, IKR `service`, scope audit service.
+    """
+    incident_id = str(record.get('incident_id', ''))
+    stem = Path(record_path).stem
+    prefix = f"review-record-{incident_id}-"
+    if incident_id and stem.startswith(prefix) and stem[len(prefix):] in known_services:
+        return stem[len(prefix):]
+
+    if isinstance(ikr, dict) and ikr.get('service'):
+        return ikr['service']
+
+    scope_audit = (record.get('artifacts') or {}).get('scope_audit')
+    if scope_audit and os.path.exists(scope_audit):
+        try:
+            with open(scope_audit, 'r') as f:
+                return json.load(f)['scope_summary']['service']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    return None
+
+def check_review_records(record_paths, policies=None, service_override=None, incidents_dir="incidents"):
+    """
+    Batch compliance check of review records against service policies.
+
+    Returns: list of result dicts, one per record:
+        {"record", "incident_id", "service", "reviewer_role", "violations"}
+    """
+    if policies is None:
+        policies = load_policies()
+
+    results = []
+    for record_path in record_paths:
+        result = {
+            'record': str(record_path),
+            'incident_id': None,
+            'service': None,
+            'reviewer_role': None,
+            'violations': [],
+        }
+        results.append(result)
+
+        try:
+            record = _load_yaml(record_path) or {}
+        except Exception as e:
+            result['violations'].append(violation('record_unreadable', f"Failed to parse review record: {e}"))
+            continue
+        if not isinstance(record, dict):
+            result['violations'].append(violation(
+                'record_unreadable', f"Review record is not a mapping (got {type(record).__name__})"))
+            continue
+
+        incident_id = record.get('incident_id')
+        result['incident_id'] = incident_id
+
+        ikr = None
+        ikr_path = Path(incidents_dir) / f"{incident_id}.yaml"
+        if ikr_path.exists():
+            try:
+                ikr = _load_yaml(ikr_path)
+            except Exception:
+                ikr = None
+
+        service = service_override or resolve_record_service(record_path, record, ikr, policies)
+        result['service'] = service
+
+        entry = policies.get(service) if service else None
+        if entry is None:
+            result['violations'].append(violation('no_ownership_record', f"Service '{service}' has no ownership record"))
+            continue
+        if entry['errors']:
+            result['violations'].append(violation('policy_invalid', '; '.join(entry['errors'])))
+            continue
+
+        reviewer_role = (record.get('reviewer') or {}).get('role')
+        result['reviewer_role'] = reviewer_role
+
+        policy = entry['policy']
+        result['violations'].extend(check_reviewer_authority(policy, reviewer_role))
+        result['violations'].extend(
+            check_decision_constraints(policy, decision_data_from_review_record(record, ikr)))
+
+    return results
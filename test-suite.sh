@@ -227,6 +227,34 @@ else
     test_fail "Phase 6 not implemented"
 fi
 
+# Test 6.4 — A POST the target read but never answered is not re-sent
+if python3 - <<'EOF'
+import asyncio, sys
+sys.path.insert(0, "adapters/operational-integration")
+from dispatch import ENGINE_DEFAULTS, ConnectionPool, RateLimiter, StandInServer, deliver
+
+async def close_after_read():
+    server = StandInServer(drop_first=1)
+    url = await server.start()
+    pool = ConnectionPool()
+    policy = dict(ENGINE_DEFAULTS, timeout_seconds=2, backoff_base_seconds=0)
+    job = {'target': 'jira', 'summary': 'regression', 'url': url, 'headers': {}, 'body': {}}
+    try:
+        result = await deliver(pool, RateLimiter(), job, policy)
+    finally:
+        await pool.close()
+        await server.stop()
+    return result, len(server.requests)
+
+result, received = asyncio.run(close_after_read())
+sys.exit(0 if received == 1 and result['retryable'] is False and not result['ok'] else 1)
+EOF
+then
+    test_pass "Unanswered POST delivered once (outcome unknown, not retried)"
+else
+    test_fail "Unanswered POST was re-sent"
+fi
+
 echo
 
 # ==============================================================================